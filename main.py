@@ -5,7 +5,7 @@ from src.pages import (kurzschlusskraefte_leiterseile_docu_page, kurzschlusskrae
 from src.utils import third_party_integration as third_party
 
 # Importiere das komplette Modul, damit Taipy die Variablen findet
-from src.pages.kurzschlusskraefte import content_vorlage
+from src.pages.kurzschlusskraefte import content_vorlage, on_change_eingabe
 
 with tgb.Page() as home_page:
     tgb.text(value="# Willkommen bei UWClac", mode="md")
@@ -21,6 +21,8 @@ pages = {
 
 if __name__ == "__main__":
     gui = Gui(pages=pages, css_file="src/css/main.css")
+    # Live-Berechnung der Kurzschlusskräfte bei Änderungen der Eingaben
+    gui.on_change = on_change_eingabe
     gui.register_content_provider(third_party.MaTex, third_party.render_matex)
     gui.run(initial_page="Willkommen", #use_reloader=True,
             title="Kurzschlussfestigkeit", favicon="src/assets/Icon.jpg", watermark="© Angelo Rusvai",margin="2em",
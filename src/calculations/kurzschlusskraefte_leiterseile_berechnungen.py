@@ -4,7 +4,7 @@ import sympy
 from scipy.optimize import fsolve, brentq
 from numpy.ma.core import arccos
 import numpy as np
-from functools import lru_cache
+from src.calculations.memoisierung import memoisieren
 
 
 # Konstanten
@@ -14,7 +14,7 @@ g = scipy.constants.g # 9.81 ist auch möglich
 
 
 # Hilfsgleichung l_s Abstände Abstandshalter
-@lru_cache(maxsize=5)
+@memoisieren(maxsize=64)
 def l_s(l_s_1: float|None = None, l_s_2: float|None = None, l_s_3: float|None = None, l_s_4: float|None = None,
         l_s_5: float|None = None, l_s_6: float|None = None, l_s_7: float|None = None, l_s_8: float|None = None,
         l_s_9: float|None = None, l_s_10: float|None = None) -> float:
@@ -43,7 +43,7 @@ def l_s(l_s_1: float|None = None, l_s_2: float|None = None, l_s_3: float|None =
     return l_s
 
 # Hilfsgleichungen m_c Masse konzentrischer Massen
-@lru_cache(maxsize=5)
+@memoisieren(maxsize=64)
 def m_c(m_c: float|None , n: float, l_c: float) -> float:
     if m_c not in (None, 0.0, 0):
         m_c: float = m_c / (n * l_c)
@@ -51,7 +51,7 @@ def m_c(m_c: float|None , n: float, l_c: float) -> float:
     return 0.0
 
 # Hilfsgleichungen l_v Seilbogen Länge der Schlaufe
-@lru_cache(maxsize=5)
+@memoisieren(maxsize=64)
 def l_v(h: float, w:float) -> float:
     """
     Funktion zur Berechnung der Seil(bogen)länge der Schlaufe l_v in m
@@ -65,7 +65,7 @@ def l_v(h: float, w:float) -> float:
     return l_v
 
 # Grössen ab Kapitel 6.2.2
-@lru_cache(maxsize=5)
+@memoisieren(maxsize=64)
 def l_c(l: float, l_i: float) -> float:
     """
     Funktion zur Berechnung der Seillänge lc eines Hauptleiters im Spannfeld in m nach SN EN 60865-1:2012 Kapitel 6.2.2
@@ -86,7 +86,7 @@ def l_c(l: float, l_i: float) -> float:
         return l_c
 
 # Hilfsgleichungen l_eff bei aufgelegten Seilen
-@lru_cache(maxsize=5)
+@memoisieren(maxsize=64)
 def l_eff(l: float, l_h_f: float) -> float:
     """
     Funktion zur Berechnung der Seillänge l_eff eines Hauptleiters im Spannfeld in m nach SN EN 60865-2:2017 Kapitel 8.3.1
@@ -105,7 +105,7 @@ def l_eff(l: float, l_h_f: float) -> float:
         return l_eff
 
 # Gleichung (20)
-@lru_cache(maxsize=5)
+@memoisieren(maxsize=64)
 def r(F_: float, n: float, m_s: float, g: float) -> float:
     """
     Funktion zur Berechnung Verhältnisses r der elektromagnetischen Kraft auf ein Leiterseil bei Kurzschluss zur
@@ -120,7 +120,7 @@ def r(F_: float, n: float, m_s: float, g: float) -> float:
     return r
 
 # Gleichung (21)
-@lru_cache(maxsize=5)
+@memoisieren(maxsize=64)
 def δ_1(r: float) -> float:
     """
     Funktion zur Berechnung der Richtung δ1 der resultierenden Kraft in ° nach SN EN 60865-1:2012 Kapitel 6.2.2
@@ -305,6 +305,44 @@ def φ_ohne_schlaufe(T_k1: float, T_res: float, r: float, δ_end: float) -> floa
         φ: float = φ_2
         return φ
 
+# Exakte Lösungsstufe für die kubischen Gleichungen (33), (42) und (A.9)
+@memoisieren(maxsize=1)
+def kubische_wurzeln_exakt():
+    """
+    Funktion zur Bereitstellung der exakten Wurzeln der normierten kubischen Gleichung x³ + B * x² + C * x + D = 0
+    Die Wurzeln werden einmalig pro Prozess mit SymPy bestimmt und mit lambdify übersetzt. Die übersetzte Funktion
+    nimmt komplexe Koeffizienten (B, C, D) entgegen und gibt die drei komplexen Wurzeln zurück.
+    """
+    x, B, C, D = sympy.symbols('x B C D')
+    wurzeln = sympy.solve((x**3) + (B * x**2) + (C * x) + D, x)
+    return sympy.lambdify((B, C, D), wurzeln, modules="cmath")
+
+def reelle_wurzeln_exakt(B: float, C: float, D: float, untere_grenze: float, obere_grenze: float,
+                         toleranz: float = 1e-7) -> list[float]:
+    """
+    Funktion zur Auswertung der exakten Wurzeln der normierten kubischen Gleichung x³ + B * x² + C * x + D = 0
+    Gibt die reellen Wurzeln im Intervall [untere_grenze, obere_grenze] (mit Toleranz) aufsteigend sortiert zurück.
+    Hinweis: Wirft ZeroDivisionError, wenn die geschlossene Lösung entartet ist (z.B. B = C = 0).
+    """
+    wurzeln = kubische_wurzeln_exakt()(complex(B), complex(C), complex(D))
+    return sorted(w.real for w in wurzeln
+                  if abs(w.imag) <= 1e-9 * max(1.0, abs(w.real))
+                  and untere_grenze - toleranz <= w.real <= obere_grenze + toleranz)
+
+def gegenpruefung_exakt(lösungen_exakt: list[float], lösung_numerisch: float | None,
+                        rtol: float = 1e-9) -> float | None:
+    """
+    Funktion zur Gegenprüfung der exakten Lösungsstufe mit der numerischen Lösungsstufe
+    Gibt die exakte Lösung zurück, wenn sie mit der numerischen Lösung übereinstimmt, sonst die numerische Lösung.
+    """
+    if lösung_numerisch is None:
+        return lösungen_exakt[0] if lösungen_exakt else None
+    for lösung in lösungen_exakt:
+        if abs(lösung - lösung_numerisch) <= rtol * max(1.0, abs(lösung_numerisch)):
+            return lösung
+    return lösung_numerisch
+
+@memoisieren(maxsize=4096)
 def ψ_ohne_schlaufe_symbolisch(φ: float, ζ: float) -> float:
     """
     Funktion zur Berechnung des Faktors ψ zur Berechnung Faktoren für die Berechnung der Zugkraft in Leiterseilen
@@ -315,26 +353,23 @@ def ψ_ohne_schlaufe_symbolisch(φ: float, ζ: float) -> float:
     Hinweis: Es werden nur reale Zahlen und Zahlen zwischen 0 und 1 eingegeben.
     """
     """
-    Berechnung ψ (SN EN 60865-1:2012) im Mehrstufenverfahren:
-    1. Symbolische Methode (Exakte Lösung) 
-    2. Brent's Methode (Garantierte Intervallsuche)
-    3. fsolve (Allgemeiner numerischer Ansatz)
+    Berechnung ψ (SN EN 60865-1:2012) in der exakten Lösungsstufe:
+    1. Vorkompilierte exakte Lösung (kubische_wurzeln_exakt)
+    2. Gegenprüfung mit der numerischen Lösungsstufe (ψ_ohne_schlaufe_analytisch)
     """
-    #1. Symbolische Methode (Exakte Lösung)
+    ψ_num = ψ_ohne_schlaufe_analytisch(φ=φ, ζ=ζ)
+
+    # 1. Exakte Lösung der auf φ² normierten Gleichung
     try:
-        ψ_sym = sympy.symbols('ψ', real=True)
-        polynom_sym = (ψ_sym**3 * φ**2) + ((φ * (2 + ζ)) * (ψ_sym**2)) + (ψ_sym * (1 + (2 * ζ))) - (ζ * (2 + φ))
-        solutions = sympy.solve(polynom_sym, ψ_sym)
+        valid_sols = reelle_wurzeln_exakt(B=(2 + ζ) / φ, C=(1 + (2 * ζ)) / φ**2, D=-ζ * (2 + φ) / φ**2,
+                                          untere_grenze=0, obere_grenze=1, toleranz=0)
+    except (ZeroDivisionError, OverflowError, ValueError):
+        return ψ_num
 
-        valid_sols = [float(s) for s in solutions if 0 <= s <= 1]
-        if valid_sols:
-            return valid_sols[0]
-    except:
-        raise
-    finally:
-        return ψ_ohne_schlaufe_numerisch(φ=φ, ζ=ζ)
-    return None
+    # 2. Gegenprüfung
+    return gegenpruefung_exakt(valid_sols, ψ_num)
 
+@memoisieren(maxsize=4096)
 def ψ_ohne_schlaufe_numerisch(φ: float, ζ: float) -> float:
     """
     Funktion zur Berechnung des Faktors ψ zur Berechnung Faktoren für die Berechnung der Zugkraft in Leiterseilen
@@ -419,6 +454,67 @@ def ψ_ohne_schlaufe_backup(φ: float, ζ: float) -> float:
     return None
 
 
+def ψ_analytisch(φ: float, ζ: float) -> float | None:
+    """
+    Funktion zur Berechnung des Faktors ψ zur Berechnung Faktoren für die Berechnung der Zugkraft in Leiterseilen
+    (dimensionslos) nach SN EN 60865-1:2012 Kapitel 6.2.3 mit der geschlossenen Lösung der kubischen Gleichung
+    ψ: Faktoren für die Berechnung der Zugkraft in Leiterseilen (dimensionslos)
+    φ: Faktoren für die Berechnung der Zugkraft in Leiterseilen (dimensionslos)
+    ζ: Beanspruchungsfaktor des Hauptleiters in Seilanordnungen (dimensionslos)
+    Hinweis: Für φ >= 0 und ζ >= 0 ist f(0) <= 0, f(1) > 0 und f für ψ >= 0 monoton steigend und konvex. Die gesuchte
+    Lösung ist damit die grösste reelle Wurzel. Gibt None zurück, wenn die Lösung nicht im Intervall [0, 1] liegt
+    (entarteter Fall), die Aufrufer fallen dann auf das numerische Verfahren zurück.
+    """
+    if not (math.isfinite(φ) and math.isfinite(ζ)) or φ < 0 or ζ < 0:
+        return None
+
+    a = φ**2
+    b = φ * (2 + ζ)
+    c = 1 + (2 * ζ)
+    d = -ζ * (2 + φ)
+
+    if φ < 1e-2:
+        # Für kleine φ ist die Normierung auf a schlecht konditioniert, Startwert ist die Lösung des linearen Anteils
+        ψ = -d / c
+    else:
+        # Reduktion auf t³ + p * t + q = 0 mit ψ = t - B / 3
+        B, C, D = b / a, c / a, d / a
+        p = C - (B**2 / 3)
+        q = (2 * B**3 / 27) - (B * C / 3) + D
+        Δ = (q / 2)**2 + (p / 3)**3
+        if Δ > 0:
+            # Eine reelle Wurzel (Cardano)
+            t = math.cbrt((-q / 2) + math.sqrt(Δ)) + math.cbrt((-q / 2) - math.sqrt(Δ))
+        else:
+            # Drei reelle Wurzeln, grösste Wurzel (trigonometrische Lösung)
+            m = 2 * math.sqrt(-p / 3)
+            t = m * math.cos(math.acos(max(-1.0, min(1.0, (3 * q) / (p * m)))) / 3)
+        ψ = t - (B / 3)
+
+    # Nachiteration mit dem Newton-Verfahren (Rundungsfehler der geschlossenen Lösung)
+    for _ in range(2):
+        df = (3 * a * ψ**2) + (2 * b * ψ) + c
+        ψ = ψ - ((((a * ψ + b) * ψ + c) * ψ + d) / df)
+
+    if not (math.isfinite(ψ) and 0 <= ψ <= 1):
+        return None
+    return ψ
+
+@memoisieren(maxsize=4096)
+def ψ_ohne_schlaufe_analytisch(φ: float, ζ: float) -> float:
+    """
+    Funktion zur Berechnung des Faktors ψ zur Berechnung Faktoren für die Berechnung der Zugkraft in Leiterseilen
+    (dimensionslos) nach SN EN 60865-1:2012 Kapitel 6.2.3
+    ψ: Faktoren für die Berechnung der Zugkraft in Leiterseilen (dimensionslos)
+    φ: Faktoren für die Berechnung der Zugkraft in Leiterseilen (dimensionslos)
+    ζ: Beanspruchungsfaktor des Hauptleiters in Seilanordnungen (dimensionslos)
+    Hinweis: Geschlossene Lösung, im entarteten Fall Rückfall auf ψ_ohne_schlaufe_numerisch.
+    """
+    ψ = ψ_analytisch(φ=φ, ζ=ζ)
+    if ψ is None:
+        return ψ_ohne_schlaufe_numerisch(φ=φ, ζ=ζ)
+    return ψ
+
 # Grössen ab Kapitel 6.2.4
 # Gleichung (34)
 def ε_ela(N: float, F_td: float, F_st) -> float:
@@ -573,6 +669,7 @@ def φ_mit_schlaufe(T_k1: float, T_kres: float, r: float, δ_end: float, δ:floa
             φ: float = φ_4
             return φ
 
+@memoisieren(maxsize=4096)
 def ψ_mit_schlaufe_symbolisch(φ: float, ζ: float) -> float:
     """
     Funktion zur Berechnung des Faktors ψ zur Berechnung Faktoren für die Berechnung der Zugkraft in Leiterseilen
@@ -583,26 +680,23 @@ def ψ_mit_schlaufe_symbolisch(φ: float, ζ: float) -> float:
     Hinweis: Es werden nur reale Zahlen und Zahlen zwischen 0 und 1 eingegeben.
     """
     """
-       Berechnung ψ (SN EN 60865-1:2012) im Mehrstufenverfahren:
-       1. Symbolische Methode (Exakte Lösung) 
-       2. Brent's Methode (Garantierte Intervallsuche)
-       3. fsolve (Allgemeiner numerischer Ansatz)
-       """
-    # 1. Symbolische Methode (Exakte Lösung)
+    Berechnung ψ (SN EN 60865-1:2012) in der exakten Lösungsstufe:
+    1. Vorkompilierte exakte Lösung (kubische_wurzeln_exakt)
+    2. Gegenprüfung mit der numerischen Lösungsstufe (ψ_mit_schlaufe_analytisch)
+    """
+    ψ_num = ψ_mit_schlaufe_analytisch(φ=φ, ζ=ζ)
+
+    # 1. Exakte Lösung der auf φ² normierten Gleichung
     try:
-        ψ_sym = sympy.symbols('ψ', real=True)
-        polynom_sym = (ψ_sym**3 * φ**2) + ((φ * (2 + ζ)) * (ψ_sym**2)) + (ψ_sym * (1 + (2 * ζ))) - (ζ * (2 + φ))
-        solutions = sympy.solve(polynom_sym, ψ_sym)
+        valid_sols = reelle_wurzeln_exakt(B=(2 + ζ) / φ, C=(1 + (2 * ζ)) / φ**2, D=-ζ * (2 + φ) / φ**2,
+                                          untere_grenze=0, obere_grenze=1, toleranz=0)
+    except (ZeroDivisionError, OverflowError, ValueError):
+        return ψ_num
 
-        valid_sols = [float(s) for s in solutions if 0 <= s <= 1]
-        if valid_sols:
-            return valid_sols[0]
-    except:
-        pass  # Fallen zurück auf numerisch
-    finally:
-        return ψ_mit_schlaufe_numerisch(φ=φ, ζ=ζ)
-    return None
+    # 2. Gegenprüfung
+    return gegenpruefung_exakt(valid_sols, ψ_num)
 
+@memoisieren(maxsize=4096)
 def ψ_mit_schlaufe_numerisch(φ: float, ζ: float) -> float:
     """
     Funktion zur Berechnung des Faktors ψ zur Berechnung Faktoren für die Berechnung der Zugkraft in Leiterseilen
@@ -687,6 +781,21 @@ def ψ_mit_schlaufe_backup(φ: float, ζ: float) -> float:
             continue
     return None
 
+@memoisieren(maxsize=4096)
+def ψ_mit_schlaufe_analytisch(φ: float, ζ: float) -> float:
+    """
+    Funktion zur Berechnung des Faktors ψ zur Berechnung Faktoren für die Berechnung der Zugkraft in Leiterseilen
+    (dimensionslos) nach SN EN 60865-1:2012 Kapitel 6.2.3
+    ψ: Faktoren für die Berechnung der Zugkraft in Leiterseilen (dimensionslos)
+    φ: Faktoren für die Berechnung der Zugkraft in Leiterseilen (dimensionslos)
+    ζ: Beanspruchungsfaktor des Hauptleiters in Seilanordnungen (dimensionslos)
+    Hinweis: Geschlossene Lösung, im entarteten Fall Rückfall auf ψ_mit_schlaufe_numerisch.
+    """
+    ψ = ψ_analytisch(φ=φ, ζ=ζ)
+    if ψ is None:
+        return ψ_mit_schlaufe_numerisch(φ=φ, ζ=ζ)
+    return ψ
+
 
 # Grössen ab Kapitel 6.2.7 (Horizontale Seilauslenkung und minimaler Leiterabstand)
 # Gleichung (44)
@@ -971,6 +1080,7 @@ def γ(f: float, τ: float) -> float:
     return γ
 
 # Gleichung (A.7 Bild 9)
+@memoisieren(maxsize=256)
 def T_pi_and_ν_2(ν_1, f, τ, γ) -> float:
     r"""
     Funktion zur Berechnung des Faktors T_pi zur Berechnung der Zeit vom Kurzschlussbeginn bis zum Erreichen von F_pi
@@ -1139,6 +1249,7 @@ def ν_3(a_s: float, d: float, n: float = None) -> float:
     return ν_3
 
 # Gleichung (A.9 Bild 11)
+@memoisieren(maxsize=4096)
 def ξ_symbolisch(j: float, ε_st: float) -> float:
     """
     Funktion zur Berechnung des Faktors ζ zur Berechnung des Beanspruchungsfaktors des Hauptleiters in Seilanordnungen
@@ -1160,22 +1271,16 @@ def ξ_symbolisch(j: float, ε_st: float) -> float:
     lower_bound = j**(2 / 3)
     upper_bound = j
 
-    # Symbolisch (SymPy) ---
+    # Exakte Lösung (vorkompiliert) mit Gegenprüfung durch die numerische Lösung
+    ξ_num = ξ_numerisch(j=j, ε_st=ε_st)
     try:
-        xi_sym = sympy.symbols('xi', real=True)
-        polynom = (xi_sym**3) + (ε_st * xi_sym**2) - (j**2 * (1 + ε_st))
-        gl_Zeta = sympy.solve(polynom, xi_sym)
-
-        # Filter: Wir suchen die Wurzel im Bereich [j^(2/3), j]
-        valid_sols = [float(s) for s in gl_Zeta if lower_bound - 1e-7 <= s <= upper_bound + 1e-7]
-        if valid_sols:
-            return float(valid_sols[0])
-    except:
-        pass
-    finally:
-        return ξ_numerisch(j=j, ε_st=ε_st)
-    return None
+        valid_sols = reelle_wurzeln_exakt(B=ε_st, C=0, D=-(j**2 * (1 + ε_st)), untere_grenze=lower_bound,
+                                          obere_grenze=upper_bound)
+    except (ZeroDivisionError, OverflowError, ValueError):
+        return ξ_num
+    return gegenpruefung_exakt(valid_sols, ξ_num)
 
+@memoisieren(maxsize=4096)
 def ξ_numerisch(j: float, ε_st: float) -> float:
     """
     Funktion zur Berechnung des Faktors ζ zur Berechnung des Beanspruchungsfaktors des Hauptleiters in Seilanordnungen
@@ -1278,6 +1383,7 @@ def ξ_backup(j: float, ε_st: float) -> float:
     return None
 
 # Gleichung (A.10 Bild 12)
+@memoisieren(maxsize=4096)
 def η(ε_st: float, j: float, v_3: float, n: float, a_s: float, d: float) -> float:
     """
     Funktion zur Berechnung des Faktors η zur Berechnung von F_pi bei nicht zusammenschlagenden
@@ -1474,7 +1580,7 @@ def F(μ0: float, i_1: float, i_2: float, l: float, a: float) -> float:
 
 # Grössen ab Kapitel 6.2.2
 # Gleichung (19a)
-@lru_cache(maxsize=1)
+@memoisieren(maxsize=64)
 def F_a(μ0: float, I_k: float, l: float, l_c: float, a: float) -> float:
     """
     Funktion zur Berechnung der Kraft F' Kraft charakteristischer elektromagnetischer Kraftbelag auf den Hauptleiter in
@@ -1496,7 +1602,7 @@ def F_a(μ0: float, I_k: float, l: float, l_c: float, a: float) -> float:
 
 # Grössen ab Kapitel 6.2.2
 # Gleichung (19b)
-@lru_cache(maxsize=1)
+@memoisieren(maxsize=64)
 def F_b(μ0: float, I_k: float, l: float, l_c: float, l_v: float, a: float) -> float:
     """
     Funktion zur Berechnung der Kraft F' Kraft charakteristischer elektromagnetischer Kraftbelag auf den Hauptleiter in
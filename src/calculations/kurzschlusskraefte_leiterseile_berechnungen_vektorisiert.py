@@ -0,0 +1,541 @@
+"""
+Vektorisierte Varianten der Gleichungen aus kurzschlusskraefte_leiterseile_berechnungen für Parameterstudien.
+Alle Funktionen nehmen NumPy-Arrays (oder Skalare) entgegen und werten die Gleichungen elementweise aus. Die
+Fallunterscheidungen der skalaren Funktionen werden dabei durch elementweise Masken (np.where) ersetzt, die
+Bedingungen sind identisch zu den skalaren Funktionen. Die Winkel werden wie in den skalaren Funktionen in ° übergeben.
+"""
+import numpy as np
+
+from src.calculations import kurzschlusskraefte_leiterseile_berechnungen as bkskls
+
+# Hilfsgleichungen m_c Masse konzentrischer Massen
+def m_c(m_c: np.ndarray, n: float, l_c: float) -> np.ndarray:
+    """
+    Vektorisierte Variante von m_c, Massenbelag der konzentrischen Lasten in kg/m.
+    Bedingung: m_c NaN oder 0 → 0.
+    """
+    m_c = np.asarray(m_c, dtype=float)
+    m_c: np.ndarray = np.where(np.isnan(m_c) | (m_c == 0), 0.0, m_c / (n * l_c))
+    return m_c
+
+# Gleichung (20)
+def r(F_: float, n: float, m_s: np.ndarray, g: float) -> np.ndarray:
+    """
+    Vektorisierte Variante von r, Verhältnis der elektromagnetischen Kraft zur Eigengewichtskraft (dimensionslos).
+    """
+    r: np.ndarray = F_ / (n * np.asarray(m_s, dtype=float) * g)
+    return r
+
+# Gleichung (21)
+def δ_1(r: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von δ_1, Richtung der resultierenden Kraft in °.
+    """
+    δ_1: np.ndarray = np.degrees(np.arctan(r))
+    return δ_1
+
+# Gleichung (22)
+def f_es(n: float, m_s: float, g: float, l: float, F_st: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von f_es, statischer Ersatz-Seildurchhang in Spannfeldmitte in m.
+    """
+    f_es: np.ndarray = (n * m_s * g * l**2) / (8 * np.asarray(F_st, dtype=float))
+    return f_es
+
+# Gleichung (23)
+def T(f_es: np.ndarray, g: float) -> np.ndarray:
+    """
+    Vektorisierte Variante von T, Periodendauer der Spannfeld-Pendelung in s.
+    """
+    T: np.ndarray = 2 * np.pi * np.sqrt(0.8 * (f_es / g))
+    return T
+
+# Gleichung (24)
+def T_res(T: np.ndarray, r: float, δ_1: float) -> np.ndarray:
+    """
+    Vektorisierte Variante von T_res, resultierende Periodendauer der Spannfeld-Pendelung in s.
+    """
+    T_res: np.ndarray = T / ((np.sqrt(np.sqrt(1 + r**2))) * (1 - ((np.pi**2 / 64) * ((δ_1 / 90)**2))))
+    return T_res
+
+# Gleichung (26)
+def E_eff(E: float, F_st: np.ndarray, n: float, A_s: float, σ_fin: float) -> np.ndarray:
+    """
+    Vektorisierte Variante von E_eff, tatsächlicher Elastizitätsmodul in N/m^2.
+    Bedingung: F_st / (n * A_s) <= σ_fin → reduzierter Modul, sonst E.
+    """
+    F_st = np.asarray(F_st, dtype=float)
+    E_eff_1: np.ndarray = E * (0.3 + (0.7 * (np.sin(np.radians((F_st / (n * A_s * σ_fin)) * 90)))))
+    E_eff: np.ndarray = np.where(F_st / (n * A_s) <= σ_fin, E_eff_1, E)
+    return E_eff
+
+# Gleichung (25)
+def N(S: float, l: float, n: float, E_eff: np.ndarray, A_s: float) -> np.ndarray:
+    """
+    Vektorisierte Variante von N, Steifigkeitsnorm einer Anordnung mit Leiterseilen in 1/N.
+    """
+    N: np.ndarray = (1 / (S * l)) + (1 / (n * E_eff * A_s))
+    return N
+
+# Gleichung (28)
+def ζ(n: float, g: float, m_s: float, l: float, F_st: np.ndarray, N: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von ζ, Beanspruchungsfaktor des Hauptleiters in Seilanordnungen (dimensionslos).
+    """
+    ζ: np.ndarray = ((n * g * m_s * l)**2) / (24 * np.power(np.asarray(F_st, dtype=float), 3) * N)
+    return ζ
+
+# Gleichung (29)
+def δ_end(δ_1: float, T_k1: float, T_res: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von δ_end, Ausschwingwinkel am Ende des Kurzschlussstrom-Flusses in °.
+    Bedingung: 0 <= T_k1 / T_res <= 0.5 → Gleichung (29) oben, T_k1 / T_res > 0.5 → 2 * δ_1.
+    """
+    verhältnis = T_k1 / T_res
+    δ_end_1: np.ndarray = δ_1 * (1 - np.cos(np.radians(360 * verhältnis)))
+    δ_end_2: float = δ_1 * 2
+    δ_end: np.ndarray = np.where(verhältnis <= 0.5, δ_end_1, δ_end_2)
+    return δ_end
+
+# Gleichung (31)
+def χ(r: float, δ_end: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Grösse χ zur Berechnung des maximalen Ausschwingwinkels (dimensionslos).
+    Bedingung: δ_end <= 90° → 1 - r * sin(δ_end), δ_end > 90° → 1 - r.
+    """
+    χ: np.ndarray = np.where(δ_end <= 90, 1 - (r * np.sin(np.radians(δ_end))), 1 - r)
+    return χ
+
+# Gleichung (30, 31)
+def δ_max(r: float, δ_end: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von δ_max, maximaler Ausschwingwinkel in °.
+    χ wird abhängig von δ_end <= 90° bzw. δ_end > 90° bestimmt, danach gelten die Bereiche 0.766 < χ <= 1,
+    -0.985 <= χ <= 0.766 und χ < -0.985 wie in der skalaren Funktion.
+    """
+    χ_werte = χ(r, δ_end)
+    arccos_χ = np.degrees(np.arccos(np.clip(χ_werte, -1.0, 1.0)))
+    δ_max: np.ndarray = np.where(χ_werte > 0.766, 1.25 * arccos_χ, np.where(χ_werte >= -0.985, 10 + arccos_χ, 180.0))
+    return δ_max
+
+# Gleichung (32)
+def φ_ohne_schlaufe(T_k1: float, T_res: np.ndarray, r: float, δ_end: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von φ_ohne_schlaufe, Faktor für die Berechnung der Zugkraft in Leiterseilen (dimensionslos).
+    Bedingung: T_k1 >= T_res / 4 → Gleichung (32) oben, sonst Gleichung (32) unten.
+    """
+    φ_1: float = 3 * (np.sqrt((1 + r**2)) - 1)
+    φ_2: np.ndarray = 3 * ((r * np.sin(np.radians(δ_end))) - (np.cos(np.radians(δ_end)) - 1))
+    φ: np.ndarray = np.where(T_k1 >= T_res / 4, φ_1, φ_2)
+    return φ
+
+# Hilfsfunktion für die kubischen Gleichungen (33), (42) und (A.9)
+def grösste_reelle_wurzel(B: np.ndarray, C: np.ndarray, D: np.ndarray) -> np.ndarray:
+    """
+    Grösste reelle Wurzel der normierten kubischen Gleichung x³ + B * x² + C * x + D = 0 (vektorisiert) mit der
+    geschlossenen Lösung nach Cardano (eine reelle Wurzel) bzw. der trigonometrischen Lösung (drei reelle Wurzeln).
+    Hinweis: Ohne Nachiteration, die Aufrufer verbessern das Ergebnis mit Newton-Schritten auf der Originalgleichung.
+    """
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        # Reduktion auf t³ + p * t + q = 0 mit x = t - B / 3
+        p = C - (B**2 / 3)
+        q = (2 * B**3 / 27) - (B * C / 3) + D
+        Δ = (q / 2)**2 + (p / 3)**3
+
+        # Δ > 0: Eine reelle Wurzel (Cardano)
+        w = np.sqrt(np.maximum(Δ, 0))
+        t_cardano = np.cbrt((-q / 2) + w) + np.cbrt((-q / 2) - w)
+        # Δ <= 0: Drei reelle Wurzeln, grösste Wurzel (trigonometrische Lösung)
+        m = 2 * np.sqrt(np.maximum(-p / 3, 0))
+        t_trigonometrisch = m * np.cos(np.arccos(np.clip((3 * q) / (p * m), -1, 1)) / 3)
+
+        return np.where(Δ > 0, t_cardano, t_trigonometrisch) - (B / 3)
+
+# Gleichung (33, 42)
+def ψ_kubisch(φ: np.ndarray, ζ: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vektorisierte Variante von ψ_analytisch, Faktor für die Berechnung der Zugkraft in Leiterseilen (dimensionslos)
+    mit der geschlossenen Lösung (Cardano bzw. trigonometrisch) der kubischen Gleichung.
+    Gleichung: φ² * ψ³ + φ * (2 + ζ) * ψ² + (1 + 2 * ζ) * ψ - ζ * (2 + φ) = 0
+    Hinweis: Für φ >= 0 und ζ >= 0 ist die gesuchte Lösung die grösste reelle Wurzel. Für kleine φ wird von der Lösung
+    des linearen Anteils ausgegangen. Alle Elemente werden mit zwei Newton-Schritten nachiteriert.
+
+    Returns:
+        Tuple aus ψ und der Maske der entarteten Elemente (ungültige Eingaben oder Lösung ausserhalb [0, 1]), für
+        diese ist ψ NaN
+    """
+    φ, ζ = np.broadcast_arrays(np.asarray(φ, dtype=float), np.asarray(ζ, dtype=float))
+    a = φ**2
+    b = φ * (2 + ζ)
+    c = 1 + (2 * ζ)
+    d = -ζ * (2 + φ)
+    klein = φ < 1e-2
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        ψ = grösste_reelle_wurzel(b / a, c / a, d / a)
+        ψ = np.where(klein, -d / c, ψ)
+
+        # Nachiteration mit dem Newton-Verfahren (Rundungsfehler der geschlossenen Lösung)
+        for _ in range(2):
+            df = (3 * a * ψ**2) + (2 * b * ψ) + c
+            ψ = ψ - ((((a * ψ + b) * ψ + c) * ψ + d) / df)
+
+    entartet = ~np.isfinite(φ) | ~np.isfinite(ζ) | (φ < 0) | (ζ < 0) | ~np.isfinite(ψ) | (ψ < 0) | (ψ > 1)
+    ψ = np.where(entartet, np.nan, ψ)
+    return ψ, entartet
+
+# Gleichung (33)
+def ψ_ohne_schlaufe(φ: np.ndarray, ζ: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von ψ_ohne_schlaufe_analytisch, Faktor für die Berechnung der Zugkraft in Leiterseilen
+    (dimensionslos). Entartete Elemente werden mit ψ_iterativ bestimmt.
+    """
+    ψ, entartet = ψ_kubisch(φ, ζ)
+    if np.any(entartet):
+        φ, ζ = np.broadcast_arrays(np.asarray(φ, dtype=float), np.asarray(ζ, dtype=float))
+        ψ[entartet] = ψ_iterativ(φ[entartet], ζ[entartet])
+    return ψ
+
+# Gleichung (42)
+def ψ_mit_schlaufe(φ: np.ndarray, ζ: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von ψ_mit_schlaufe_analytisch, Faktor für die Berechnung der Zugkraft in Leiterseilen
+    (dimensionslos). Die Gleichung ist identisch zu Gleichung (33).
+    """
+    return ψ_ohne_schlaufe(φ, ζ)
+
+# Gleichung (33, 42)
+def ψ_iterativ(φ: np.ndarray, ζ: np.ndarray, xtol: float = 1e-14, maxiter: int = 100) -> np.ndarray:
+    """
+    Vektorisierte Variante von ψ_ohne_schlaufe_numerisch, Faktor für die Berechnung der Zugkraft in Leiterseilen
+    (dimensionslos).
+    Gleichung: φ² * ψ³ + φ * (2 + ζ) * ψ² + (1 + 2 * ζ) * ψ - ζ * (2 + φ) = 0
+    Hinweis: Für φ >= 0 und ζ >= 0 ist f(0) = -ζ * (2 + φ) <= 0 und f(1) = (1 + φ)² > 0, die Ableitung ist im
+    Intervall [0, 1] positiv. Die Wurzel ist damit eindeutig und wird für alle Elemente gleichzeitig mit einem durch
+    Bisektion abgesicherten Newton-Verfahren bestimmt.
+    """
+    φ, ζ = np.broadcast_arrays(np.asarray(φ, dtype=float), np.asarray(ζ, dtype=float))
+    untere_grenze = np.zeros(φ.shape)
+    obere_grenze = np.ones(φ.shape)
+    ψ = np.full(φ.shape, 0.5)
+
+    for _ in range(maxiter):
+        f = (ψ**3 * φ**2) + ((φ * (2 + ζ)) * (ψ**2)) + (ψ * (1 + (2 * ζ))) - (ζ * (2 + φ))
+        df = (3 * ψ**2 * φ**2) + (2 * φ * (2 + ζ) * ψ) + (1 + (2 * ζ))
+
+        # Intervall eingrenzen: f ist im Intervall [0, 1] monoton steigend
+        untere_grenze = np.where(f < 0, ψ, untere_grenze)
+        obere_grenze = np.where(f > 0, ψ, obere_grenze)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ψ_newton = ψ - (f / df)
+        ausserhalb = ~np.isfinite(ψ_newton) | (ψ_newton <= untere_grenze) | (ψ_newton >= obere_grenze)
+        ψ_neu = np.where(ausserhalb, (untere_grenze + obere_grenze) / 2, ψ_newton)
+        ψ_neu = np.where(f == 0, ψ, ψ_neu)
+
+        konvergiert = np.all(np.abs(ψ_neu - ψ) <= xtol)
+        ψ = ψ_neu
+        if konvergiert:
+            break
+
+    # Ohne Vorzeichenwechsel im Intervall [0, 1] existiert keine gültige Lösung
+    f_0 = -ζ * (2 + φ)
+    f_1 = φ**2 + (φ * (2 + ζ)) + (1 + (2 * ζ)) + f_0
+    return np.where(f_0 * f_1 <= 0, ψ, np.nan)
+
+# Gleichung (33)
+def F_td_ohne_schlaufe_spannfeldmitte(F_st: np.ndarray, φ: np.ndarray, ψ: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von F_td_ohne_schlaufe_spannfeldmitte, Kurzschluss-Seilzugkraft in N.
+    """
+    F_td: np.ndarray = F_st * (1 + (φ * ψ))
+    return F_td
+
+# Gleichung (34)
+def ε_ela(N: np.ndarray, F_td: np.ndarray, F_st: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von ε_ela, elastische Seildehnung (dimensionslos).
+    """
+    ε_ela: np.ndarray = N * (F_td - F_st)
+    return ε_ela
+
+# Gleichung (35)
+def ε_th(c_th: float, I_k__: float, n: float, A_s: float, T_k1: float, T_res: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von ε_th, thermische Seildehnung (dimensionslos).
+    Bedingung: T_k1 >= T_res / 4 → T_res / 4, sonst T_k1.
+    """
+    ε_th: np.ndarray = c_th * (I_k__ / (n * A_s))**2 * np.where(T_k1 >= T_res / 4, T_res / 4, T_k1)
+    return ε_th
+
+# Gleichung (36)
+def C_D(l: float, f_es: np.ndarray, ε_ela: np.ndarray, ε_th: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von C_D, Faktor für die Durchhangvergrösserung durch Seildehnung (dimensionslos).
+    """
+    C_D: np.ndarray = np.sqrt(1 + ((3 / 8) * (l / f_es)**2 * (ε_ela + ε_th)))
+    return C_D
+
+# Gleichung (37)
+def C_F(r: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von C_F, Faktor für die Durchhangvergrösserung durch Änderung der Seilkurvenform.
+    Bedingung: r <= 0.8 → 1.05, 0.8 < r < 1.8 → 0.97 + 0.1 * r, r >= 1.8 → 1.15.
+    """
+    r = np.asarray(r, dtype=float)
+    C_F: np.ndarray = np.where(r <= 0.8, 1.05, np.where(r < 1.8, 0.97 + (0.1 * r), 1.15))
+    return C_F
+
+# Gleichung (38)
+def f_ed(C_D: np.ndarray, C_F: float, f_es: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von f_ed, dynamischer Seildurchhang in Spannfeldmitte in m.
+    """
+    f_ed: np.ndarray = C_D * C_F * f_es
+    return f_ed
+
+# Gleichung (43)
+def F_fd(F_st: np.ndarray, ζ: np.ndarray, δ_max: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von F_fd, Fall-Seilzugkraft in N.
+    """
+    F_fd: np.ndarray = 1.2 * F_st * (np.sqrt(1 + ((8 * ζ) * (δ_max / 180))))
+    return F_fd
+
+# Gleichung (44)
+def b_h_ohne_schlaufe_spannfeldmitte_aufgelegt(f_ed: np.ndarray, δ_max: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von b_h_ohne_schlaufe_spannfeldmitte_aufgelegt, maximale horizontale Seilauslenkung in m.
+    Bedingung: δ_max >= 90° → f_ed, sonst f_ed * sin(δ_max).
+    """
+    b_h: np.ndarray = np.where(δ_max >= 90, f_ed, f_ed * np.sin(np.radians(δ_max)))
+    return b_h
+
+# Gleichung (45)
+def b_h_ohne_schlaufe_spannfeldmitte_abgespannt(f_ed: np.ndarray, δ_max: np.ndarray, δ_1: float) -> np.ndarray:
+    """
+    Vektorisierte Variante von b_h_ohne_schlaufe_spannfeldmitte_abgespannt, maximale horizontale Seilauslenkung in m.
+    Bedingung: δ_max >= δ_1 → f_ed * sin(δ_1), sonst f_ed * sin(δ_max).
+    """
+    b_h: np.ndarray = f_ed * np.sin(np.radians(np.where(δ_max >= δ_1, δ_1, δ_max)))
+    return b_h
+
+# Gleichung (48)
+def a_min(a: float, b_h: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von a_min, minimaler Leiterabstand in m.
+    """
+    a_min: np.ndarray = a - (2 * b_h)
+    return a_min
+
+# Gleichung (56)
+def ε_st(F_st: np.ndarray, l_bezug: float, N: np.ndarray, a_s: float, n: float, d: float) -> np.ndarray:
+    """
+    Vektorisierte Variante von ε_st, Dehnungsfaktor bei der Kontraktion eines Seilbündels (dimensionslos).
+    l_bezug: die in der skalaren Funktion ausgewählte Länge l_s, l_eff oder l_c in m
+    """
+    ε_st: np.ndarray = (1.5 * ((F_st * l_bezug**2 * N) / (a_s - d)**2) * (np.sin(np.radians(180 / n)))**2)
+    return ε_st
+
+# Gleichung (57)
+def ε_pi(F_v: float, l_bezug: float, N: np.ndarray, a_s: float, n: float, d: float) -> np.ndarray:
+    """
+    Vektorisierte Variante von ε_pi, Dehnungsfaktor bei der Kontraktion eines Seilbündels (dimensionslos).
+    l_bezug: die in der skalaren Funktion ausgewählte Länge l_s, l_eff oder l_c in m
+    """
+    ε_pi: np.ndarray = (0.375 * n * ((F_v * l_bezug**3 * N) / (a_s - d)**3) * (np.sin(np.radians(180 / n)))**3)
+    return ε_pi
+
+# Gleichung (58)
+def j(ε_st: np.ndarray, ε_pi: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von j, Parameter für die Lage der Bündelleiter während des Kurzschlussstrom-Flusses.
+    """
+    j: np.ndarray = np.sqrt(ε_pi / (1 + ε_st))
+    return j
+
+# Gleichung (A.9 Bild 11)
+def ξ_kubisch(j: np.ndarray, ε_st: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vektorisierte Lösung für den Faktor ξ bei zusammenschlagenden Bündelleitern (dimensionslos) mit der geschlossenen
+    Lösung der kubischen Gleichung und zwei Newton-Schritten.
+    Gleichung: ξ³ + ε_st * ξ² - j² * (1 + ε_st) = 0
+    Gültigkeitsbereich: j >= 1, gesuchte Wurzel ξ liegt zwischen j^(2/3) und j. Für ε_st >= 0 ist das die einzige
+    positive und damit die grösste reelle Wurzel. Rundungsbedingte Abweichungen bis 1e-7 (Toleranz wie ξ_symbolisch)
+    werden auf das normative Intervall begrenzt.
+
+    Returns:
+        Tuple aus ξ und der Maske der entarteten Elemente (j < 1, ungültige Eingaben oder Lösung ausserhalb des
+        Intervalls), für diese ist ξ NaN
+    """
+    j, ε_st = np.broadcast_arrays(np.asarray(j, dtype=float), np.asarray(ε_st, dtype=float))
+    K = j**2 * (1 + ε_st)
+    untere_grenze = np.cbrt(j**2)
+    obere_grenze = j
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        ξ = grösste_reelle_wurzel(ε_st, np.zeros(j.shape), -K)
+
+        # Nachiteration mit dem Newton-Verfahren (Rundungsfehler der geschlossenen Lösung)
+        for _ in range(2):
+            ξ = ξ - ((((ξ + ε_st) * ξ**2) - K) / ((3 * ξ**2) + (2 * ε_st * ξ)))
+
+    entartet = (~np.isfinite(j) | ~np.isfinite(ε_st) | (j < 1) | ~np.isfinite(ξ)
+                | (ξ < untere_grenze - 1e-7) | (ξ > obere_grenze + 1e-7))
+    ξ = np.where(entartet, np.nan, np.clip(ξ, untere_grenze, obere_grenze))
+    return ξ, entartet
+
+# Gleichung (A.9 Bild 11)
+def ξ(j: np.ndarray, ε_st: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von ξ_numerisch, Faktor bei zusammenschlagenden Bündelleitern (dimensionslos).
+    Für j < 1 ist ξ nicht definiert und wird als NaN zurückgegeben. Entartete Elemente von ξ_kubisch mit j >= 1
+    werden mit der skalaren Funktion ξ_numerisch bestimmt.
+    """
+    j, ε_st = np.broadcast_arrays(np.asarray(j, dtype=float), np.asarray(ε_st, dtype=float))
+    ξ_werte, entartet = ξ_kubisch(j, ε_st)
+    for index in np.flatnonzero(entartet & (j >= 1)):
+        wert = bkskls.ξ_numerisch(j=float(j.flat[index]), ε_st=float(ε_st.flat[index]))
+        ξ_werte.flat[index] = np.nan if wert is None else wert
+    return ξ_werte
+
+# Gleichung (A.10 Bild 12)
+def η_zielfunktion(η: np.ndarray, ε_st: np.ndarray, j: np.ndarray, v_3: float, n: float, a_s: float,
+                   d: float) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Zielfunktion von η und ihre Ableitung nach η (vektorisiert).
+    Gleichung: η³ + ε_st * η - j² * (1 + ε_st) * fη = 0 mit fη = ν_3 / (a_sw / a_s)
+    Hinweis: Die Klammerung von η auf [1e-9, 1 - 1e-9] entspricht der Zielfunktion der skalaren Funktion η.
+
+    Returns:
+        Tuple aus Funktionswert und Ableitung
+    """
+    η = np.clip(η, 1e-9, 1.0 - 1e-9)
+    sin_n = np.sin(np.radians(180 / n))
+    c = 1 - (d / a_s)
+    K = j**2 * (1 + ε_st) * v_3
+
+    # 2ya/as und asw/as mit t = sqrt((1 - u) / u); Grenzwert t / atan(t) -> 1 für t -> 0
+    u = 1 - (η * c)
+    t = np.sqrt((1 - u) / u)
+    klein = t < 1e-7
+    with np.errstate(divide="ignore", invalid="ignore"):
+        atan_t = np.arctan(t)
+        h = np.where(klein, 1.0, t / atan_t)
+        # h'(t) / t mit Grenzwert 2/3 für t -> 0
+        dh_t = np.where(t < 1e-4, 2 / 3, (atan_t - (t / (1 + t**2))) / (t * atan_t**2))
+    asw_as = (u / sin_n) * h
+
+    # Ableitung: dasw/dη = (-c * h + u * h'(t) * dt/dη) / sin_n mit dt/dη = c / (2 * t * u²)
+    dasw_as = ((-c * h) + (u * dh_t * (c / (2 * u**2)))) / sin_n
+
+    f = (η**3) + (ε_st * η) - (K / asw_as)
+    df = (3 * η**2) + ε_st + ((K * dasw_as) / asw_as**2)
+    return f, df
+
+# Gleichung (A.10 Bild 12)
+def η_newton(ε_st: np.ndarray, j: np.ndarray, v_3: float, n: float, a_s: float, d: float, xtol: float = 1e-12,
+             maxiter: int = 100) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vektorisierte Lösung der impliziten Gleichung für η (Kapitel A.10) mit einem durch Bisektion abgesicherten
+    Newton-Verfahren im Intervall [1e-8, 0.99999] (gleiches Intervall wie die skalare Funktion η).
+    Elemente, deren Zielfunktion bei η = 0.99999 negativ ist, erhalten wie in der skalaren Funktion η = 1.0
+    (zusammenschlagende Teilleiter).
+
+    Returns:
+        Tuple aus η und der Konvergenzmaske. Elemente ohne Vorzeichenwechsel im Intervall oder ohne Konvergenz
+        innerhalb von maxiter Iterationen sind in der Maske False, η ist für diese NaN.
+    """
+    ε_st, j = np.broadcast_arrays(np.asarray(ε_st, dtype=float), np.asarray(j, dtype=float))
+    untere_grenze = np.full(j.shape, 1e-8)
+    obere_grenze = np.full(j.shape, 0.99999)
+
+    f_unten, _ = η_zielfunktion(untere_grenze, ε_st, j, v_3, n, a_s, d)
+    f_oben, _ = η_zielfunktion(obere_grenze, ε_st, j, v_3, n, a_s, d)
+    zusammenschlagen = f_oben < 0
+    offen = ~zusammenschlagen & (f_unten * f_oben < 0)
+
+    η = np.where(zusammenschlagen, 1.0, np.nan)
+    konvergiert = zusammenschlagen.copy()
+    if not np.any(offen):
+        return η, konvergiert
+
+    # Iteration nur für die eingeschlossenen Elemente
+    ε_i, j_i = ε_st[offen], j[offen]
+    unten, oben = untere_grenze[offen], obere_grenze[offen]
+    x = (unten + oben) / 2
+    fertig = np.zeros(x.shape, dtype=bool)
+
+    for _ in range(maxiter):
+        f, df = η_zielfunktion(x, ε_i, j_i, v_3, n, a_s, d)
+
+        # Intervall eingrenzen: Vorzeichenwechsel von negativ (unten) nach positiv (oben)
+        unten = np.where(f < 0, x, unten)
+        oben = np.where(f > 0, x, oben)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_newton = x - (f / df)
+        ausserhalb = ~np.isfinite(x_newton) | (x_newton <= unten) | (x_newton >= oben)
+        x_neu = np.where(ausserhalb, (unten + oben) / 2, x_newton)
+        x_neu = np.where((f == 0) | fertig, x, x_neu)
+
+        fertig = fertig | (np.abs(x_neu - x) <= xtol) | ((oben - unten) <= xtol)
+        x = x_neu
+        if np.all(fertig):
+            break
+
+    η[offen] = np.where(fertig, x, np.nan)
+    konvergiert[offen] = fertig
+    return η, konvergiert
+
+# Gleichung (A.10 Bild 12)
+def η(ε_st: np.ndarray, j: np.ndarray, v_3: float, n: float, a_s: float, d: float) -> np.ndarray:
+    """
+    Vektorisierte Variante von η, Faktor bei nicht zusammenschlagenden Bündelleitern (dimensionslos).
+    η wird nur für j < 1 benötigt, für j >= 1 wird NaN zurückgegeben. Nicht konvergierte Elemente von η_newton
+    werden mit der skalaren Funktion η (Brent + fsolve) bestimmt.
+    """
+    ε_st, j = np.broadcast_arrays(np.asarray(ε_st, dtype=float), np.asarray(j, dtype=float))
+    η_werte: np.ndarray = np.full(j.shape, np.nan)
+    benötigt = j < 1
+    if not np.any(benötigt):
+        return η_werte
+
+    η_werte[benötigt], konvergiert = η_newton(ε_st[benötigt], j[benötigt], v_3, n, a_s, d)
+    for index in np.flatnonzero(benötigt)[~konvergiert]:
+        η_werte.flat[index] = bkskls.η(float(ε_st.flat[index]), float(j.flat[index]), v_3, n, a_s, d)
+    return η_werte
+
+# Gleichung (61, 64)
+def ν_4(j: np.ndarray, a_s: float, d: float, η: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von ν_4, Faktor zur Berechnung von F_pi_d.
+    Bedingung: j >= 1 → (a_s - d) / d, sonst Gleichung (64).
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ν_4_2: np.ndarray = η * ((a_s - d) / (a_s - (η * (a_s - d))))
+    ν_4: np.ndarray = np.where(j >= 1, (a_s - d) / d, ν_4_2)
+    return ν_4
+
+# Gleichung (60, 63)
+def ν_e(μ0: float, j: np.ndarray, I_k: float, a_s: float, N: np.ndarray, n: float, l_bezug: float, d: float,
+        ν_2: float, ν_4: np.ndarray, ξ: np.ndarray, η: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von ν_e, Faktor zur Berechnung von F_pi_d.
+    l_bezug: die in der skalaren Funktion ausgewählte Länge l_s, l_eff oder l_c in m
+    Bedingung: j >= 1 → ξ³ im Nenner, sonst η⁴.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        nenner: np.ndarray = np.where(j >= 1, ξ**3, η**4)
+        ν_e: np.ndarray = 1/2 + ((9/8) * n * (n - 1) * (μ0 / (2 * np.pi)) * (I_k / n)**2 * N * ν_2 * (l_bezug / (a_s - d))**4 * (np.sin(np.radians(180 / n))**4 / nenner) * (1 - (np.arctan(np.sqrt(ν_4)) / np.sqrt(ν_4))) - 1/4)**(1/2)
+    return ν_e
+
+# Gleichung (59, 62)
+def F_pi_d_mit_j(F_st: np.ndarray, j: np.ndarray, ν_e: np.ndarray, ε_st: np.ndarray, ξ: np.ndarray,
+                 η: np.ndarray) -> np.ndarray:
+    """
+    Vektorisierte Variante von F_pi_d_mit_j, Bündel-Seilzugkraft in N.
+    Bedingung: j >= 1 → ξ, sonst η².
+    """
+    F_pi_d_mit_j: np.ndarray = F_st * (1 + ((ν_e / ε_st) * np.where(j >= 1, ξ, η**2)))
+    return F_pi_d_mit_j
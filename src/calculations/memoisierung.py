@@ -0,0 +1,158 @@
+"""
+Einheitliche Memoisierung für die Berechnungsmodule.
+
+Ersetzt die einzelnen functools.lru_cache-Dekoratoren: Jede Funktion erhält einen eigenen LRU-Speicher mit
+konfigurierbarer Grösse und Treffer-Statistik. Alle Speicher sind zentral registriert und können gemeinsam
+ausgewertet und geleert werden. Aufrufe mit NumPy-Arrays oder anderen nicht hashbaren Argumenten werden ohne
+Speicher direkt ausgeführt.
+
+Beispiel:
+    @memoisieren(maxsize=256)
+    def T_pi_and_ν_2(ν_1, f, τ, γ): ...
+
+    memoisierung.statistik()      # Treffer, Fehlschläge, Umgehungen und Trefferquote pro Funktion
+    memoisierung.alle_leeren()    # Alle Speicher leeren
+"""
+import functools
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+# Registrierte Speicher: Qualifizierter Funktionsname -> Speicher
+_register: dict[str, "_Speicher"] = {}
+_register_lock = threading.Lock()
+
+
+class _Speicher:
+    """LRU-Speicher einer Funktion mit Statistik"""
+
+    def __init__(self, funktion: Callable, maxsize: int):
+        self.funktion = funktion
+        self.maxsize = maxsize
+        self.einträge: OrderedDict[tuple, Any] = OrderedDict()
+        self.lock = threading.Lock()
+        self.treffer = 0
+        self.fehlschläge = 0
+        self.umgehungen = 0
+
+    def aufrufen(self, args: tuple, kwargs: dict) -> Any:
+        if self.maxsize <= 0:
+            return self._umgehen(args, kwargs)
+
+        schlüssel = (args, tuple(sorted(kwargs.items()))) if kwargs else (args,)
+        try:
+            if any(isinstance(wert, np.ndarray) for wert in args) or \
+                    any(isinstance(wert, np.ndarray) for wert in kwargs.values()):
+                raise TypeError
+            hash(schlüssel)
+        except TypeError:
+            # NumPy-Arrays und nicht hashbare Argumente werden nicht gespeichert
+            return self._umgehen(args, kwargs)
+
+        with self.lock:
+            if schlüssel in self.einträge:
+                self.einträge.move_to_end(schlüssel)
+                self.treffer += 1
+                return self.einträge[schlüssel]
+
+        # Ausführung ausserhalb des Locks, damit parallele Aufrufe anderer Argumente nicht blockiert werden
+        wert = self.funktion(*args, **kwargs)
+        with self.lock:
+            self.fehlschläge += 1
+            self.einträge[schlüssel] = wert
+            while len(self.einträge) > self.maxsize:
+                self.einträge.popitem(last=False)
+        return wert
+
+    def _umgehen(self, args: tuple, kwargs: dict) -> Any:
+        # Aufruf ohne Speicher, der Zähler wird wie Treffer und Fehlschläge unter dem Lock erhöht
+        with self.lock:
+            self.umgehungen += 1
+        return self.funktion(*args, **kwargs)
+
+    def leeren(self, statistik_zurücksetzen: bool = False):
+        with self.lock:
+            self.einträge.clear()
+            if statistik_zurücksetzen:
+                self.treffer = self.fehlschläge = self.umgehungen = 0
+
+    def info(self) -> dict[str, Any]:
+        aufrufe = self.treffer + self.fehlschläge
+        return {"Treffer": self.treffer, "Fehlschläge": self.fehlschläge, "Umgehungen": self.umgehungen,
+                "Trefferquote": self.treffer / aufrufe if aufrufe else None, "Einträge": len(self.einträge),
+                "maxsize": self.maxsize}
+
+
+def memoisieren(maxsize: int = 128) -> Callable[[Callable], Callable]:
+    """
+    Dekorator für die Memoisierung einer Funktion mit eigenem LRU-Speicher.
+
+    Args:
+        maxsize: Anzahl gespeicherter Ergebnisse (0 schaltet die Memoisierung der Funktion ab)
+
+    Returns:
+        Dekorator, die dekorierte Funktion besitzt cache_info(), cache_clear() und cache_resize(maxsize)
+    """
+    def dekorator(funktion: Callable) -> Callable:
+        speicher = _Speicher(funktion, maxsize)
+        name = f"{funktion.__module__}.{funktion.__qualname__}"
+        with _register_lock:
+            _register[name] = speicher
+
+        @functools.wraps(funktion)
+        def wrapper(*args, **kwargs):
+            return speicher.aufrufen(args, kwargs)
+
+        def cache_resize(neue_maxsize: int):
+            with speicher.lock:
+                speicher.maxsize = neue_maxsize
+                while len(speicher.einträge) > max(neue_maxsize, 0):
+                    speicher.einträge.popitem(last=False)
+
+        wrapper.cache_info = speicher.info
+        wrapper.cache_clear = speicher.leeren
+        wrapper.cache_resize = cache_resize
+        return wrapper
+    return dekorator
+
+
+def konfigurieren(grössen: dict[str, int]):
+    """
+    Setzt die Speichergrössen einzelner Funktionen.
+
+    Args:
+        grössen: Funktionsname (qualifiziert oder nur Funktionsname) -> maxsize
+    """
+    for name, maxsize in grössen.items():
+        for speicher_name, speicher in _gefunden(name):
+            with speicher.lock:
+                speicher.maxsize = maxsize
+                while len(speicher.einträge) > max(maxsize, 0):
+                    speicher.einträge.popitem(last=False)
+
+
+def statistik(name: Optional[str] = None) -> dict[str, dict[str, Any]]:
+    """Gibt die Statistik aller (oder der passenden) registrierten Funktionen zurück"""
+    with _register_lock:
+        speicher = list(_register.items())
+    return {speicher_name: s.info() for speicher_name, s in speicher
+            if name is None or speicher_name == name or speicher_name.endswith(f".{name}")}
+
+
+def alle_leeren(statistik_zurücksetzen: bool = False):
+    """Leert die Speicher aller registrierten Funktionen"""
+    with _register_lock:
+        speicher = list(_register.values())
+    for s in speicher:
+        s.leeren(statistik_zurücksetzen)
+
+
+def _gefunden(name: str) -> list[tuple[str, _Speicher]]:
+    with _register_lock:
+        gefunden = [(speicher_name, s) for speicher_name, s in _register.items()
+                    if speicher_name == name or speicher_name.endswith(f".{name}")]
+    if not gefunden:
+        raise KeyError(f"Keine memoisierte Funktion '{name}' registriert.")
+    return gefunden
@@ -0,0 +1,256 @@
+"""
+Stapelverarbeitung (ohne GUI) der Kurzschlusskräfte von Leiterseilen für ein Verzeichnis mit Excel-Vorlagen.
+
+Jede Vorlage wird wie in der GUI über das Mapping "Import Kurzschlusskraft Leiterseile" eingelesen, in ein
+KurschlusskräfteLeiterseileInput umgewandelt und in einem ProcessPoolExecutor berechnet. Die Ergebnisse aller
+Vorlagen werden in einer Tabelle (CSV oder Excel) zusammengefasst.
+
+Aufruf:
+    python -m src.engines.kurzschlusskraefte_leiterseile_batch examples -o ergebnisse.xlsx -w 4
+"""
+import argparse
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Optional
+
+import pandas as pd
+
+from src.calculations import kurzschlusskraefte_leiterseile_berechnungen as bkskls
+from src.utils import dataloader, traceback_detail
+from src.utils.leiterseilkatalog import Leiterseilkatalog, get_leiterseilkatalog
+from src.engines.kurzschlusskraefte_leiterseile_engine import (
+    KurschlusskräfteLeiterseileInput,
+    calculate_kurschlusskräfte_leiterseile,
+)
+
+MAPPING_KURZSCHLUSSKRAFT_LEITERSEILE = "Import Kurzschlusskraft Leiterseile"
+
+# State-Variablen der GUI bzw. Felder der Excel-Vorlage, aus denen das Input-Objekt erstellt wird
+EINGABE_VARIABLEN: tuple[str, ...] = (
+    "leiterseilbefestigung_selected", "schlaufe_in_spannfeldmitte_selected",
+    "hoehenunterschied_befestigungspunkte_selected", "schlaufenebene_parallel_senkrecht_selected",
+    "temperatur_niedrig_selected", "temperatur_hoch_selected", "standardkurzschlussstroeme_selected", "kappa", "t_k",
+    "frequenz_des_netzes_selected", "leiterseiltyp_selected", "teilleiter_selected", "m_c", "l", "l_i", "l_h_f", "a",
+    "a_s", "F_st_20", "F_st_80", "S", "l_s_1", "l_s_2", "l_s_3", "l_s_4", "l_s_5", "l_s_6", "l_s_7", "l_s_8",
+    "l_s_9", "l_s_10", "h", "w", "l_v",
+)
+
+ERGEBNIS_SPALTEN = ["Datei", "Lastfall", "Temperatur", "F_st", "F_td", "F_fd", "F_pi_d", "b_h", "a_min",
+                    "Laufzeit", "Fehler"]
+
+
+def init_worker():
+    # Leiterseildaten und exakte Wurzelausdrücke einmal pro Worker-Prozess aufbauen, damit die Latenz pro Datei
+    # nicht den einmaligen Aufbau enthält
+    get_leiterseilkatalog()
+    bkskls.kubische_wurzeln_exakt()
+
+
+def _optional_float(value: Any) -> Optional[float]:
+    # Leere Felder und 0 gelten wie in der GUI als nicht gesetzt
+    return float(value) if value not in (None, 0.0, 0, '', '0.0', '0') else None
+
+
+def create_kurzschlusskraefte_leiterseile_input(input_dict: dict[str, Any],
+                                                leiterseilkatalog: Leiterseilkatalog) -> KurschlusskräfteLeiterseileInput:
+    """
+    Erstellt das Input-Objekt für den Mediator aus einem Dictionary mit den State-Variablennamen (EINGABE_VARIABLEN).
+    Wird von der GUI, der Stapelverarbeitung und dem HTTP-Dienst gemeinsam verwendet.
+    Die Seildaten d, A_s, m_s, E und c_th werden über die Bezeichnung aus dem Leiterseilkatalog gelesen.
+
+    Args:
+        input_dict: Dictionary aus dataloader.convert_excel_to_dict_with_mapping bzw. aus dem State der GUI
+        leiterseilkatalog: Leiterseilkatalog (get_leiterseilkatalog())
+
+    Returns:
+        KurschlusskräfteLeiterseileInput
+    """
+    leiterseiltyp = input_dict.get("leiterseiltyp_selected")
+    seil = leiterseilkatalog.seildaten(leiterseiltyp)
+
+    return KurschlusskräfteLeiterseileInput(
+        leiterseilbefestigung=str(input_dict.get("leiterseilbefestigung_selected")),
+        schlaufe_in_spannfeldmitte=str(input_dict.get("schlaufe_in_spannfeldmitte_selected")),
+        hoehenunterschied_befestigungspunkte=str(input_dict.get("hoehenunterschied_befestigungspunkte_selected")),
+        schlaufenebene_parallel_senkrecht=str(input_dict.get("schlaufenebene_parallel_senkrecht_selected")),
+        temperatur_niedrig=int(input_dict.get("temperatur_niedrig_selected")),
+        temperatur_hoch=int(input_dict.get("temperatur_hoch_selected")),
+        standardkurzschlussstroeme=float(input_dict.get("standardkurzschlussstroeme_selected")),
+        κ=float(input_dict.get("kappa")),
+        t_k=float(input_dict.get("t_k")),
+        f=float(input_dict.get("frequenz_des_netzes_selected")),
+        leiterseiltyp=str(leiterseiltyp),
+        d=seil["d"],
+        A_s=seil["A_s"],
+        m_s=seil["m_s"],
+        E=seil["E"],
+        c_th=seil["c_th"],
+        n=int(input_dict.get("teilleiter_selected")),
+        m_c=_optional_float(input_dict.get("m_c")),
+        l=float(input_dict.get("l")),
+        l_i=_optional_float(input_dict.get("l_i")),
+        l_h_f=_optional_float(input_dict.get("l_h_f")),
+        a=float(input_dict.get("a")),
+        a_s=_optional_float(input_dict.get("a_s")),
+        F_st_20=float(input_dict.get("F_st_20")),
+        F_st_80=float(input_dict.get("F_st_80")),
+        S=int(input_dict.get("S")),
+        l_s_1=_optional_float(input_dict.get("l_s_1")),
+        l_s_2=_optional_float(input_dict.get("l_s_2")),
+        l_s_3=_optional_float(input_dict.get("l_s_3")),
+        l_s_4=_optional_float(input_dict.get("l_s_4")),
+        l_s_5=_optional_float(input_dict.get("l_s_5")),
+        l_s_6=_optional_float(input_dict.get("l_s_6")),
+        l_s_7=_optional_float(input_dict.get("l_s_7")),
+        l_s_8=_optional_float(input_dict.get("l_s_8")),
+        l_s_9=_optional_float(input_dict.get("l_s_9")),
+        l_s_10=_optional_float(input_dict.get("l_s_10")),
+        h=_optional_float(input_dict.get("h")),
+        w=_optional_float(input_dict.get("w")),
+        l_v=_optional_float(input_dict.get("l_v")),
+    )
+
+
+def load_input_from_excel(file_path: str | Path) -> KurschlusskräfteLeiterseileInput:
+    """Lädt eine Excel-Vorlage und erstellt das Input-Objekt für den Mediator"""
+    df = dataloader.load_excel_to_df(file_path)
+    if df.empty:
+        raise ValueError("Datei konnte nicht geladen werden oder ist leer.")
+    input_dict, _, _ = dataloader.convert_excel_to_dict_with_mapping(df=df,
+                                                                     mapping=MAPPING_KURZSCHLUSSKRAFT_LEITERSEILE)
+    if not input_dict:
+        raise ValueError("Keine gültigen Eingabedaten in der Datei gefunden.")
+    return create_kurzschlusskraefte_leiterseile_input(input_dict, get_leiterseilkatalog())
+
+
+def run_file(file_path: str) -> list[dict[str, Any]]:
+    """
+    Berechnet eine Excel-Vorlage (wird im Worker-Prozess ausgeführt).
+    Fehler werden nicht weitergereicht, sondern als Zeile mit der Fehlermeldung zurückgegeben.
+
+    Returns:
+        Liste der Ergebniszeilen (eine Zeile pro Lastfall F_st_20 und F_st_80)
+    """
+    start = time.perf_counter()
+    datei = Path(file_path).name
+    try:
+        inputs = load_input_from_excel(file_path)
+        calc_result = calculate_kurschlusskräfte_leiterseile(inputs)
+    except Exception as e:
+        laufzeit = time.perf_counter() - start
+        return [{"Datei": datei, "Laufzeit": laufzeit, "Fehler": traceback_detail.get_exception_message(e)}]
+
+    laufzeit = time.perf_counter() - start
+    temperaturen = {"F_st_20": inputs.temperatur_niedrig, "F_st_80": inputs.temperatur_hoch}
+    zeilen = []
+    for lastfall, result in calc_result.items():
+        zeilen.append({
+            "Datei": datei,
+            "Lastfall": lastfall,
+            "Temperatur": temperaturen.get(lastfall),
+            "F_st": getattr(inputs, lastfall) / 1000,
+            "F_td": result.F_td,
+            "F_fd": result.F_fd,
+            "F_pi_d": result.F_pi_d,
+            "b_h": result.b_h,
+            "a_min": result.a_min,
+            "Laufzeit": laufzeit,
+            "Fehler": None,
+        })
+    return zeilen
+
+
+def find_templates(directory: str | Path, pattern: str = "*.xlsx") -> list[Path]:
+    """Findet alle Excel-Vorlagen im Verzeichnis (rekursiv), temporäre Office-Dateien (~$) werden ignoriert"""
+    return sorted(path for path in Path(directory).rglob(pattern) if not path.name.startswith("~$"))
+
+
+def run_batch(files: list[str | Path], workers: Optional[int] = None) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """
+    Berechnet alle Vorlagen parallel in einem ProcessPoolExecutor.
+
+    Args:
+        files: Pfade der Excel-Vorlagen
+        workers: Anzahl Worker-Prozesse (None: Anzahl CPUs)
+
+    Returns:
+        Tuple mit (Ergebnistabelle in der Reihenfolge von files, Statistik)
+    """
+    start = time.perf_counter()
+    ergebnisse: dict[str, list[dict[str, Any]]] = {}
+    files = [str(file) for file in files]
+
+    if files:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+            futures = {executor.submit(run_file, file): file for file in files}
+            for future in as_completed(futures):
+                file = futures[future]
+                try:
+                    ergebnisse[file] = future.result()
+                except Exception as e:
+                    # Abbruch des Worker-Prozesses selbst (z.B. BrokenProcessPool)
+                    ergebnisse[file] = [{"Datei": Path(file).name, "Fehler": traceback_detail.get_exception_message(e)}]
+
+    dauer = time.perf_counter() - start
+    zeilen = [zeile for file in files for zeile in ergebnisse[file]]
+    tabelle = pd.DataFrame(zeilen, columns=ERGEBNIS_SPALTEN)
+
+    latenzen = [ergebnisse[file][0].get("Laufzeit") for file in files]
+    latenzen = sorted(latenz for latenz in latenzen if latenz is not None)
+    fehler = sum(1 for file in files if ergebnisse[file][0].get("Fehler"))
+    statistik = {
+        "Dateien": len(files),
+        "Erfolgreich": len(files) - fehler,
+        "Fehlgeschlagen": fehler,
+        "Dauer": dauer,
+        "Durchsatz": len(files) / dauer if dauer > 0 else 0.0,
+        "Latenz Median": statistics.median(latenzen) if latenzen else None,
+        "Latenz P95": latenzen[min(len(latenzen) - 1, int(0.95 * len(latenzen)))] if latenzen else None,
+        "Latenz Max": latenzen[-1] if latenzen else None,
+    }
+    return tabelle, statistik
+
+
+def write_table(tabelle: pd.DataFrame, output_path: str | Path):
+    """Schreibt die Ergebnistabelle als Excel (.xlsx) oder CSV (Semikolon-getrennt wie die Leiterseildaten)"""
+    output_path = Path(output_path)
+    if output_path.suffix.lower() == ".xlsx":
+        tabelle.to_excel(output_path, index=False, engine="openpyxl")
+    else:
+        tabelle.to_csv(output_path, index=False, sep=";")
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Stapelberechnung der Kurzschlusskräfte von Leiterseilen")
+    parser.add_argument("verzeichnis", help="Verzeichnis mit den Excel-Vorlagen")
+    parser.add_argument("-o", "--output", default="ergebnisse_kurzschlusskraefte_leiterseile.csv",
+                        help="Ergebnistabelle (.csv oder .xlsx)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Anzahl Worker-Prozesse")
+    parser.add_argument("-p", "--pattern", default="*.xlsx", help="Dateimuster der Vorlagen")
+    args = parser.parse_args(argv)
+
+    files = find_templates(args.verzeichnis, args.pattern)
+    if not files:
+        sys.stderr.write(f"Keine Vorlagen '{args.pattern}' in {args.verzeichnis} gefunden.\n")
+        return 1
+
+    tabelle, statistik = run_batch(files, workers=args.workers)
+    write_table(tabelle, args.output)
+
+    print(f"Dateien: {statistik['Dateien']}, erfolgreich: {statistik['Erfolgreich']}, "
+          f"fehlgeschlagen: {statistik['Fehlgeschlagen']}")
+    print(f"Dauer: {statistik['Dauer']:.2f} s, Durchsatz: {statistik['Durchsatz']:.1f} Dateien/s")
+    if statistik["Latenz Median"] is not None:
+        print(f"Latenz pro Datei: Median {statistik['Latenz Median'] * 1000:.1f} ms, "
+              f"P95 {statistik['Latenz P95'] * 1000:.1f} ms, Max {statistik['Latenz Max'] * 1000:.1f} ms")
+    for zeile in tabelle[tabelle["Fehler"].notna()].itertuples():
+        print(f"Fehler in {zeile.Datei}: {zeile.Fehler}")
+    print(f"Ergebnisse geschrieben: {args.output}")
+    return 0 if statistik["Fehlgeschlagen"] == 0 else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,16 @@
-﻿from dataclasses import dataclass
-from typing import Optional, Callable
+﻿import copy
+import dataclasses
+import functools
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, fields
+from typing import Any, Optional, Callable, Iterable
+import numpy as np
 import scipy.constants
 from src.calculations import kurzschlusskraefte_leiterseile_berechnungen as bkskls
+from src.calculations import kurzschlusskraefte_leiterseile_berechnungen_vektorisiert as vbkskls
+from src.utils import cache as ergebnis_cache
+from src.utils.leiterseilkatalog import Leiterseilkatalog, SEILDATEN_SPALTEN, get_leiterseilkatalog
 import pandas as pd
 
 class CalculationCancelled(Exception):
@@ -126,7 +135,233 @@ class KurschlusskräfteLeiterseileResult:
             self.F_pi_d = self.F_pi_d / 1000
 
 
+@dataclass(slots=True, frozen=True)
+class KurschlusskräfteLeiterseilePreparedCalculation:
+    """
+    Vorbereitete Berechnung (invariante Stufe): Alle von F_st unabhängigen Grössen eines Eingabesatzes.
+    Wird einmal pro Eingabesatz berechnet und von der Einzelberechnung (F_st_20, F_st_80), der Parameterstudie und
+    Batch-Studien als Ausgangspunkt für die variable Stufe (pro F_st) wiederverwendet.
+    """
+    # Berechnungsfall (Lookup-Key der Berechnungsmatrix)
+    fall: tuple
+
+    # Schritte 1 - 4
+    l_c: Optional[float]
+    l_eff: Optional[float]
+    l_seil: float  # Seillänge für f_es, N, ζ und C_D (Fall 1.1: l, Fall 3.1: l_eff)
+    m_c: float
+    F_a: float
+    r: float
+    δ_1: float
+
+    # Schritt 19
+    C_F: float
+
+    # Schritte 24 - 25 (Bündelleiter)
+    l_s: float
+    F_pi_d_methode: Optional[str] = None  # None, "ohne_j" oder "mit_j"
+    l_bündel: Optional[float] = None  # Bezugslänge für ε_st, ε_pi und ν_e: l_s, sonst l_eff, sonst l_c
+    ν_1: Optional[float] = None
+    τ: Optional[float] = None
+    γ: Optional[float] = None
+    t_pi: Optional[float] = None
+    ν_2: Optional[float] = None
+    ν_3: Optional[float] = None
+    F_v: Optional[float] = None
+
+    def apply_to(self, result: KurschlusskräfteLeiterseileResult):
+        """Überträgt die invarianten Grössen in ein Resultat der variablen Stufe"""
+        result.l_c = self.l_c
+        result.l_eff = self.l_eff
+        result.m_c = self.m_c
+        result.F_a = self.F_a
+        result.r = self.r
+        result.δ_1 = self.δ_1
+        result.C_F = self.C_F
+        result.l_s = self.l_s
+        if self.F_pi_d_methode == "mit_j":
+            result.ν_1 = self.ν_1
+            result.τ = self.τ
+            result.γ = self.γ
+            result.t_pi = self.t_pi
+            result.ν_2 = self.ν_2
+            result.ν_3 = self.ν_3
+            result.F_v = self.F_v
+
+
+@dataclass(slots=True)
+class KurschlusskräfteLeiterseileGrid:
+    """
+    Ergebnis einer zweidimensionalen Parameterstudie (Parameter × F_st).
+    Die Ergebnis-Arrays haben die Form (len(parameter_werte), len(f_st_werte)) und eignen sich direkt für
+    Heatmaps oder Konturdiagramme. Kräfte in kN, b_h und a_min in m, Parameterwerte in Eingabeeinheiten.
+    """
+    parameter: str
+    parameter_werte: np.ndarray
+    f_st_werte: np.ndarray
+    F_td: np.ndarray
+    F_fd: np.ndarray
+    F_pi_d: np.ndarray
+    b_h: np.ndarray
+    a_min: np.ndarray
+
+    def to_dataframe(self) -> pd.DataFrame:
+        """Gibt das Raster im Langformat (eine Zeile pro Zelle) zurück"""
+        parameter_gitter, f_st_gitter = np.meshgrid(self.parameter_werte, self.f_st_werte, indexing="ij")
+        return pd.DataFrame({
+            self.parameter: parameter_gitter.ravel(),
+            "F_st": f_st_gitter.ravel(),
+            "F_td": self.F_td.ravel(),
+            "F_fd": self.F_fd.ravel(),
+            "F_pi_d": self.F_pi_d.ravel(),
+            "b_h": self.b_h.ravel(),
+            "a_min": self.a_min.ravel(),
+        })
+
+
+@dataclass(slots=True, frozen=True)
+class KurschlusskräfteLeiterseileVerteilung:
+    """
+    Verteilung einer unsicheren Eingabegrösse für die Monte-Carlo-Simulation (Werte in Eingabeeinheiten).
+
+    art:
+        "normal": a = Mittelwert, b = Standardabweichung
+        "lognormal": a = Median, b = Standardabweichung des Logarithmus
+        "gleichverteilt": a = Minimum, b = Maximum
+        "dreieck": a = Minimum, b = Modalwert, c = Maximum
+        "fest": a = Wert
+    """
+    art: str
+    a: float
+    b: Optional[float] = None
+    c: Optional[float] = None
+
+    def ziehen(self, rng: np.random.Generator, anzahl: int) -> np.ndarray:
+        """Zieht anzahl Stichproben aus der Verteilung"""
+        if self.art == "normal":
+            return rng.normal(self.a, self.b, anzahl)
+        if self.art == "lognormal":
+            return self.a * np.exp(rng.normal(0.0, self.b, anzahl))
+        if self.art == "gleichverteilt":
+            return rng.uniform(self.a, self.b, anzahl)
+        if self.art == "dreieck":
+            return rng.triangular(self.a, self.b, self.c, anzahl)
+        if self.art == "fest":
+            return np.full(anzahl, float(self.a))
+        raise ValueError(f"Unbekannte Verteilung '{self.art}'.")
+
+
+@dataclass(slots=True)
+class KurschlusskräfteLeiterseileMonteCarloResult:
+    """
+    Ergebnis der Monte-Carlo-Simulation eines Lastfalls.
+    statistik: Zeilen F_td, F_fd, F_pi_d (kN), b_h und a_min (m) mit Mittelwert, Standardabweichung, Perzentilen
+    und, falls ein Grenzwert angegeben ist, der Überschreitungswahrscheinlichkeit (a_min: Unterschreitung).
+    stichproben: Gezogene Eingaben und Ergebnisse pro Stichprobe (nur wenn angefordert)
+    """
+    lastfall: str
+    anzahl: int
+    statistik: pd.DataFrame
+    stichproben: Optional[pd.DataFrame] = None
+
+
 class KurschlusskräfteLeiterseileMediator:
+    # Beschreibung der Fallunterscheidungen (Indikatoren von _sweep_indikatoren) für die Regime-Karte
+    INDIKATOR_BESCHREIBUNG: dict[str, str] = {
+        "E_eff": "Gleichung (26): F_st / (n * A_s) = σ_fin",
+        "δ_end": "Gleichung (29): T_k1 / T_res = 0.5",
+        "φ": "Gleichung (32), (35): T_k1 = T_res / 4",
+        "χ_δ_end": "Gleichung (31): δ_end = 90°",
+        "χ_0.766": "Gleichung (30): χ = 0.766",
+        "χ_-0.985": "Gleichung (30): χ = -0.985",
+        "b_h": "Gleichung (44, 45): δ_max = δ_1 (abgespannt) bzw. δ_max = 90° (aufgelegt)",
+        "j": "Gleichung (59 - 64): j = 1",
+    }
+
+    # Eingabewerte, die nur in der variablen Stufe verwendet werden und elementweise als Arrays vorliegen dürfen
+    VARIABLE_EINGABEN: tuple[str, ...] = ("F_st_20", "F_st_80", "S", "E", "t_k", "c_th", "A_s")
+
+    # Direkte Abhängigkeiten der Ergebnisgrössen der Fälle 1.1 und 3.1 (Schritte 1 - 25):
+    # Ergebnisgrösse -> (Eingabewerte, vorgelagerte Ergebnisgrössen).
+    # "F_st" steht für die statische Seilzugkraft des Lastfalls (F_st_20 bzw. F_st_80), "F_pi_d_methode" für die
+    # Auswahl der Methode von Schritt 25. Eingabewerte, die hier nicht vorkommen (z.B. Fallunterscheidung,
+    # Schlaufengeometrie), betreffen alle Ergebnisgrössen.
+    ERGEBNIS_ABHÄNGIGKEITEN: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+        # Invariante Stufe
+        "l_c": (("l", "l_i"), ()),
+        "l_eff": (("l", "l_h_f"), ()),
+        "m_c": (("m_c", "n", "l"), ("l_c",)),
+        "F_a": (("standardkurzschlussstroeme", "l", "a"), ("l_c", "l_eff")),
+        "r": (("n", "m_s"), ("F_a", "m_c")),
+        "δ_1": ((), ("r",)),
+        "C_F": ((), ("r",)),
+        "l_s": (("l_s_1", "l_s_2", "l_s_3", "l_s_4", "l_s_5", "l_s_6", "l_s_7", "l_s_8", "l_s_9", "l_s_10"), ()),
+        "F_pi_d_methode": (("a_s", "d", "n"), ("l_s",)),
+        "ν_1": (("standardkurzschlussstroeme", "a_s", "n", "m_s", "d", "f"), ("F_pi_d_methode",)),
+        "τ": (("f", "κ"), ("F_pi_d_methode",)),
+        "γ": (("f",), ("τ",)),
+        "t_pi": (("f",), ("ν_1", "τ", "γ")),
+        "ν_2": (("f",), ("ν_1", "τ", "γ")),
+        "ν_3": (("a_s", "d", "n"), ("F_pi_d_methode",)),
+        "F_v": (("standardkurzschlussstroeme", "a_s", "n"), ("l_c", "l_s", "l_eff", "ν_2", "ν_3")),
+        # Variable Stufe
+        "f_es": (("n", "m_s", "l", "F_st"), ("m_c", "l_eff")),
+        "T": ((), ("f_es",)),
+        "T_res": ((), ("T", "r", "δ_1")),
+        "E_eff": (("E", "n", "A_s", "F_st"), ()),
+        "N": (("S", "l", "n", "A_s"), ("E_eff", "l_eff")),
+        "ζ": (("n", "m_s", "l", "F_st"), ("m_c", "l_eff", "N")),
+        "δ_end": (("t_k",), ("δ_1", "T_res")),
+        "δ_max": ((), ("r", "δ_end")),
+        "φ": (("t_k",), ("T_res", "r", "δ_end")),
+        "ψ": ((), ("φ", "ζ")),
+        "F_td": (("F_st",), ("φ", "ψ")),
+        "ε_ela": (("F_st",), ("N", "F_td")),
+        "ε_th": (("c_th", "standardkurzschlussstroeme", "n", "A_s", "t_k"), ("T_res",)),
+        "C_D": (("l",), ("l_eff", "f_es", "ε_ela", "ε_th")),
+        "f_ed": ((), ("C_D", "C_F", "f_es")),
+        "F_fd": (("F_st",), ("ζ", "δ_max")),
+        "b_h": ((), ("f_ed", "δ_max", "δ_1")),
+        "a_min": (("a",), ("b_h",)),
+        "ε_st": (("F_st", "a_s", "n", "d"), ("l_c", "l_s", "l_eff", "N", "F_pi_d_methode")),
+        "ε_pi": (("a_s", "n", "d"), ("F_v", "l_c", "l_s", "l_eff", "N", "F_pi_d_methode")),
+        "j": ((), ("ε_st", "ε_pi")),
+        "ξ": ((), ("j", "ε_st")),
+        "η": (("n", "a_s", "d"), ("ε_st", "j", "ν_3")),
+        "ν_4": (("a_s", "d"), ("j", "η")),
+        "ν_e": (("standardkurzschlussstroeme", "a_s", "n", "d"),
+                ("j", "N", "l_c", "l_s", "l_eff", "ν_2", "ν_4", "ξ", "η")),
+        "F_pi_d": (("F_st", "a_s", "d"), ("F_td", "l_s", "j", "ν_e", "ε_st", "ξ", "η", "F_pi_d_methode")),
+    }
+
+    # Eingabewerte ohne Einfluss auf die Ergebnisse (nur Beschriftungen)
+    EINGABEN_OHNE_EINFLUSS: tuple[str, ...] = ("temperatur_niedrig", "temperatur_hoch", "leiterseiltyp")
+
+    # Statische Seilzugkraft der Lastfälle
+    LASTFÄLLE: tuple[str, ...] = ("F_st_20", "F_st_80")
+
+    # Unsichere Eingaben der Monte-Carlo-Simulation: Name -> Faktor Eingabeeinheit -> SI
+    MONTE_CARLO_EINGABEN: dict[str, float] = {
+        "S": 1.0,
+        "F_st_20": 10 ** 3,
+        "F_st_80": 10 ** 3,
+        "κ": 1.0,
+        "t_k": 1.0,
+        "m_c": 1.0,
+        "E": 10 ** 6,
+    }
+
+    # Gesuchte Grössen des inversen Lösers (F_st in kN, a und l_s in m) und Zielgrössen (Kräfte in kN, sonst m)
+    INVERSE_VARIABLEN: tuple[str, ...] = ("F_st", "a", "l_s")
+    INVERSE_ZIELE: tuple[str, ...] = ("F_td", "F_fd", "F_pi_d", "b_h", "a_min")
+
+    # Parameter der zweidimensionalen Parameterstudie: Name -> (Eingabefeld, Faktor Eingabeeinheit -> SI)
+    GRID_PARAMETER: dict[str, tuple[str, float]] = {
+        "I_k": ("standardkurzschlussstroeme", 10 ** 3),
+        "l": ("l", 1.0),
+        "t_k": ("t_k", 1.0),
+    }
+
     def __init__(self, inputs: KurschlusskräfteLeiterseileInput):
         self.inputs = inputs
         self.results = KurschlusskräfteLeiterseileResult()
@@ -150,63 +385,183 @@ class KurschlusskräfteLeiterseileMediator:
             ("Aufgelegt", "Nein", "Nein", ""): self.run_calculation_3_1,
             # Weitere Kombinationen hier ergänzen ...
         }
-    
-    def select_and_run_calculation(self) -> dict[str, KurschlusskräfteLeiterseileResult]:
+
+        # Lookup-Dictionary für vektorisierte Berechnungsmethoden (F_st als NumPy-Array) der Parameterstudie
+        self._sweep_matrix: dict[tuple, Callable] = {
+            ("Abgespannt", "Nein", "Nein", None): self.run_sweep_1_1,
+            ("Abgespannt", "Nein", "Nein", ""): self.run_sweep_1_1,
+            ("Aufgelegt", "Nein", "Nein", None): self.run_sweep_3_1,
+            ("Aufgelegt", "Nein", "Nein", ""): self.run_sweep_3_1,
+        }
+
+        # Lookup-Dictionary für die invarianten Stufen (vorbereitete Berechnung)
+        self._preparation_matrix: dict[tuple, Callable] = {
+            ("Abgespannt", "Nein", "Nein", None): self._prepare_1_1,
+            ("Abgespannt", "Nein", "Nein", ""): self._prepare_1_1,
+            ("Aufgelegt", "Nein", "Nein", None): self._prepare_3_1,
+            ("Aufgelegt", "Nein", "Nein", ""): self._prepare_3_1,
+        }
+        # Lookup-Dictionary für die variablen Stufen (ein Lastfall F_st)
+        self._evaluation_matrix: dict[tuple, Callable] = {
+            ("Abgespannt", "Nein", "Nein", None): self._evaluate_1_1,
+            ("Abgespannt", "Nein", "Nein", ""): self._evaluate_1_1,
+            ("Aufgelegt", "Nein", "Nein", None): self._evaluate_3_1,
+            ("Aufgelegt", "Nein", "Nein", ""): self._evaluate_3_1,
+        }
+        # Zwischenspeicher der vorbereiteten Berechnung als Tuple (Eingabe-Key, vorbereitete Berechnung)
+        self._prepared: Optional[tuple[tuple, KurschlusskräfteLeiterseilePreparedCalculation]] = None
+
+    def _calculation_key(self) -> tuple:
         """
-        Wählt die passende Berechnungsmethode basierend auf den Eingabeparametern und führt die Berechnung aus.
-        
+        Erstellt den Lookup-Key für die Berechnungsmatrizen aus den Eingabeparametern.
+
         Returns:
-            Dictionary mit Ergebnissen für F_st_20 und F_st_80
-            
-        Raises:
-            ValueError: Wenn keine passende Berechnungsmethode gefunden wurde
+            Tuple aus Leiterseilbefestigung, Schlaufe in Spannfeldmitte, Höhenunterschied und Schlaufenebene
         """
         # Normalisiere Schlaufenebene-Parameter (None wenn nicht relevant)
         schlaufenebene = self.inputs.schlaufenebene_parallel_senkrecht
         if self.inputs.schlaufe_in_spannfeldmitte == "Nein":
             schlaufenebene = None
-        
-        # Erstelle Lookup-Key
-        key = (
+
+        return (
             self.inputs.leiterseilbefestigung,
             self.inputs.schlaufe_in_spannfeldmitte,
             self.inputs.hoehenunterschied_befestigungspunkte,
             schlaufenebene
         )
+    
+    @classmethod
+    @functools.cache
+    def ergebnis_abhängigkeiten(cls) -> dict[str, frozenset[str]]:
+        """
+        Gibt pro Ergebnisgrösse von KurschlusskräfteLeiterseileResult alle Eingabewerte zurück, von denen sie direkt
+        oder über vorgelagerte Ergebnisgrössen abhängt ("F_st" für die statische Seilzugkraft des Lastfalls).
+        """
+        abhängigkeiten: dict[str, frozenset[str]] = {}
+
+        def auflösen(feld: str) -> frozenset[str]:
+            if feld not in abhängigkeiten:
+                eingaben, felder = cls.ERGEBNIS_ABHÄNGIGKEITEN[feld]
+                abhängigkeiten[feld] = frozenset(eingaben).union(*(auflösen(f) for f in felder))
+            return abhängigkeiten[feld]
+
+        return {feld.name: auflösen(feld.name) for feld in fields(KurschlusskräfteLeiterseileResult)}
+
+    @classmethod
+    def invalidierte_ergebnisse(cls, geänderte_eingaben: Iterable[str], lastfall: str) -> set[str]:
+        """
+        Bestimmt die Ergebnisgrössen eines Lastfalls, die nach einer Änderung der Eingabewerte neu berechnet werden
+        müssen.
+
+        Args:
+            geänderte_eingaben: Namen der geänderten Felder von KurschlusskräfteLeiterseileInput
+            lastfall: "F_st_20" oder "F_st_80"
+
+        Returns:
+            Namen der betroffenen Ergebnisgrössen (leer, wenn das Ergebnis wiederverwendet werden kann)
+        """
+        abhängigkeiten = cls.ergebnis_abhängigkeiten()
+        bekannt = set().union(*abhängigkeiten.values())
+        eingaben = set()
+        for name in geänderte_eingaben:
+            if name in cls.EINGABEN_OHNE_EINFLUSS:
+                continue
+            if name in cls.LASTFÄLLE:
+                if name == lastfall:
+                    eingaben.add("F_st")
+            elif name not in bekannt:
+                # Unbekannte Abhängigkeit: Alle Ergebnisgrössen sind betroffen
+                return set(abhängigkeiten)
+            else:
+                eingaben.add(name)
+        return {feld for feld, feld_eingaben in abhängigkeiten.items() if feld_eingaben & eingaben}
+
+    @classmethod
+    def sweep_invalidiert(cls, geänderte_eingaben: Iterable[str]) -> bool:
+        """
+        Gibt zurück, ob die Parameterstudie über F_st nach einer Änderung der Eingabewerte neu berechnet werden muss.
+        Die Parameterstudie hängt weder von F_st_20 und F_st_80 noch von den Beschriftungen ab.
+        """
+        return any(name not in cls.LASTFÄLLE and name not in cls.EINGABEN_OHNE_EINFLUSS
+                   for name in geänderte_eingaben)
+
+    def select_and_run_calculation(self) -> dict[str, KurschlusskräfteLeiterseileResult]:
+        """
+        Wählt die passende Berechnungsmethode basierend auf den Eingabeparametern und führt die Berechnung aus.
+        
+        Returns:
+            Dictionary mit Ergebnissen für F_st_20 und F_st_80
+            
+        Raises:
+            ValueError: Wenn keine passende Berechnungsmethode gefunden wurde
+        """
+        # Erstelle Lookup-Key
+        key = self._calculation_key()
         
         # Suche passende Berechnungsmethode
         calculation_method = self._calculation_matrix.get(key)
         
         if calculation_method is None:
-            raise ValueError(
-                f"❌ Keine Berechnungsmethode für diese Konfiguration gefunden:\n"
-                f"  • Leiterseilbefestigung: {self.inputs.leiterseilbefestigung}\n"
-                f"  • Schlaufe in Spannfeldmitte: {self.inputs.schlaufe_in_spannfeldmitte}\n"
-                f"  • Höhenunterschied >25%: {self.inputs.hoehenunterschied_befestigungspunkte}\n"
-                f"  • Schlaufenebene: {self.inputs.schlaufenebene_parallel_senkrecht or 'nicht relevant'}"
-            )
+            raise self._missing_calculation_method_error()
 
         # Führe die ausgewählte Berechnung durch
         return calculation_method()
 
-    def mode_call(self, func_name, *args, **kwargs):
-        # 1. Modus ermitteln
-        mode = getattr(self, "mode", "normal")
+    def _missing_calculation_method_error(self) -> ValueError:
+        """Erstellt die Fehlermeldung für Konfigurationen ohne Berechnungsmethode"""
+        return ValueError(
+            f"❌ Keine Berechnungsmethode für diese Konfiguration gefunden:\n"
+            f"  • Leiterseilbefestigung: {self.inputs.leiterseilbefestigung}\n"
+            f"  • Schlaufe in Spannfeldmitte: {self.inputs.schlaufe_in_spannfeldmitte}\n"
+            f"  • Höhenunterschied >25%: {self.inputs.hoehenunterschied_befestigungspunkte}\n"
+            f"  • Schlaufenebene: {self.inputs.schlaufenebene_parallel_senkrecht or 'nicht relevant'}"
+        )
+
+    def evaluate(self, F_st: float, mode: Optional[str] = None) -> KurschlusskräfteLeiterseileResult:
+        """
+        Berechnet einen einzelnen Lastfall für die statische Seilzugkraft F_st, ohne die Eingabewerte zu verändern.
+        Die von F_st unabhängigen Grössen werden aus der vorbereiteten Berechnung übernommen. Da weder self.inputs
+        noch self.mode verändert werden, kann der Mediator von mehreren Threads gleichzeitig verwendet werden.
+
+        Args:
+            F_st: Statische Seilzugkraft in N
+            mode: Lösungsmodus ("normal" oder "loop-mode"), Standard ist self.mode
+
+        Returns:
+            Ergebnis des Lastfalls (F_td, F_fd und F_pi_d in kN)
+
+        Raises:
+            ValueError: Wenn keine passende Berechnungsmethode gefunden wurde
+            NotImplementedError: Wenn der Berechnungsfall noch nicht implementiert ist
+        """
+        key = self._calculation_key()
+        evaluation_method = self._evaluation_matrix.get(key)
+
+        if evaluation_method is None:
+            if key in self._calculation_matrix:
+                raise NotImplementedError(f"Einzelner Lastfall für diese Konfiguration noch nicht implementiert: {key}")
+            raise self._missing_calculation_method_error()
+
+        return evaluation_method(F_st, self.prepare_calculation(), mode or self.mode)
+
+    def mode_call(self, func_name, *args, mode: Optional[str] = None, **kwargs):
+        # 1. Modus ermitteln (expliziter Modus vor dem Modus des Mediators)
+        mode = mode or getattr(self, "mode", "normal")
 
         try:
             # 2. Pfad wählen
             if mode == "loop-mode":
-                # Direkt zur numerischen Funktion
-                func = getattr(bkskls, f"{func_name}_numerisch")
+                # Direkt zur geschlossenen Lösung, sonst zur numerischen Funktion
+                func = getattr(bkskls, f"{func_name}_analytisch", None) or getattr(bkskls, f"{func_name}_numerisch")
                 return func(*args, **kwargs)
             else:
-                # Standard-Kaskade: Symbolisch probieren, sonst numerisch
+                # Standard-Kaskade: Exakte Lösungsstufe (vorkompiliert, mit numerischer Gegenprüfung), sonst numerisch
                 try:
                     func_sym = getattr(bkskls, f"{func_name}_symbolisch")
                     return func_sym(*args, **kwargs)
                 except (AttributeError, Exception):
-                    # Fallback auf numerisch, falls symbolisch nicht geht
-                    func_num = getattr(bkskls, f"{func_name}_numerisch")
+                    # Fallback auf numerisch, falls die exakte Lösungsstufe nicht geht
+                    func_num = getattr(bkskls, f"{func_name}_analytisch", None) or getattr(bkskls, f"{func_name}_numerisch")
                     return func_num(*args, **kwargs)
 
         except Exception as e:
@@ -215,52 +570,846 @@ class KurschlusskräfteLeiterseileMediator:
             # Modus die Engine gerade war, bevor wir den Fehler weiterwerfen.
             raise RuntimeError(f"Fehler in '{func_name}' während {mode}: {str(e)}") from e
 
+    def _preparation_key(self) -> tuple:
+        """
+        Erstellt den Key des Zwischenspeichers der vorbereiteten Berechnung aus allen Eingabewerten ausser denjenigen,
+        die nur in der variablen Stufe verwendet werden (VARIABLE_EINGABEN).
+        """
+        return tuple(getattr(self.inputs, name) for name in self.inputs.__slots__ if name not in self.VARIABLE_EINGABEN)
+
+    def prepare_calculation(self) -> KurschlusskräfteLeiterseilePreparedCalculation:
+        """
+        Invariante Stufe: Berechnet die von F_st unabhängigen Grössen des aktuellen Eingabesatzes.
+        Die vorbereitete Berechnung wird zwischengespeichert und nur neu berechnet, wenn sich ein Eingabewert ausser
+        F_st_20 und F_st_80 ändert.
+
+        Returns:
+            Vorbereitete Berechnung für die variable Stufe
+        """
+        key = self._preparation_key()
+        prepared = self._prepared
+        if prepared is not None and prepared[0] == key:
+            return prepared[1]
+
+        preparation_method = self._preparation_matrix.get(self._calculation_key())
+        if preparation_method is None:
+            raise NotImplementedError(
+                f"Keine vorbereitete Berechnung für diese Konfiguration vorhanden: {self._calculation_key()}")
+
+        prepared_calculation = preparation_method()
+        self._prepared = (key, prepared_calculation)
+        return prepared_calculation
+
+    def _prepare_1_1(self) -> KurschlusskräfteLeiterseilePreparedCalculation:
+        """
+        Invariante Stufe Fall 1.1: Abgespannte Leiterseile ohne Schlaufe, ohne Höhenunterschied
+        """
+        # Schritt 1: Effektive Seillänge
+        l_c = bkskls.l_c(self.inputs.l, self.inputs.l_i)
+
+        # Schritt 1a: Massenbelag konzentrischer Lasten
+        m_c = bkskls.m_c(self.inputs.m_c, self.inputs.n, l_c)
+
+        # Schritt 2: Charakteristischer elektromagnetischer Kraftbelag
+        F_a = bkskls.F_a(self.mu0, self.inputs.standardkurzschlussstroeme, self.inputs.l, l_c, self.inputs.a)
+
+        return self._prepare_gemeinsam(l_c=l_c, l_eff=None, l_seil=self.inputs.l, m_c=m_c, F_a=F_a)
+
+    def _prepare_3_1(self) -> KurschlusskräfteLeiterseilePreparedCalculation:
+        """
+        Invariante Stufe Fall 3.1: Aufgelegte Leiterseile ohne Schlaufe
+        """
+        # Schritt 1: Effektive Seillänge
+        l_eff = bkskls.l_eff(self.inputs.l, self.inputs.l_h_f)
+
+        # Schritt 1a: Massenbelag konzentrischer Lasten
+        m_c = bkskls.m_c(self.inputs.m_c, self.inputs.n, self.inputs.l)
+
+        # Schritt 2: Charakteristischer elektromagnetischer Kraftbelag
+        F_a = bkskls.F_a(self.mu0, self.inputs.standardkurzschlussstroeme, l_eff, l_eff, self.inputs.a)
+
+        return self._prepare_gemeinsam(l_c=None, l_eff=l_eff, l_seil=l_eff, m_c=m_c, F_a=F_a)
+
+    def _prepare_gemeinsam(self, l_c: Optional[float], l_eff: Optional[float], l_seil: float, m_c: float,
+                           F_a: float) -> KurschlusskräfteLeiterseilePreparedCalculation:
+        """
+        Gemeinsamer Teil der invarianten Stufe der Fälle 1.1 und 3.1 (Schritte 3, 4, 19, 24 und die von F_st
+        unabhängigen Grössen von Schritt 25)
+        """
+        # Schritt 3: Verhältnis r
+        r = bkskls.r(F_a, self.inputs.n, self.inputs.m_s + m_c, self.g)
+
+        # Schritt 4: Richtung δ_1
+        δ_1 = bkskls.δ_1(r)
+
+        # Schritt 19: Faktor Durchhangvergrößerung C_F
+        C_F = bkskls.C_F(r)
+
+        # Schritt 24: Abstände Abstandshalter
+        l_s = bkskls.l_s(self.inputs.l_s_1, self.inputs.l_s_2, self.inputs.l_s_3, self.inputs.l_s_4, self.inputs.l_s_5,
+                         self.inputs.l_s_6, self.inputs.l_s_7, self.inputs.l_s_8, self.inputs.l_s_9, self.inputs.l_s_10)
+
+        bündel = {}
+
+        # Schritt 25: Bündel-Seilzugkraft F_pi_d (von F_st unabhängige Grössen inkl. T_pi und ν_2)
+        a_s, d, n = self.inputs.a_s, self.inputs.d, self.inputs.n
+        if a_s not in (None, 0) and d not in (None, 0) and n not in (None, 0):
+            if (a_s / d <= 2.0 and l_s >= 50 * a_s and n > 1) or (a_s / d <= 2.5 and l_s >= 70 * a_s and n > 1):
+                bündel["F_pi_d_methode"] = "ohne_j"
+            elif n > 1:
+                I_k = self.inputs.standardkurzschlussstroeme
+                ν_1 = bkskls.ν_1(self.mu0, I_k, a_s, n, self.inputs.m_s, d, self.inputs.f)
+                τ = bkskls.τ(self.inputs.f, self.inputs.κ)
+                γ = bkskls.γ(self.inputs.f, τ)
+                t_pi, ν_2 = bkskls.T_pi_and_ν_2(ν_1, self.inputs.f, τ, γ)
+                ν_3 = bkskls.ν_3(a_s, d, n)
+                F_v = bkskls.F_v(self.mu0, I_k, a_s, l_c, l_s, l_eff, n, ν_2, ν_3)
+
+                # Bezugslänge wie in ε_st, ε_pi und ν_e: l_s, sonst l_eff, sonst l_c
+                if l_s not in (None, 0.0, 0):
+                    l_bündel = l_s
+                elif l_eff not in (None, 0.0, 0):
+                    l_bündel = l_eff
+                else:
+                    l_bündel = l_c
+
+                bündel = dict(F_pi_d_methode="mit_j", l_bündel=l_bündel, ν_1=ν_1, τ=τ, γ=γ, t_pi=t_pi, ν_2=ν_2,
+                              ν_3=ν_3, F_v=F_v)
+
+        return KurschlusskräfteLeiterseilePreparedCalculation(
+            fall=self._calculation_key(), l_c=l_c, l_eff=l_eff, l_seil=l_seil, m_c=m_c, F_a=F_a, r=r, δ_1=δ_1,
+            C_F=C_F, l_s=l_s, **bündel)
+
     def calculate_sweep_f_st_dataframe(self, f_st_min: float = 0.1, f_st_max: float = 35.0, f_st_step: float = 0.01,
-                                       cancel_check: Optional[Callable[[], bool]] = None):
+                                       cancel_check: Optional[Callable[[], bool]] = None, vektorisiert: bool = True,
+                                       workers: int = 1, mit_regime: bool = False):
 
         # Berechnet die Kurzschlusskräfte für eine Reihe von F_st-Werten und gibt einen DataFrame zurück.
-        if f_st_step <= 0:
-            raise ValueError("f_st_step muss groesser als 0 sein.")
+        # Mit mit_regime wird zusätzlich die Regime-Karte berechnet und in attrs["regime"] abgelegt.
+        # Mit workers > 1 wird der F_st-Bereich in Blöcken auf Worker-Prozesse verteilt.
+        f_st_values = self._f_st_raster(f_st_min, f_st_max, f_st_step)
+        if workers > 1:
+            werte = self._sweep_arrays_parallel(f_st_values, workers=workers, cancel_check=cancel_check,
+                                                vektorisiert=vektorisiert)
+        else:
+            werte = self._sweep_arrays(f_st_values, cancel_check=cancel_check, vektorisiert=vektorisiert)
+
+        sweep_df = pd.DataFrame({"F_st": f_st_values, "F_td": werte["F_td"], "F_fd": werte["F_fd"],
+                                 "F_pi_d": werte["F_pi_d"]})
+        if mit_regime:
+            sweep_df.attrs["regime"] = self._regime_attrs(
+                self.calculate_regime_map(f_st_min, f_st_max) if vektorisiert else None)
+        return sweep_df
+
+    def calculate_sweep_f_st_adaptive(self, f_st_min: float = 0.1, f_st_max: float = 35.0, rtol: float = 1e-3,
+                                      atol: float = 1e-3, f_st_step_min: float = 0.01, anfangspunkte: int = 33,
+                                      max_punkte: int = 5000, cancel_check: Optional[Callable[[], bool]] = None,
+                                      vektorisiert: bool = True) -> pd.DataFrame:
+        """
+        Adaptive Parameterstudie über F_st: Startet mit einem groben Raster und halbiert Intervalle, solange die
+        lineare Interpolation in der Intervallmitte die Toleranz verletzt oder ein Zweigwechsel einer
+        Fallunterscheidung (siehe _sweep_indikatoren) im Intervall liegt. Zweigwechsel werden bis auf f_st_step_min
+        eingegrenzt.
+
+        Args:
+            f_st_min: Kleinste statische Seilzugkraft in kN
+            f_st_max: Grösste statische Seilzugkraft in kN
+            rtol: Relative Interpolationstoleranz für F_td, F_fd und F_pi_d
+            atol: Absolute Interpolationstoleranz für F_td, F_fd und F_pi_d in kN
+            f_st_step_min: Kleinste Intervallbreite in kN
+            anfangspunkte: Anzahl Punkte des groben Startrasters
+            max_punkte: Maximale Anzahl berechneter Punkte
+            cancel_check: Abbruchprüfung, wird vor jeder Verfeinerungsstufe aufgerufen
+            vektorisiert: Vektorisierte Berechnungsmethode verwenden, sofern vorhanden
+
+        Returns:
+            DataFrame mit den Spalten F_st, F_td, F_fd und F_pi_d in kN, aufsteigend nach F_st sortiert. Die
+            Regime-Karte steht in attrs["regime"] (siehe _regime_attrs).
+        """
+        if f_st_step_min <= 0:
+            raise ValueError("f_st_step_min muss groesser als 0 sein.")
         if f_st_max < f_st_min:
             raise ValueError("f_st_max muss groesser oder gleich f_st_min sein.")
 
-        rows = []
-        original_f_st_20 = self.inputs.F_st_20
-        original_f_st_80 = self.inputs.F_st_80
+        spalten = ("F_td", "F_fd", "F_pi_d")
+        f_st_values = np.linspace(f_st_min, f_st_max, max(2, anfangspunkte))
+
+        # Punkte beidseitig der Zweigwechsel aus der Regime-Karte einfügen
+        regime = self.calculate_regime_map(f_st_min, f_st_max) if vektorisiert else None
+        if regime is not None and not regime.empty:
+            f_st_values = np.unique(np.concatenate([f_st_values, regime["F_st_links"], regime["F_st_rechts"]]))
+        werte = self._sweep_arrays(f_st_values, cancel_check=cancel_check, vektorisiert=vektorisiert)
+
+        # Aktive Intervalle als Indizes der linken Intervallgrenze im sortierten Punktesatz
+        aktive_links = np.arange(len(f_st_values) - 1)
+        while aktive_links.size and len(f_st_values) < max_punkte:
+            x_links, x_rechts = f_st_values[aktive_links], f_st_values[aktive_links + 1]
+            teilbar = (x_rechts - x_links) > f_st_step_min
+            aktive_links, x_links, x_rechts = aktive_links[teilbar], x_links[teilbar], x_rechts[teilbar]
+            if not aktive_links.size:
+                break
+            aktive_links, x_links, x_rechts = (aktive_links[:max_punkte - len(f_st_values)],
+                                                x_links[:max_punkte - len(f_st_values)],
+                                                x_rechts[:max_punkte - len(f_st_values)])
+
+            x_mitte = (x_links + x_rechts) / 2
+            werte_mitte = self._sweep_arrays(x_mitte, cancel_check=cancel_check, vektorisiert=vektorisiert)
+
+            # Verfeinerung bei Verletzung der Interpolationstoleranz oder Wechsel der definierten Werte (NaN)
+            verfeinern = np.zeros(x_mitte.shape, dtype=bool)
+            for spalte in spalten:
+                y_links, y_rechts = werte[spalte][aktive_links], werte[spalte][aktive_links + 1]
+                y_mitte = werte_mitte[spalte]
+                nan_muster = np.isnan(y_links) | np.isnan(y_rechts) | np.isnan(y_mitte)
+                alle_nan = np.isnan(y_links) & np.isnan(y_rechts) & np.isnan(y_mitte)
+                with np.errstate(invalid="ignore"):
+                    fehler = np.abs(y_mitte - ((y_links + y_rechts) / 2))
+                    verfeinern |= ~nan_muster & (fehler > (atol + (rtol * np.abs(y_mitte))))
+                verfeinern |= nan_muster & ~alle_nan
+
+            # Verfeinerung bei Zweigwechsel
+            if werte["zweige"] is not None:
+                zweig_links, zweig_rechts = werte["zweige"][aktive_links], werte["zweige"][aktive_links + 1]
+                verfeinern |= (zweig_links != werte_mitte["zweige"]) | (zweig_rechts != werte_mitte["zweige"])
+
+            # Mittelpunkte einfügen (alle berechneten Punkte werden übernommen)
+            reihenfolge = np.argsort(np.concatenate([f_st_values, x_mitte]), kind="stable")
+            f_st_values = np.concatenate([f_st_values, x_mitte])[reihenfolge]
+            for key in (*spalten, "zweige"):
+                if werte[key] is not None:
+                    werte[key] = np.concatenate([werte[key], werte_mitte[key]])[reihenfolge]
+
+            # Beide Hälften der verfeinerten Intervalle bleiben aktiv
+            position = np.searchsorted(f_st_values, x_mitte[verfeinern])
+            aktive_links = np.sort(np.concatenate([position - 1, position]))
+
+        sweep_df = pd.DataFrame({"F_st": f_st_values, "F_td": werte["F_td"], "F_fd": werte["F_fd"],
+                                 "F_pi_d": werte["F_pi_d"]})
+        sweep_df.attrs["regime"] = self._regime_attrs(regime)
+        return sweep_df
+
+    def calculate_grid(self, parameter: str, parameter_werte, f_st_min: float = 0.1, f_st_max: float = 35.0,
+                       f_st_step: float = 0.01, chunk_grösse: int = 2 ** 16, dtype=np.float64,
+                       cancel_check: Optional[Callable[[], bool]] = None) -> KurschlusskräfteLeiterseileGrid:
+        """
+        Zweidimensionale Parameterstudie: Berechnet F_td, F_fd, F_pi_d, b_h und a_min für alle Kombinationen aus
+        einem zweiten Parameter (I_k, l oder t_k) und F_st.
+        Pro Parameterwert wird die invariante Stufe einmal vorbereitet, die F_st-Werte werden in Blöcken von
+        höchstens chunk_grösse Zellen vektorisiert berechnet. Der Speicherbedarf der Zwischenergebnisse ist damit
+        unabhängig von der Rastergrösse. Zwischen den Blöcken wird cancel_check geprüft.
+
+        Args:
+            parameter: Name des Parameters (siehe GRID_PARAMETER)
+            parameter_werte: Werte des Parameters in Eingabeeinheiten (I_k in kA, l in m, t_k in s)
+            f_st_min: Kleinste statische Seilzugkraft in kN
+            f_st_max: Grösste statische Seilzugkraft in kN
+            f_st_step: Schrittweite von F_st in kN
+            chunk_grösse: Maximale Anzahl Zellen pro Block
+            dtype: Datentyp der Ergebnis-Arrays (z.B. np.float32 für sehr grosse Raster)
+            cancel_check: Rückgabe True bricht die Berechnung mit CalculationCancelled ab
 
-        try:
-            self.mode = "loop-mode"
-            steps = int(round((f_st_max - f_st_min) / f_st_step))
-            for i in range(steps + 1):
+        Returns:
+            KurschlusskräfteLeiterseileGrid
+        """
+        if parameter not in self.GRID_PARAMETER:
+            raise ValueError(f"Unbekannter Parameter '{parameter}', möglich sind: {', '.join(self.GRID_PARAMETER)}.")
+        if chunk_grösse < 1:
+            raise ValueError("chunk_grösse muss groesser als 0 sein.")
+        if self._sweep_matrix.get(self._calculation_key()) is None:
+            raise self._missing_calculation_method_error()
+
+        feld, faktor = self.GRID_PARAMETER[parameter]
+        parameter_werte = np.asarray(parameter_werte, dtype=float).ravel()
+        f_st_values = self._f_st_raster(f_st_min, f_st_max, f_st_step)
+        form = (parameter_werte.size, f_st_values.size)
+        spalten = ("F_td", "F_fd", "F_pi_d", "b_h", "a_min")
+        ergebnisse = {spalte: np.full(form, np.nan, dtype=dtype) for spalte in spalten}
+
+        for zeile, parameter_wert in enumerate(parameter_werte):
+            # Eigener Mediator pro Parameterwert, damit die Eingabewerte und die vorbereitete Berechnung
+            # dieses Mediators unverändert bleiben
+            inputs = copy.copy(self.inputs)
+            setattr(inputs, feld, float(parameter_wert) * faktor)
+            mediator = KurschlusskräfteLeiterseileMediator(inputs)
+            sweep_method = mediator._sweep_matrix[mediator._calculation_key()]
+
+            for start in range(0, f_st_values.size, chunk_grösse):
                 if cancel_check and cancel_check():
                     raise CalculationCancelled("Berechnung abgebrochen.")
-                f_st_value = f_st_min + (i * f_st_step)
-                f_st_internal = f_st_value * 10 ** 3
-                self.inputs.F_st_20 = f_st_internal
-                #self.inputs.F_st_80 = f_st_internal
-                calc_result = self.select_and_run_calculation()
-
-                # Die auskommentierten Zeilen sind nicht notwendig, da F_st_20 und F_st_80 in der Schleife gleich sind.
-                result_20 = calc_result.get("F_st_20")
-                #result_80 = calc_result.get("F_st_80")
-
-                rows.append({
-                    "F_st": f_st_value,
-                    #"F_st_20": f_st_value,
-                    #"F_st_80": f_st_value,
-                    "F_td": result_20.F_td if result_20 else None,
-                    "F_fd": result_20.F_fd if result_20 else None,
-                    "F_pi_d": result_20.F_pi_d if result_20 else None,
-                    #"F_td_80": result_80.F_td if result_80 else None,
-                    #"F_fd_80": result_80.F_fd if result_80 else None,
-                    #"F_pi_d_80": result_80.F_pi_d if result_80 else None,
-                })
-        finally:
-            self.inputs.F_st_20 = original_f_st_20
-            self.inputs.F_st_80 = original_f_st_80
-            self.mode = "normal"
-
-        return pd.DataFrame(rows)
+                block = slice(start, start + chunk_grösse)
+                sweep_result = sweep_method(f_st_values[block] * 10 ** 3)
+                for spalte in spalten:
+                    werte = sweep_result[spalte] / 1000 if spalte.startswith("F_") else sweep_result[spalte]
+                    ergebnisse[spalte][zeile, block] = werte
+
+        return KurschlusskräfteLeiterseileGrid(parameter=parameter, parameter_werte=parameter_werte,
+                                               f_st_werte=f_st_values, **ergebnisse)
+
+    def calculate_monte_carlo(self, verteilungen: dict[str, KurschlusskräfteLeiterseileVerteilung],
+                              anzahl: int = 10_000, grenzwerte: Optional[dict[str, float]] = None,
+                              perzentile: tuple[float, ...] = (5, 50, 95, 99), seed: Optional[int] = None,
+                              chunk_grösse: int = 2 ** 16, mit_stichproben: bool = False,
+                              cancel_check: Optional[Callable[[], bool]] = None
+                              ) -> dict[str, KurschlusskräfteLeiterseileMonteCarloResult]:
+        """
+        Monte-Carlo-Simulation der unsicheren Eingaben S, F_st_20, F_st_80, κ, t_k, m_c und E für beide Lastfälle.
+        Eingaben ohne Verteilung bleiben auf dem Eingabewert.
+
+        S, F_st, t_k und E werden nur in der variablen Stufe verwendet und elementweise über den vektorisierten Pfad
+        berechnet. m_c und κ gehen in die invariante Stufe ein, die dafür pro Stichprobe vorbereitet wird (siehe
+        _prepare_monte_carlo). Alle Stichproben werden exakt mit den gezogenen Werten berechnet. Bei Bündelleitern mit
+        F_pi_d über j erfordert jeder verschiedene Wert von κ eine Nullstellensuche (T_pi, ν_2), eine stetige
+        Verteilung von κ ist deshalb deutlich langsamer als diskrete oder feste Werte.
+
+        Args:
+            verteilungen: Verteilung pro Eingabe (Name siehe MONTE_CARLO_EINGABEN, Werte in Eingabeeinheiten)
+            anzahl: Anzahl Stichproben
+            grenzwerte: Grenzwert pro Ergebnis (F_td, F_fd, F_pi_d in kN, b_h und a_min in m)
+            perzentile: Auszuwertende Perzentile in %
+            seed: Startwert des Zufallsgenerators für reproduzierbare Ergebnisse
+            chunk_grösse: Maximale Anzahl Stichproben pro vektorisiertem Block
+            mit_stichproben: Stichproben im Ergebnis zurückgeben
+            cancel_check: Rückgabe True bricht die Berechnung mit CalculationCancelled ab
+
+        Returns:
+            Dictionary mit den Ergebnissen für F_st_20 und F_st_80
+        """
+        unbekannt = set(verteilungen) - set(self.MONTE_CARLO_EINGABEN)
+        if unbekannt:
+            raise ValueError(f"Unbekannte Eingaben für die Monte-Carlo-Simulation: {', '.join(sorted(unbekannt))}.")
+        if anzahl < 1:
+            raise ValueError("anzahl muss groesser als 0 sein.")
+        if self._sweep_matrix.get(self._calculation_key()) is None:
+            raise self._missing_calculation_method_error()
+
+        rng = np.random.default_rng(seed)
+        grenzwerte = grenzwerte or {}
+
+        # Stichproben in SI-Einheiten, fehlende Verteilungen mit dem Eingabewert
+        stichproben: dict[str, np.ndarray] = {}
+        for name, faktor in self.MONTE_CARLO_EINGABEN.items():
+            if name in verteilungen:
+                stichproben[name] = verteilungen[name].ziehen(rng, anzahl) * faktor
+            else:
+                wert = getattr(self.inputs, name)
+                stichproben[name] = np.full(anzahl, np.nan if wert is None else float(wert))
+
+        # Invariante Stufe mit den Stichproben von m_c und κ
+        inputs = copy.copy(self.inputs)
+        mediator = KurschlusskräfteLeiterseileMediator(inputs)
+        prepared = mediator._prepare_monte_carlo(stichproben["m_c"], stichproben["κ"], cancel_check=cancel_check)
+        sweep_method = mediator._sweep_matrix[mediator._calculation_key()]
+        stichproben_felder = [feld.name for feld in fields(prepared)
+                              if isinstance(getattr(prepared, feld.name), np.ndarray)]
+
+        spalten = ("F_td", "F_fd", "F_pi_d", "b_h", "a_min")
+        ergebnisse: dict[str, KurschlusskräfteLeiterseileMonteCarloResult] = {}
+        for lastfall in ("F_st_20", "F_st_80"):
+            werte = {spalte: np.full(anzahl, np.nan) for spalte in spalten}
+            for start in range(0, anzahl, chunk_grösse):
+                if cancel_check and cancel_check():
+                    raise CalculationCancelled("Berechnung abgebrochen.")
+                index = slice(start, start + chunk_grösse)
+                for name in ("S", "t_k", "E"):
+                    setattr(inputs, name, stichproben[name][index])
+                # Vorbereitete Berechnung des Blocks (die Eingaben der invarianten Stufe bleiben unverändert)
+                mediator._prepared = (mediator._preparation_key(), dataclasses.replace(
+                    prepared, **{name: getattr(prepared, name)[index] for name in stichproben_felder}))
+                sweep_result = sweep_method(stichproben[lastfall][index])
+                for spalte in spalten:
+                    werte[spalte][index] = sweep_result[spalte] / 1000 if spalte.startswith("F_") \
+                        else sweep_result[spalte]
+
+            statistik = self._monte_carlo_statistik(werte, perzentile, grenzwerte)
+            stichproben_df = None
+            if mit_stichproben:
+                eingaben = {name: stichproben[name] / faktor for name, faktor in self.MONTE_CARLO_EINGABEN.items()
+                            if name in ("S", "κ", "t_k", "m_c", "E", lastfall)}
+                stichproben_df = pd.DataFrame({**eingaben, **werte})
+            ergebnisse[lastfall] = KurschlusskräfteLeiterseileMonteCarloResult(
+                lastfall=lastfall, anzahl=anzahl, statistik=statistik, stichproben=stichproben_df)
+        return ergebnisse
+
+    def _prepare_monte_carlo(self, m_c: np.ndarray, κ: np.ndarray,
+                             cancel_check: Optional[Callable[[], bool]] = None
+                             ) -> KurschlusskräfteLeiterseilePreparedCalculation:
+        """
+        Invariante Stufe mit Stichproben von m_c und κ (NaN: nicht angegeben). Die von m_c abhängigen Grössen
+        (Schritte 1a, 3, 4 und 19) werden elementweise berechnet, die von κ abhängigen Grössen von Schritt 25
+        (τ, γ, T_pi, ν_2 und F_v) einmal pro verschiedenem Wert von κ.
+
+        Returns:
+            Vorbereitete Berechnung, deren Felder m_c, r, δ_1, C_F (und bei F_pi_d mit j τ, γ, t_pi, ν_2, F_v)
+            Arrays mit einem Wert pro Stichprobe sind
+        """
+        prepared = self.prepare_calculation()
+
+        # Schritte 1a, 3, 4 und 19 (Fall 1.1: Bezug auf l_c, Fall 3.1: auf l)
+        m_c = vbkskls.m_c(m_c, self.inputs.n, prepared.l_c if prepared.l_c is not None else self.inputs.l)
+        r = vbkskls.r(prepared.F_a, self.inputs.n, self.inputs.m_s + m_c, self.g)
+        stichproben: dict[str, np.ndarray] = {"m_c": m_c, "r": r, "δ_1": vbkskls.δ_1(r), "C_F": vbkskls.C_F(r)}
+
+        # Schritt 25: Von κ abhängige Grössen (Nullstellensuche für T_pi und ν_2 pro verschiedenem Wert)
+        if prepared.F_pi_d_methode == "mit_j":
+            I_k, a_s, n = self.inputs.standardkurzschlussstroeme, self.inputs.a_s, self.inputs.n
+            eindeutig, codes = np.unique(κ, return_inverse=True)
+            bündel = np.full((eindeutig.size, 5), np.nan)
+            for k, wert in enumerate(eindeutig):
+                if cancel_check and k % 256 == 0 and cancel_check():
+                    raise CalculationCancelled("Berechnung abgebrochen.")
+                if np.isnan(wert):
+                    continue
+                τ = bkskls.τ(self.inputs.f, float(wert))
+                γ = bkskls.γ(self.inputs.f, τ)
+                t_pi, ν_2 = bkskls.T_pi_and_ν_2(prepared.ν_1, self.inputs.f, τ, γ)
+                F_v = bkskls.F_v(self.mu0, I_k, a_s, prepared.l_c, prepared.l_s, prepared.l_eff, n, ν_2,
+                                 prepared.ν_3)
+                bündel[k] = (τ, γ, t_pi, ν_2, F_v)
+            for spalte, name in enumerate(("τ", "γ", "t_pi", "ν_2", "F_v")):
+                stichproben[name] = bündel[codes.ravel(), spalte]
+
+        return dataclasses.replace(prepared, **stichproben)
+
+    @staticmethod
+    def _monte_carlo_statistik(werte: dict[str, np.ndarray], perzentile: tuple[float, ...],
+                               grenzwerte: dict[str, float]) -> pd.DataFrame:
+        """Statistik der Monte-Carlo-Ergebnisse (NaN-Werte werden ignoriert)"""
+        zeilen = []
+        for spalte, stichprobe in werte.items():
+            gültig = stichprobe[~np.isnan(stichprobe)]
+            zeile = {"Grösse": spalte, "Anzahl gültig": gültig.size,
+                     "Mittelwert": np.mean(gültig) if gültig.size else np.nan,
+                     "Standardabweichung": np.std(gültig) if gültig.size else np.nan}
+            for p, wert in zip(perzentile, np.percentile(gültig, perzentile) if gültig.size
+                               else np.full(len(perzentile), np.nan)):
+                zeile[f"P{p:g}"] = wert
+            grenzwert = grenzwerte.get(spalte)
+            zeile["Grenzwert"] = grenzwert
+            if grenzwert is not None and gültig.size:
+                # a_min ist ein Mindestabstand: massgebend ist die Unterschreitung
+                überschritten = gültig < grenzwert if spalte == "a_min" else gültig > grenzwert
+                zeile["Überschreitungswahrscheinlichkeit"] = float(np.mean(überschritten))
+            else:
+                zeile["Überschreitungswahrscheinlichkeit"] = np.nan
+            zeilen.append(zeile)
+        return pd.DataFrame(zeilen).set_index("Grösse")
+
+    def calculate_leiterseil_screening(self, leiterseilkatalog: Optional[Leiterseilkatalog] = None,
+                                       teilleiter: Optional[tuple[int, ...]] = None, sortierung: str = "F_massg",
+                                       a_min_grenze: float = 0.0,
+                                       cancel_check: Optional[Callable[[], bool]] = None) -> pd.DataFrame:
+        """
+        Leiterseilauswahl: Berechnet das Spannfeld für alle Leiterseile des Katalogs (optional für mehrere Anzahlen
+        Teilleiter) bei sonst unveränderten Eingaben. Pro Kombination wird die invariante Stufe vorbereitet und beide
+        Lastfälle F_st_20 und F_st_80 werden in einem vektorisierten Durchlauf berechnet. Leiterseile mit
+        unvollständigen Seildaten werden übersprungen.
+
+        Args:
+            leiterseilkatalog: Leiterseilkatalog (None: get_leiterseilkatalog())
+            teilleiter: Anzahlen Teilleiter n (None: n der Eingabe), z.B. range(1, 7)
+            sortierung: Spalte für die Rangfolge (aufsteigend, bei a_min absteigend)
+            a_min_grenze: Erforderlicher Mindestabstand in m, Leiterseile mit kleinerem a_min werden nachrangig
+            cancel_check: Rückgabe True bricht die Berechnung mit CalculationCancelled ab
+
+        Returns:
+            DataFrame mit Rang, Bezeichnung, n, den Seildaten in Katalogeinheiten und den massgebenden Ergebnissen
+            beider Lastfälle: F_td, F_fd, F_pi_d und F_massg (Maximum der drei Kräfte) in kN, b_h (Maximum) und
+            a_min (Minimum) in m sowie Zulässig (a_min >= a_min_grenze)
+        """
+        if self._sweep_matrix.get(self._calculation_key()) is None:
+            raise self._missing_calculation_method_error()
+
+        katalog = leiterseilkatalog if leiterseilkatalog is not None else get_leiterseilkatalog()
+        teilleiter = tuple(teilleiter) if teilleiter is not None else (self.inputs.n,)
+        F_st = np.array([self.inputs.F_st_20, self.inputs.F_st_80])
+
+        zeilen = []
+        for bezeichnung in katalog.bezeichnungen_vollständig:
+            seildaten = katalog.seildaten(bezeichnung)
+            for n in teilleiter:
+                if cancel_check and cancel_check():
+                    raise CalculationCancelled("Berechnung abgebrochen.")
+                # Die Kopie durchläuft __post_init__ nicht erneut, die Seildaten werden deshalb in SI gesetzt
+                inputs = copy.copy(self.inputs)
+                inputs.leiterseiltyp = bezeichnung
+                inputs.n = int(n)
+                for feld, wert in katalog.seildaten_si(bezeichnung).items():
+                    setattr(inputs, feld, wert)
+                mediator = KurschlusskräfteLeiterseileMediator(inputs)
+                sweep_result = mediator._sweep_matrix[mediator._calculation_key()](F_st)
+
+                zeile = {"Bezeichnung": bezeichnung, "n": int(n)}
+                zeile.update({spalte: seildaten[feld] for feld, (spalte, _) in SEILDATEN_SPALTEN.items()})
+                kräfte = {spalte: np.max(sweep_result[spalte]) / 1000 if not np.all(np.isnan(sweep_result[spalte]))
+                          else np.nan for spalte in ("F_td", "F_fd", "F_pi_d")}
+                zeile.update(kräfte)
+                zeile["F_massg"] = np.nanmax(list(kräfte.values()))
+                zeile["b_h"] = np.max(sweep_result["b_h"])
+                zeile["a_min"] = np.min(sweep_result["a_min"])
+                zeilen.append(zeile)
+
+        screening = pd.DataFrame(zeilen)
+        if screening.empty:
+            return screening
+        screening["Zulässig"] = screening["a_min"] >= a_min_grenze
+        screening = screening.sort_values(["Zulässig", sortierung], ascending=[False, sortierung != "a_min"],
+                                          na_position="last", kind="stable")
+        screening.insert(0, "Rang", np.arange(1, len(screening) + 1))
+        return screening.reset_index(drop=True)
+
+    def optimize_abstandshalter(self, abstandshalter: Optional[tuple[int, ...]] = None,
+                                a_s_werte: Optional[tuple[float, ...]] = None,
+                                teilleiter: Optional[tuple[int, ...]] = None, l_s_min: float = 0.0,
+                                l_s_max: Optional[float] = None,
+                                cancel_check: Optional[Callable[[], bool]] = None) -> pd.DataFrame:
+        """
+        Anordnung der Abstandshalter: Berechnet F_pi_d für alle Kombinationen aus Anzahl Abstandshalter, Abstand der
+        Teilleiter a_s und Anzahl Teilleiter n und bestimmt die Pareto-Front Anzahl Abstandshalter gegenüber F_pi_d.
+
+        F_pi_d hängt nur vom gemittelten Abstand l_s ab (siehe bkskls.l_s). Für k Abstandshalter wird die
+        Seillänge (l_c bzw. l_eff) deshalb in k + 1 gleiche Teilabstände aufgeteilt (höchstens 10 Eingabefelder,
+        also k <= 9). Pro Kombination wird die invariante Stufe (inkl. T_pi, ν_2, F_v) einmal vorbereitet und beide
+        Lastfälle werden in einem vektorisierten Durchlauf berechnet.
+
+        Args:
+            abstandshalter: Anzahlen Abstandshalter (None: 1 bis 9)
+            a_s_werte: Abstände der Teilleiter a_s in m (None: a_s der Eingabe)
+            teilleiter: Anzahlen Teilleiter n >= 2 (None: n der Eingabe)
+            l_s_min: Kleinster zulässiger Teilabstand in m
+            l_s_max: Grösster zulässiger Teilabstand in m (None: keine Grenze)
+            cancel_check: Rückgabe True bricht die Berechnung mit CalculationCancelled ab
+
+        Returns:
+            DataFrame mit Abstandshalter, l_s, a_s, n, Methode (F_pi_d ohne j / mit j), F_pi_d (Maximum beider
+            Lastfälle in kN) und Pareto (True für Kombinationen auf der Pareto-Front), aufsteigend nach
+            Abstandshalter und F_pi_d
+        """
+        if self._sweep_matrix.get(self._calculation_key()) is None:
+            raise self._missing_calculation_method_error()
+
+        prepared = self.prepare_calculation()
+        l_bezug = prepared.l_c if prepared.l_c not in (None, 0.0, 0) else prepared.l_eff
+        abstandshalter = tuple(abstandshalter) if abstandshalter is not None else tuple(range(1, 10))
+        a_s_werte = tuple(a_s_werte) if a_s_werte is not None else (self.inputs.a_s,)
+        teilleiter = tuple(teilleiter) if teilleiter is not None else (self.inputs.n,)
+        F_st = np.array([self.inputs.F_st_20, self.inputs.F_st_80])
+        spalten = ["Abstandshalter", "l_s", "a_s", "n", "Methode", "F_pi_d", "Pareto"]
+
+        zeilen = []
+        for k in abstandshalter:
+            l_s = l_bezug / (k + 1)
+            if not 1 <= k <= 9 or l_s < l_s_min or (l_s_max is not None and l_s > l_s_max):
+                continue
+            for a_s in a_s_werte:
+                for n in teilleiter:
+                    if a_s in (None, 0) or n < 2:
+                        continue
+                    if cancel_check and cancel_check():
+                        raise CalculationCancelled("Berechnung abgebrochen.")
+                    inputs = copy.copy(self.inputs)
+                    inputs.a_s, inputs.n = float(a_s), int(n)
+                    for i in range(1, 11):
+                        setattr(inputs, f"l_s_{i}", l_s if i <= k + 1 else None)
+                    mediator = KurschlusskräfteLeiterseileMediator(inputs)
+                    sweep_result = mediator._sweep_matrix[mediator._calculation_key()](F_st)
+                    F_pi_d = sweep_result["F_pi_d"]
+                    zeilen.append({"Abstandshalter": k, "l_s": l_s, "a_s": float(a_s), "n": int(n),
+                                   "Methode": mediator.prepare_calculation().F_pi_d_methode,
+                                   "F_pi_d": np.max(F_pi_d) / 1000 if not np.all(np.isnan(F_pi_d)) else np.nan})
+
+        kandidaten = pd.DataFrame(zeilen, columns=spalten)
+        if kandidaten.empty:
+            return kandidaten
+        kandidaten = kandidaten.sort_values(["Abstandshalter", "F_pi_d"], na_position="last").reset_index(drop=True)
+
+        # Pareto-Front: Keine andere Kombination mit höchstens gleich vielen Abstandshaltern und kleinerem F_pi_d
+        bestes_F_pi_d = np.inf
+        pareto = np.zeros(len(kandidaten), dtype=bool)
+        for i, F_pi_d in enumerate(kandidaten["F_pi_d"].to_numpy()):
+            if not np.isnan(F_pi_d) and F_pi_d < bestes_F_pi_d:
+                pareto[i] = True
+                bestes_F_pi_d = F_pi_d
+        kandidaten["Pareto"] = pareto
+        return kandidaten
+
+    def solve_inverse(self, variable: str, ziel: str, zielwert: float, untere_grenze: float, obere_grenze: float,
+                      lastfall: str = "F_st_20", rasterpunkte: int = 257, xtol: float = 1e-9,
+                      maxiter: int = 200) -> pd.DataFrame:
+        """
+        Inverser Löser: Bestimmt alle Werte von F_st, a oder l_s im Intervall [untere_grenze, obere_grenze], an denen
+        die Zielgrösse (F_td, F_fd, F_pi_d, b_h oder a_min) den Zielwert erreicht. Die übrigen Eingaben bleiben
+        unverändert, für a und l_s wird F_st des gewählten Lastfalls verwendet.
+
+        Die Zielfunktion wird auf einem Raster ausgewertet, jeder Vorzeichenwechsel von (Zielgrösse - Zielwert) wird
+        durch eine gemeinsame Bisektion auf eine Intervallbreite von höchstens xtol eingegrenzt. Liegt im
+        eingegrenzten Intervall ein Zweigwechsel einer Fallunterscheidung mit Sprung der Zielgrösse, wird der
+        Zielwert nicht erreicht, sondern übersprungen (Art "Sprung").
+        Hinweis: Mehrfache Lösungen innerhalb einer Rasterzelle werden nicht erkannt.
+
+        Args:
+            variable: Gesuchte Grösse (siehe INVERSE_VARIABLEN): F_st in kN, a und l_s in m
+            ziel: Zielgrösse (siehe INVERSE_ZIELE)
+            zielwert: Zielwert (Kräfte in kN, b_h und a_min in m)
+            untere_grenze: Untere Grenze des Suchintervalls
+            obere_grenze: Obere Grenze des Suchintervalls
+            lastfall: F_st_20 oder F_st_80 (nur für a und l_s)
+            rasterpunkte: Anzahl Punkte des Suchrasters
+            xtol: Garantierte Breite des Lösungsintervalls
+            maxiter: Maximale Anzahl Bisektionsschritte
+
+        Returns:
+            DataFrame mit den Spalten Lösung, Links, Rechts, Wert, Art (aufsteigend nach Lösung, leer ohne Lösung)
+        """
+        if variable not in self.INVERSE_VARIABLEN:
+            raise ValueError(f"Unbekannte Variable '{variable}', möglich sind: {', '.join(self.INVERSE_VARIABLEN)}.")
+        if ziel not in self.INVERSE_ZIELE:
+            raise ValueError(f"Unbekannte Zielgrösse '{ziel}', möglich sind: {', '.join(self.INVERSE_ZIELE)}.")
+        if lastfall not in ("F_st_20", "F_st_80"):
+            raise ValueError("lastfall muss F_st_20 oder F_st_80 sein.")
+        if obere_grenze <= untere_grenze:
+            raise ValueError("obere_grenze muss groesser als untere_grenze sein.")
+        if self._sweep_matrix.get(self._calculation_key()) is None:
+            raise self._missing_calculation_method_error()
+
+        spalten = ["Lösung", "Links", "Rechts", "Wert", "Art"]
+        auswertung = self._inverse_auswertung(variable, ziel, lastfall)
+
+        # Vorzeichenwechsel auf dem Suchraster
+        x = np.linspace(untere_grenze, obere_grenze, max(2, rasterpunkte))
+        werte, _ = auswertung(x)
+        abstand = werte - zielwert
+        gültig = ~np.isnan(abstand)
+        positiv = abstand > 0
+        treffer = np.flatnonzero(gültig & (abstand == 0))
+        wechsel = np.flatnonzero((positiv[:-1] != positiv[1:]) & gültig[:-1] & gültig[1:]
+                                 & (abstand[:-1] != 0) & (abstand[1:] != 0))
+
+        links, rechts = x[wechsel], x[wechsel + 1]
+        positiv_links = positiv[wechsel]
+
+        # Gemeinsame Bisektion aller Intervalle
+        for _ in range(maxiter):
+            if links.size == 0 or np.max(rechts - links) <= xtol:
+                break
+            mitte = (links + rechts) / 2
+            werte_mitte, _ = auswertung(mitte)
+            # Ungültige Werte in der Mitte werden der rechten Seite zugeschlagen
+            gleich = (werte_mitte - zielwert > 0) == positiv_links
+            links = np.where(gleich, mitte, links)
+            rechts = np.where(gleich, rechts, mitte)
+
+        # Stetiger Übergang (Lösung) oder Sprung der Zielgrösse im eingegrenzten Intervall
+        werte_links, zweige_links = auswertung(links)
+        werte_rechts, zweige_rechts = auswertung(rechts)
+        toleranz = 1e-6 * max(1.0, abs(zielwert))
+        sprung = (zweige_links != zweige_rechts) & (np.abs(werte_rechts - werte_links) > toleranz)
+
+        lösungen = pd.DataFrame({
+            "Lösung": np.concatenate([x[treffer], (links + rechts) / 2]),
+            "Links": np.concatenate([x[treffer], links]),
+            "Rechts": np.concatenate([x[treffer], rechts]),
+            "Wert": np.concatenate([werte[treffer], (werte_links + werte_rechts) / 2]),
+            "Art": ["Lösung"] * treffer.size + ["Sprung" if s else "Lösung" for s in sprung],
+        }, columns=spalten)
+        return lösungen.sort_values("Lösung").reset_index(drop=True)
+
+    def _inverse_auswertung(self, variable: str, ziel: str,
+                            lastfall: str) -> Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]:
+        """
+        Erstellt die Zielfunktion des inversen Lösers: Werte der gesuchten Grösse -> (Zielgrösse, Zweige).
+        Für F_st wird der vektorisierte Pfad direkt verwendet. Für a und l_s wird pro Wert eine eigene vorbereitete
+        Berechnung erstellt, die Methode von F_pi_d (ohne j, mit j) ist dann Teil der Zweige.
+        """
+        def umrechnen(sweep_result: dict) -> np.ndarray:
+            return sweep_result[ziel] / 1000 if ziel.startswith("F_") else sweep_result[ziel]
+
+        if variable == "F_st":
+            sweep_method = self._sweep_matrix[self._calculation_key()]
+
+            def auswertung(werte: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+                sweep_result = sweep_method(np.asarray(werte, dtype=float) * 10 ** 3)
+                return umrechnen(sweep_result), self._sweep_zweige(sweep_result["indikatoren"])
+            return auswertung
+
+        F_st = np.array([getattr(self.inputs, lastfall)])
+        methoden = {None: 0, "ohne_j": 1, "mit_j": 2}
+
+        def auswertung(werte: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+            werte = np.asarray(werte, dtype=float)
+            ergebnis = np.full(werte.shape, np.nan)
+            zweige = np.zeros(werte.shape, dtype=np.int64)
+            for i, wert in enumerate(werte):
+                inputs = copy.copy(self.inputs)
+                if variable == "a":
+                    inputs.a = float(wert)
+                else:
+                    # Gleichmässige Abstände der Abstandshalter
+                    inputs.l_s_1 = float(wert)
+                    for k in range(2, 11):
+                        setattr(inputs, f"l_s_{k}", None)
+                mediator = KurschlusskräfteLeiterseileMediator(inputs)
+                sweep_result = mediator._sweep_matrix[mediator._calculation_key()](F_st)
+                ergebnis[i] = umrechnen(sweep_result)[0]
+                zweige[i] = self._sweep_zweige(sweep_result["indikatoren"])[0] \
+                    | (methoden[mediator.prepare_calculation().F_pi_d_methode] << 16)
+            return ergebnis, zweige
+        return auswertung
+
+    @staticmethod
+    def _f_st_raster(f_st_min: float, f_st_max: float, f_st_step: float) -> np.ndarray:
+        """Erstellt das gleichmässige F_st-Raster in kN"""
+        if f_st_step <= 0:
+            raise ValueError("f_st_step muss groesser als 0 sein.")
+        if f_st_max < f_st_min:
+            raise ValueError("f_st_max muss groesser oder gleich f_st_min sein.")
+
+        steps = int(round((f_st_max - f_st_min) / f_st_step))
+        return f_st_min + (np.arange(steps + 1) * f_st_step)
+
+    @staticmethod
+    def _regime_attrs(regime: Optional[pd.DataFrame]) -> tuple[dict[str, Any], ...]:
+        # Regime-Karte als Tupel einfacher Datensätze für DataFrame.attrs: pandas vergleicht attrs beim Verbinden
+        # von DataFrames (z.B. pd.concat) mit ==, was mit einem DataFrame als Wert fehlschlägt
+        if regime is None:
+            return ()
+        return tuple(regime.to_dict("records"))
+
+    def calculate_regime_map(self, f_st_min: float = 0.1, f_st_max: float = 35.0, rasterpunkte: int = 513,
+                             xtol: float = 1e-9, maxiter: int = 100) -> pd.DataFrame:
+        """
+        Regime-Karte: Bestimmt die F_st-Werte, an denen die Fallunterscheidungen der Berechnung den Zweig wechseln.
+        Die Indikatoren (siehe _sweep_indikatoren) werden auf einem Raster ausgewertet, jeder Vorzeichenwechsel wird
+        anschliessend durch eine gemeinsame, vektorisierte Bisektion aller Intervalle bis auf xtol eingegrenzt.
+        Hinweis: Mehrfache Wechsel desselben Indikators innerhalb einer Rasterzelle werden nicht erkannt.
+
+        Args:
+            f_st_min: Kleinste statische Seilzugkraft in kN
+            f_st_max: Grösste statische Seilzugkraft in kN
+            rasterpunkte: Anzahl Punkte des Suchrasters
+            xtol: Breite des eingegrenzten Intervalls in kN
+            maxiter: Maximale Anzahl Bisektionsschritte
+
+        Returns:
+            DataFrame mit den Spalten Indikator, Beschreibung, F_st, F_st_links und F_st_rechts (kN), aufsteigend
+            nach F_st sortiert. F_st_links und F_st_rechts liegen auf beiden Seiten des Zweigwechsels. Für Fälle ohne
+            vektorisierte Berechnungsmethode ist das DataFrame leer.
+        """
+        spalten = ["Indikator", "Beschreibung", "F_st", "F_st_links", "F_st_rechts"]
+        sweep_method = self._sweep_matrix.get(self._calculation_key())
+        if sweep_method is None or f_st_max <= f_st_min:
+            return pd.DataFrame(columns=spalten)
+
+        # Vorzeichenwechsel auf dem Suchraster
+        f_st_values = np.linspace(f_st_min, f_st_max, max(2, rasterpunkte))
+        indikatoren = sweep_method(f_st_values * 10 ** 3)["indikatoren"]
+        namen, links, rechts, zweig_links = [], [], [], []
+        for name, werte in indikatoren.items():
+            positiv = werte > 0
+            gültig = ~np.isnan(werte)
+            for k in np.flatnonzero((positiv[:-1] != positiv[1:]) & gültig[:-1] & gültig[1:]):
+                namen.append(name)
+                links.append(f_st_values[k])
+                rechts.append(f_st_values[k + 1])
+                zweig_links.append(positiv[k])
+
+        if not namen:
+            return pd.DataFrame(columns=spalten)
+
+        # Gemeinsame Bisektion aller Intervalle
+        links, rechts, zweig_links = np.array(links), np.array(rechts), np.array(zweig_links)
+        for _ in range(maxiter):
+            if np.max(rechts - links) <= xtol:
+                break
+            mitte = (links + rechts) / 2
+            indikatoren_mitte = sweep_method(mitte * 10 ** 3)["indikatoren"]
+            zweig_mitte = np.array([indikatoren_mitte[name][i] > 0 for i, name in enumerate(namen)])
+            gleich = zweig_mitte == zweig_links
+            links = np.where(gleich, mitte, links)
+            rechts = np.where(gleich, rechts, mitte)
+
+        regime = pd.DataFrame({
+            "Indikator": namen,
+            "Beschreibung": [self.INDIKATOR_BESCHREIBUNG.get(name, name) for name in namen],
+            "F_st": (links + rechts) / 2,
+            "F_st_links": links,
+            "F_st_rechts": rechts,
+        })
+        return regime.sort_values("F_st").reset_index(drop=True)
+
+    def _sweep_arrays(self, f_st_values: np.ndarray, cancel_check: Optional[Callable[[], bool]] = None,
+                      vektorisiert: bool = True) -> dict[str, Optional[np.ndarray]]:
+        """
+        Berechnet F_td, F_fd und F_pi_d in kN für die F_st-Werte in kN.
+        Vektorisierter Pfad: Der gesamte F_st-Vektor wird in einem Durchlauf berechnet. Die Ergebnisse stimmen mit
+        der skalaren Schleife auf eine relative Toleranz von 1e-9 überein. Für Fälle ohne vektorisierte
+        Berechnungsmethode wird auf die skalare Schleife (evaluate) zurückgefallen, dort sind keine Zweige verfügbar.
+
+        Returns:
+            Dictionary mit den Arrays F_td, F_fd und F_pi_d in kN und den Zweigen als Bitmaske (oder None)
+        """
+        f_st_values = np.asarray(f_st_values, dtype=float)
+        sweep_method = self._sweep_matrix.get(self._calculation_key()) if vektorisiert else None
+        if sweep_method is not None:
+            if cancel_check and cancel_check():
+                raise CalculationCancelled("Berechnung abgebrochen.")
+            sweep_result = sweep_method(f_st_values * 10 ** 3)
+            return {
+                "F_td": sweep_result["F_td"] / 1000,
+                "F_fd": sweep_result["F_fd"] / 1000,
+                "F_pi_d": sweep_result["F_pi_d"] / 1000,
+                "zweige": self._sweep_zweige(sweep_result["indikatoren"]),
+            }
+
+        werte = {"F_td": np.full(f_st_values.shape, np.nan), "F_fd": np.full(f_st_values.shape, np.nan),
+                 "F_pi_d": np.full(f_st_values.shape, np.nan), "zweige": None}
+        for i, f_st_value in enumerate(f_st_values):
+            if cancel_check and cancel_check():
+                raise CalculationCancelled("Berechnung abgebrochen.")
+            result = self.evaluate(float(f_st_value) * 10 ** 3, mode="loop-mode")
+            for spalte in ("F_td", "F_fd", "F_pi_d"):
+                wert = getattr(result, spalte)
+                werte[spalte][i] = np.nan if wert is None else wert
+        return werte
+
+    def _sweep_arrays_parallel(self, f_st_values: np.ndarray, workers: int,
+                               cancel_check: Optional[Callable[[], bool]] = None, vektorisiert: bool = True,
+                               blöcke_pro_worker: int = 4, abfrageintervall: float = 0.05
+                               ) -> dict[str, Optional[np.ndarray]]:
+        """
+        Wie _sweep_arrays, verteilt den F_st-Vektor aber in Blöcken auf einen ProcessPoolExecutor. Die Blöcke werden
+        in der ursprünglichen Reihenfolge zusammengesetzt.
+        cancel_check wird im aufrufenden Prozess alle abfrageintervall Sekunden geprüft. Bei einem Abbruch werden
+        noch nicht gestartete Blöcke verworfen und laufende Blöcke über ein gemeinsames Event zwischen zwei
+        F_st-Werten beendet. Der Start der Worker-Prozesse lohnt sich vor allem für den skalaren Pfad und sehr
+        feine Raster.
+        """
+        f_st_values = np.asarray(f_st_values, dtype=float)
+        blöcke = [block for block in np.array_split(f_st_values, max(1, workers * blöcke_pro_worker)) if block.size]
+        abbruch = multiprocessing.get_context().Event()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_sweep_worker, initargs=(abbruch,)) as executor:
+            futures = [executor.submit(_sweep_block, self.inputs, block, vektorisiert) for block in blöcke]
+            try:
+                offen = set(futures)
+                while offen:
+                    fertig, offen = wait(offen, timeout=abfrageintervall, return_when=FIRST_COMPLETED)
+                    for future in fertig:
+                        # Fehler (auch CalculationCancelled) eines Blocks sofort weitergeben
+                        future.result()
+                    if cancel_check and cancel_check():
+                        raise CalculationCancelled("Berechnung abgebrochen.")
+            except BaseException:
+                abbruch.set()
+                for future in futures:
+                    future.cancel()
+                raise
+
+        ergebnisse = [future.result() for future in futures]
+        werte = {spalte: np.concatenate([ergebnis[spalte] for ergebnis in ergebnisse])
+                 for spalte in ("F_td", "F_fd", "F_pi_d")}
+        werte["zweige"] = None if any(ergebnis["zweige"] is None for ergebnis in ergebnisse) else \
+            np.concatenate([ergebnis["zweige"] for ergebnis in ergebnisse])
+        return werte
 
     def run_calculation_1_1(self) -> dict[str, KurschlusskräfteLeiterseileResult]:
         """
@@ -276,117 +1425,99 @@ class KurschlusskräfteLeiterseileMediator:
         results = {}
 
         for key, F_st in [('F_st_20', self.inputs.F_st_20), ('F_st_80', self.inputs.F_st_80)]:
-            result = KurschlusskräfteLeiterseileResult()
-
-            # Schritt 1: Effektive Seillänge
-            result.l_c = bkskls.l_c(self.inputs.l, self.inputs.l_i)
-
-            # Schritt 1a: Massenbelag konzentrischer Lasten
-            result.m_c = bkskls.m_c(self.inputs.m_c, self.inputs.n, result.l_c)
-
-            # Schritt 2: Charakteristischer elektromagnetischer Kraftbelag
-            result.F_a = bkskls.F_a(self.mu0, self.inputs.standardkurzschlussstroeme,
-                                    self.inputs.l, result.l_c, self.inputs.a)
-
-            # Schritt 3: Verhältnis r
-            result.r = bkskls.r(result.F_a, self.inputs.n, self.inputs.m_s+result.m_c, self.g)
+            results[key] = self.evaluate(F_st)
 
-            # Schritt 4: Richtung δ_1
-            result.δ_1 = bkskls.δ_1(result.r)
+        return results
 
-            # Schritt 5: Statischer Durchhang
-            result.f_es = bkskls.f_es(self.inputs.n, self.inputs.m_s+result.m_c, self.g, self.inputs.l, F_st)
+    def _evaluate_1_1(self, F_st: float, prepared: KurschlusskräfteLeiterseilePreparedCalculation,
+                       mode: str) -> KurschlusskräfteLeiterseileResult:
+        """
+        Variable Stufe Fall 1.1: Berechnet alle von F_st abhängigen Grössen für eine statische Seilzugkraft.
 
-            # Schritt 6: Periodendauer
-            result.T = bkskls.T(result.f_es, self.g)
+        Args:
+            F_st: Statische Seilzugkraft in N
+            prepared: Vorbereitete Berechnung (invariante Stufe)
+            mode: Lösungsmodus für ψ und ξ
+        """
+        result = KurschlusskräfteLeiterseileResult()
 
-            # Schritt 7: Resultierende Periodendauer
-            result.T_res = bkskls.T_res(result.T, result.r, result.δ_1)
+        # Schritte 1 - 4, 19 und 24: Invariante Stufe
+        prepared.apply_to(result)
 
-            # Schritt 8: Effektiver E-Modul
-            result.E_eff = bkskls.E_eff(self.inputs.E, F_st, self.inputs.n, self.inputs.A_s, self.σ_fin)
+        # Schritt 5: Statischer Durchhang
+        result.f_es = bkskls.f_es(self.inputs.n, self.inputs.m_s + result.m_c, self.g, self.inputs.l, F_st)
 
-            # Schritt 9: Steifigkeitsnorm
-            result.N = bkskls.N(self.inputs.S, self.inputs.l,
-                               self.inputs.n, result.E_eff, self.inputs.A_s)
+        # Schritt 6: Periodendauer
+        result.T = bkskls.T(result.f_es, self.g)
 
-            # Schritt 10: Beanspruchungsfaktor
-            result.ζ = bkskls.ζ(self.inputs.n, self.g, self.inputs.m_s+result.m_c, self.inputs.l, F_st, result.N)
+        # Schritt 7: Resultierende Periodendauer
+        result.T_res = bkskls.T_res(result.T, result.r, result.δ_1)
 
-            # Schritt 11: Ausschwingwinkel
-            result.δ_end = bkskls.δ_end(result.δ_1, self.inputs.t_k, result.T_res)
+        # Schritt 8: Effektiver E-Modul
+        result.E_eff = bkskls.E_eff(self.inputs.E, F_st, self.inputs.n, self.inputs.A_s, self.σ_fin)
 
-            # Schritt 12: Maximaler Ausschwingwinkel
-            result.δ_max = bkskls.δ_max(result.r, result.δ_end)
+        # Schritt 9: Steifigkeitsnorm
+        result.N = bkskls.N(self.inputs.S, self.inputs.l, self.inputs.n, result.E_eff, self.inputs.A_s)
 
-            # Schritt 13: Lastparameter φ
-            result.φ = bkskls.φ_ohne_schlaufe(self.inputs.t_k, result.T_res, result.r, result.δ_end)
+        # Schritt 10: Beanspruchungsfaktor
+        result.ζ = bkskls.ζ(self.inputs.n, self.g, self.inputs.m_s + result.m_c, self.inputs.l, F_st, result.N)
 
-            # Schritt 14: Lastparameter ψ
-            result.ψ = self.mode_call(func_name="ψ_ohne_schlaufe", φ=result.φ, ζ=result.ζ)
-            # result.ψ = bkskls.ψ_ohne_schlaufe(result.φ, result.ζ)
+        # Schritt 11: Ausschwingwinkel
+        result.δ_end = bkskls.δ_end(result.δ_1, self.inputs.t_k, result.T_res)
 
-            # Schritt 15: Kurzschluss-Seilzugkraft F_td
-            result.F_td = bkskls.F_td_ohne_schlaufe_spannfeldmitte(F_st, result.φ, result.ψ)
+        # Schritt 12: Maximaler Ausschwingwinkel
+        result.δ_max = bkskls.δ_max(result.r, result.δ_end)
 
-            # Schritt 16: Elastische Seildehnung ε_ela
-            result.ε_ela = bkskls.ε_ela(result.N, result.F_td, F_st)
+        # Schritt 13: Lastparameter φ
+        result.φ = bkskls.φ_ohne_schlaufe(self.inputs.t_k, result.T_res, result.r, result.δ_end)
 
-            # Schritt 17: thermische Seildehnung ε_th
-            result.ε_th = bkskls.ε_th(self.inputs.c_th, self.inputs.standardkurzschlussstroeme, self.inputs.n,
-                                      self.inputs.A_s, self.inputs.t_k, result.T_res)
+        # Schritt 14: Lastparameter ψ
+        result.ψ = self.mode_call(func_name="ψ_ohne_schlaufe", φ=result.φ, ζ=result.ζ, mode=mode)
 
-            # Schritt 18: Faktor Durchhangvergrößerung C_D
-            result.C_D = bkskls.C_D(self.inputs.l, result.f_es, result.ε_ela, result.ε_th)
+        # Schritt 15: Kurzschluss-Seilzugkraft F_td
+        result.F_td = bkskls.F_td_ohne_schlaufe_spannfeldmitte(F_st, result.φ, result.ψ)
 
-            # Schritt 19: Faktor Durchhangvergrößerung C_F
-            result.C_F = bkskls.C_F(result.r)
+        # Schritt 16: Elastische Seildehnung ε_ela
+        result.ε_ela = bkskls.ε_ela(result.N, result.F_td, F_st)
 
-            # Schritt 20: Dynamischer Seildurchhangs f_ed
-            result.f_ed = bkskls.f_ed(result.C_D, result.C_F, result.f_es)
+        # Schritt 17: thermische Seildehnung ε_th
+        result.ε_th = bkskls.ε_th(self.inputs.c_th, self.inputs.standardkurzschlussstroeme, self.inputs.n,
+                                  self.inputs.A_s, self.inputs.t_k, result.T_res)
 
-            # Schritt 21: Fall-Seilzugkraft F_fd
-            result.F_fd = bkskls.F_fd(F_st, result.ζ, result.δ_max)
+        # Schritt 18: Faktor Durchhangvergrößerung C_D
+        result.C_D = bkskls.C_D(self.inputs.l, result.f_es, result.ε_ela, result.ε_th)
 
-            # Schritt 22: Max. Horizontale Seilauslenkung b_h
-            result.b_h = bkskls.b_h_ohne_schlaufe_spannfeldmitte_abgespannt(result.f_ed, result.δ_max, result.δ_1)
+        # Schritt 20: Dynamischer Seildurchhangs f_ed
+        result.f_ed = bkskls.f_ed(result.C_D, result.C_F, result.f_es)
 
-            # Schritt 23: Min. minimaler Leiterabstand a_min
-            result.a_min = bkskls.a_min(self.inputs.a, result.b_h)
+        # Schritt 21: Fall-Seilzugkraft F_fd
+        result.F_fd = bkskls.F_fd(F_st, result.ζ, result.δ_max)
 
-            # Schritt 24: Abstände Abstandshalter
-            result.l_s = bkskls.l_s(self.inputs.l_s_1, self.inputs.l_s_2, self.inputs.l_s_3, self.inputs.l_s_4, self.inputs.l_s_5,
-                                    self.inputs.l_s_6, self.inputs.l_s_7, self.inputs.l_s_8, self.inputs.l_s_9, self.inputs.l_s_10)
+        # Schritt 22: Max. Horizontale Seilauslenkung b_h
+        result.b_h = bkskls.b_h_ohne_schlaufe_spannfeldmitte_abgespannt(result.f_ed, result.δ_max, result.δ_1)
 
-            # Schritt 25: Bündel-Seilzugkraft F_pi_d
-            if self.inputs.a_s not in (None, 0) and self.inputs.d not in (None, 0) and self.inputs.n not in (None, 0):
-                if (self.inputs.a_s / self.inputs.d <= 2.0 and result.l_s >= 50 * self.inputs.a_s and self.inputs.n > 1) or (self.inputs.a_s / self.inputs.d <= 2.5 and result.l_s >= 70 * self.inputs.a_s and self.inputs.n > 1):
-                    result.F_pi_d = bkskls.F_pi_d_ohne_j(result.F_td, self.inputs.a_s, self.inputs.d, result.l_s)
-                elif self.inputs.n > 1:
-                    result.ν_1 = bkskls.ν_1(self.mu0, self.inputs.standardkurzschlussstroeme, self.inputs.a_s, self.inputs.n, self.inputs.m_s, self.inputs.d, self.inputs.f)
-                    result.τ = bkskls.τ(self.inputs.f, self.inputs.κ)
-                    result.γ = bkskls.γ(self.inputs.f, result.τ)
-                    result.t_pi, result.ν_2 = bkskls.T_pi_and_ν_2(result.ν_1, self.inputs.f, result.τ, result.γ)
-                    result.ν_3 = bkskls.ν_3(self.inputs.a_s, self.inputs.d, self.inputs.n)
-                    result.F_v = bkskls.F_v(self.mu0, self.inputs.standardkurzschlussstroeme, self.inputs.a_s, result.l_c, result.l_s, result.l_eff, self.inputs.n, result.ν_2, result.ν_3)
-                    result.ε_st = bkskls.ε_st(F_st, result.l_c, result.l_s, result.l_eff, result.N, self.inputs.a_s, self.inputs.n, self.inputs.d)
-                    result.ε_pi = bkskls.ε_pi(result.F_v, result.l_c, result.l_s, result.l_eff, result.N, self.inputs.a_s, self.inputs.n, self.inputs.d)
-                    result.j = bkskls.j(result.ε_st, result.ε_pi)
-                    # Optional ein If-else einfügen für j=>1 und j<1, aber eigentlich schon Funktion enthalten
-                    result.ξ = self.mode_call(func_name="ξ", j=result.j, ε_st=result.ε_st)
-                    #result.ξ = bkskls.ξ(result.j, result.ε_st)
-                    result.η = bkskls.η(result.ε_st, result.j, result.ν_3, self.inputs.n, self.inputs.a_s, self.inputs.d)
-                    result.ν_4 = bkskls.ν_4(result.j, self.inputs.a_s, self.inputs.d, result.η)
-                    result.ν_e = bkskls.ν_e(self.mu0, result.j, self.inputs.standardkurzschlussstroeme, self.inputs.a_s, result.N,
-                                            self.inputs.n, result.l_c, result.l_s, result.l_eff, self.inputs.d, result.ν_2, result.ν_4, result.ξ, result.η)
-                    result.F_pi_d = bkskls.F_pi_d_mit_j(F_st, result.j, result.ν_e, result.ε_st, result.ξ, result.η)
+        # Schritt 23: Min. minimaler Leiterabstand a_min
+        result.a_min = bkskls.a_min(self.inputs.a, result.b_h)
 
-            # Einheitenkonvertierung
-            result.convert_units()
+        # Schritt 25: Bündel-Seilzugkraft F_pi_d
+        if prepared.F_pi_d_methode == "ohne_j":
+            result.F_pi_d = bkskls.F_pi_d_ohne_j(result.F_td, self.inputs.a_s, self.inputs.d, result.l_s)
+        elif prepared.F_pi_d_methode == "mit_j":
+            result.ε_st = bkskls.ε_st(F_st, result.l_c, result.l_s, result.l_eff, result.N, self.inputs.a_s, self.inputs.n, self.inputs.d)
+            result.ε_pi = bkskls.ε_pi(result.F_v, result.l_c, result.l_s, result.l_eff, result.N, self.inputs.a_s, self.inputs.n, self.inputs.d)
+            result.j = bkskls.j(result.ε_st, result.ε_pi)
+            # Optional ein If-else einfügen für j=>1 und j<1, aber eigentlich schon Funktion enthalten
+            result.ξ = self.mode_call(func_name="ξ", j=result.j, ε_st=result.ε_st, mode=mode)
+            result.η = bkskls.η(result.ε_st, result.j, result.ν_3, self.inputs.n, self.inputs.a_s, self.inputs.d)
+            result.ν_4 = bkskls.ν_4(result.j, self.inputs.a_s, self.inputs.d, result.η)
+            result.ν_e = bkskls.ν_e(self.mu0, result.j, self.inputs.standardkurzschlussstroeme, self.inputs.a_s, result.N,
+                                    self.inputs.n, result.l_c, result.l_s, result.l_eff, self.inputs.d, result.ν_2, result.ν_4, result.ξ, result.η)
+            result.F_pi_d = bkskls.F_pi_d_mit_j(F_st, result.j, result.ν_e, result.ε_st, result.ξ, result.η)
 
-            results[key] = result
+        # Einheitenkonvertierung
+        result.convert_units()
 
-        return results
+        return result
 
     def run_calculation_1_2(self) -> dict[str, KurschlusskräfteLeiterseileResult]:
         """
@@ -459,140 +1590,456 @@ class KurschlusskräfteLeiterseileMediator:
         results = {}
 
         for key, F_st in [('F_st_20', self.inputs.F_st_20), ('F_st_80', self.inputs.F_st_80)]:
-            result = KurschlusskräfteLeiterseileResult()
+            results[key] = self.evaluate(F_st)
 
-            # Schritt 1: Effektive Seillänge
-            result.l_eff = bkskls.l_eff(self.inputs.l, self.inputs.l_h_f)
+        return results
 
-            # Schritt 1a: Massenbelag konzentrischer Lasten
-            result.m_c = bkskls.m_c(self.inputs.m_c, self.inputs.n, self.inputs.l)
+    def _evaluate_3_1(self, F_st: float, prepared: KurschlusskräfteLeiterseilePreparedCalculation,
+                       mode: str) -> KurschlusskräfteLeiterseileResult:
+        """
+        Variable Stufe Fall 3.1: Berechnet alle von F_st abhängigen Grössen für eine statische Seilzugkraft.
 
-            # Schritt 2: Charakteristischer elektromagnetischer Kraftbelag
-            result.F_a = bkskls.F_a(self.mu0, self.inputs.standardkurzschlussstroeme, result.l_eff, result.l_eff, self.inputs.a)
+        Args:
+            F_st: Statische Seilzugkraft in N
+            prepared: Vorbereitete Berechnung (invariante Stufe)
+            mode: Lösungsmodus für ψ und ξ
+        """
+        result = KurschlusskräfteLeiterseileResult()
 
-            # Schritt 3: Verhältnis r
-            result.r = bkskls.r(result.F_a, self.inputs.n, self.inputs.m_s + result.m_c, self.g)
+        # Schritte 1 - 4, 19 und 24: Invariante Stufe
+        prepared.apply_to(result)
 
-            # Schritt 4: Richtung δ_1
-            result.δ_1 = bkskls.δ_1(result.r)
+        # Schritt 5: Statischer Durchhang
+        result.f_es = bkskls.f_es(self.inputs.n, self.inputs.m_s + result.m_c, self.g, result.l_eff, F_st)
 
-            # Schritt 5: Statischer Durchhang
-            result.f_es = bkskls.f_es(self.inputs.n, self.inputs.m_s + result.m_c, self.g, result.l_eff, F_st)
+        # Schritt 6: Periodendauer
+        result.T = bkskls.T(result.f_es, self.g)
 
-            # Schritt 6: Periodendauer
-            result.T = bkskls.T(result.f_es, self.g)
+        # Schritt 7: Resultierende Periodendauer
+        result.T_res = bkskls.T_res(result.T, result.r, result.δ_1)
 
-            # Schritt 7: Resultierende Periodendauer
-            result.T_res = bkskls.T_res(result.T, result.r, result.δ_1)
+        # Schritt 8: Effektiver E-Modul
+        result.E_eff = bkskls.E_eff(self.inputs.E, F_st, self.inputs.n, self.inputs.A_s, self.σ_fin)
 
-            # Schritt 8: Effektiver E-Modul
-            result.E_eff = bkskls.E_eff(self.inputs.E, F_st, self.inputs.n, self.inputs.A_s, self.σ_fin)
+        # Schritt 9: Steifigkeitsnorm
+        result.N = bkskls.N(self.inputs.S, result.l_eff, self.inputs.n, result.E_eff, self.inputs.A_s)
 
-            # Schritt 9: Steifigkeitsnorm
-            result.N = bkskls.N(self.inputs.S, result.l_eff, self.inputs.n, result.E_eff, self.inputs.A_s)
+        # Schritt 10: Beanspruchungsfaktor
+        result.ζ = bkskls.ζ(self.inputs.n, self.g, self.inputs.m_s + result.m_c, result.l_eff, F_st, result.N)
 
-            # Schritt 10: Beanspruchungsfaktor
-            result.ζ = bkskls.ζ(self.inputs.n, self.g, self.inputs.m_s + result.m_c, result.l_eff, F_st, result.N)
+        # Schritt 11: Ausschwingwinkel
+        result.δ_end = bkskls.δ_end(result.δ_1, self.inputs.t_k, result.T_res)
 
-            # Schritt 11: Ausschwingwinkel
-            result.δ_end = bkskls.δ_end(result.δ_1, self.inputs.t_k, result.T_res)
+        # Schritt 12: Maximaler Ausschwingwinkel
+        result.δ_max = bkskls.δ_max(result.r, result.δ_end)
 
-            # Schritt 12: Maximaler Ausschwingwinkel
-            result.δ_max = bkskls.δ_max(result.r, result.δ_end)
+        # Schritt 13: Lastparameter φ
+        result.φ = bkskls.φ_ohne_schlaufe(self.inputs.t_k, result.T_res, result.r, result.δ_end)
 
-            # Schritt 13: Lastparameter φ
-            result.φ = bkskls.φ_ohne_schlaufe(self.inputs.t_k, result.T_res, result.r, result.δ_end)
+        # Schritt 14: Lastparameter ψ
+        result.ψ = self.mode_call(func_name="ψ_ohne_schlaufe", φ=result.φ, ζ=result.ζ, mode=mode)
 
-            # Schritt 14: Lastparameter ψ
-            result.ψ = self.mode_call(func_name="ψ_ohne_schlaufe", φ=result.φ, ζ=result.ζ)
-            #result.ψ = bkskls.ψ_ohne_schlaufe(result.φ, result.ζ)
+        # Schritt 15: Kurzschluss-Seilzugkraft F_td
+        result.F_td = bkskls.F_td_ohne_schlaufe_spannfeldmitte(F_st, result.φ, result.ψ)
 
-            # Schritt 15: Kurzschluss-Seilzugkraft F_td
-            result.F_td = bkskls.F_td_ohne_schlaufe_spannfeldmitte(F_st, result.φ, result.ψ)
+        # Schritt 16: Elastische Seildehnung ε_ela
+        result.ε_ela = bkskls.ε_ela(result.N, result.F_td, F_st)
 
-            # Schritt 16: Elastische Seildehnung ε_ela
-            result.ε_ela = bkskls.ε_ela(result.N, result.F_td, F_st)
+        # Schritt 17: thermische Seildehnung ε_th
+        result.ε_th = bkskls.ε_th(self.inputs.c_th, self.inputs.standardkurzschlussstroeme, self.inputs.n,
+                                  self.inputs.A_s, self.inputs.t_k, result.T_res)
 
-            # Schritt 17: thermische Seildehnung ε_th
-            result.ε_th = bkskls.ε_th(self.inputs.c_th, self.inputs.standardkurzschlussstroeme, self.inputs.n, self.inputs.A_s, self.inputs.t_k, result.T_res)
+        # Schritt 18: Faktor Durchhangvergrößerung C_D
+        result.C_D = bkskls.C_D(result.l_eff, result.f_es, result.ε_ela, result.ε_th)
 
-            # Schritt 18: Faktor Durchhangvergrößerung C_D
-            result.C_D = bkskls.C_D(result.l_eff, result.f_es, result.ε_ela, result.ε_th)
+        # Schritt 20: Dynamischer Seildurchhangs f_ed
+        result.f_ed = bkskls.f_ed(result.C_D, result.C_F, result.f_es)
 
-            # Schritt 19: Faktor Durchhangvergrößerung C_F
-            result.C_F = bkskls.C_F(result.r)
+        # Schritt 21: Fall-Seilzugkraft F_fd
+        result.F_fd = bkskls.F_fd(F_st, result.ζ, result.δ_max)
 
-            # Schritt 20: Dynamischer Seildurchhangs f_ed
-            result.f_ed = bkskls.f_ed(result.C_D, result.C_F, result.f_es)
+        # Schritt 22: Max. Horizontale Seilauslenkung b_h
+        result.b_h = bkskls.b_h_ohne_schlaufe_spannfeldmitte_aufgelegt(result.f_ed, result.δ_max)
 
-            # Schritt 21: Fall-Seilzugkraft F_fd
-            result.F_fd = bkskls.F_fd(F_st, result.ζ, result.δ_max)
+        # Schritt 23: Min. minimaler Leiterabstand a_min
+        result.a_min = bkskls.a_min(self.inputs.a, result.b_h)
 
-            # Schritt 22: Max. Horizontale Seilauslenkung b_h
-            result.b_h = bkskls.b_h_ohne_schlaufe_spannfeldmitte_aufgelegt(result.f_ed, result.δ_max)
+        # Schritt 25: Bündel-Seilzugkraft F_pi_d
+        if prepared.F_pi_d_methode == "ohne_j":
+            result.F_pi_d = bkskls.F_pi_d_ohne_j(result.F_td, self.inputs.a_s, self.inputs.d, result.l_s)
+        elif prepared.F_pi_d_methode == "mit_j":
+            result.ε_st = bkskls.ε_st(F_st, result.l_c, result.l_s, result.l_eff, result.N, self.inputs.a_s, self.inputs.n, self.inputs.d)
+            result.ε_pi = bkskls.ε_pi(result.F_v, result.l_c, result.l_s, result.l_eff, result.N, self.inputs.a_s, self.inputs.n, self.inputs.d)
+            result.j = bkskls.j(result.ε_st, result.ε_pi)
+            # Optional ein If-else einfügen für j=>1 und j<1, aber eigentlich schon Funktion enthalten
+            result.ξ = self.mode_call(func_name="ξ", j=result.j, ε_st=result.ε_st, mode=mode)
+            result.η = bkskls.η(result.ε_st, result.j, result.ν_3, self.inputs.n, self.inputs.a_s, self.inputs.d)
+            result.ν_4 = bkskls.ν_4(result.j, self.inputs.a_s, self.inputs.d, result.η)
+            result.ν_e = bkskls.ν_e(self.mu0, result.j, self.inputs.standardkurzschlussstroeme, self.inputs.a_s, result.N,
+                                    self.inputs.n, result.l_c, result.l_s, result.l_eff, self.inputs.d, result.ν_2, result.ν_4, result.ξ, result.η)
+            result.F_pi_d = bkskls.F_pi_d_mit_j(F_st, result.j, result.ν_e, result.ε_st, result.ξ, result.η)
 
-            # Schritt 23: Min. minimaler Leiterabstand a_min
-            result.a_min = bkskls.a_min(self.inputs.a, result.b_h)
+        # Einheitenkonvertierung
+        result.convert_units()
 
-            # Schritt 24: Abstände Abstandshalter
-            result.l_s = bkskls.l_s(self.inputs.l_s_1, self.inputs.l_s_2, self.inputs.l_s_3, self.inputs.l_s_4,
-                                    self.inputs.l_s_5,
-                                    self.inputs.l_s_6, self.inputs.l_s_7, self.inputs.l_s_8, self.inputs.l_s_9,
-                                    self.inputs.l_s_10)
+        return result
 
-            # Schritt 25: Bündel-Seilzugkraft F_pi_d
-            if self.inputs.a_s not in (None, 0) and self.inputs.d not in (None, 0) and self.inputs.n not in (None, 0):
-                if (self.inputs.a_s / self.inputs.d <= 2.0 and result.l_s >= 50 * self.inputs.a_s and self.inputs.n > 1) or (self.inputs.a_s / self.inputs.d <= 2.5 and result.l_s >= 70 * self.inputs.a_s and self.inputs.n > 1):
-                    result.F_pi_d = bkskls.F_pi_d_ohne_j(result.F_td, self.inputs.a_s, self.inputs.d, result.l_s)
-                elif self.inputs.n > 1:
-                    result.ν_1 = bkskls.ν_1(self.mu0, self.inputs.standardkurzschlussstroeme, self.inputs.a_s, self.inputs.n, self.inputs.m_s, self.inputs.d, self.inputs.f)
-                    result.τ = bkskls.τ(self.inputs.f, self.inputs.κ)
-                    result.γ = bkskls.γ(self.inputs.f, result.τ)
-                    result.t_pi, result.ν_2 = bkskls.T_pi_and_ν_2(result.ν_1, self.inputs.f, result.τ, result.γ)
-                    result.ν_3 = bkskls.ν_3(self.inputs.a_s, self.inputs.d, self.inputs.n)
-                    result.F_v = bkskls.F_v(self.mu0, self.inputs.standardkurzschlussstroeme, self.inputs.a_s, result.l_c, result.l_s, result.l_eff, self.inputs.n, result.ν_2, result.ν_3)
-                    result.ε_st = bkskls.ε_st(F_st, result.l_c, result.l_s, result.l_eff, result.N, self.inputs.a_s, self.inputs.n, self.inputs.d)
-                    result.ε_pi = bkskls.ε_pi(result.F_v, result.l_c, result.l_s, result.l_eff, result.N, self.inputs.a_s, self.inputs.n, self.inputs.d)
-                    result.j = bkskls.j(result.ε_st, result.ε_pi)
-                    # Optional ein If-else einfügen für j=>1 und j<1, aber eigentlich schon Funktion enthalten
-                    result.ξ = self.mode_call(func_name="ξ", j=result.j, ε_st=result.ε_st)
-                    # result.ξ = bkskls.ξ(result.j, result.ε_st)
-                    result.η = bkskls.η(result.ε_st, result.j, result.ν_3, self.inputs.n, self.inputs.a_s, self.inputs.d)
-                    result.ν_4 = bkskls.ν_4(result.j, self.inputs.a_s, self.inputs.d, result.η)
-                    result.ν_e = bkskls.ν_e(self.mu0, result.j, self.inputs.standardkurzschlussstroeme, self.inputs.a_s, result.N,
-                                            self.inputs.n, result.l_c, result.l_s, result.l_eff, self.inputs.d, result.ν_2, result.ν_4, result.ξ, result.η)
-                    result.F_pi_d = bkskls.F_pi_d_mit_j(F_st, result.j, result.ν_e, result.ε_st, result.ξ, result.η)
+    def run_sweep_1_1(self, F_st: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Fall 1.1 vektorisiert: Abgespannte Leiterseile ohne Schlaufe, ohne Höhenunterschied
 
-            # Einheitenkonvertierung
-            result.convert_units()
+        Berechnet die variable Stufe von run_calculation_1_1 für alle Werte von F_st in einem Durchlauf auf Basis
+        der vorbereiteten Berechnung. Die Fallunterscheidungen erfolgen elementweise.
 
-            results[key] = result
+        Args:
+            F_st: Statische Seilzugkräfte in N als NumPy-Array
 
-        return results
+        Returns:
+            Dictionary mit den Arrays F_td, F_fd und F_pi_d in N, b_h und a_min in m sowie den Indikatoren der
+            Fallunterscheidungen (siehe _sweep_indikatoren)
+
+        Norm: SN EN 60865-1:2012 Kapitel 6.2.3
+        """
+        F_st = np.asarray(F_st, dtype=float)
+
+        # Schritte 1 - 4, 19 und 24: Invariante Stufe
+        prepared = self.prepare_calculation()
+        l, m_s, r, δ_1 = prepared.l_seil, self.inputs.m_s + prepared.m_c, prepared.r, prepared.δ_1
+
+        # Schritte 5 - 23: Von F_st abhängige Grössen
+        f_es = vbkskls.f_es(self.inputs.n, m_s, self.g, l, F_st)
+        T = vbkskls.T(f_es, self.g)
+        T_res = vbkskls.T_res(T, r, δ_1)
+        E_eff = vbkskls.E_eff(self.inputs.E, F_st, self.inputs.n, self.inputs.A_s, self.σ_fin)
+        N = vbkskls.N(self.inputs.S, l, self.inputs.n, E_eff, self.inputs.A_s)
+        ζ = vbkskls.ζ(self.inputs.n, self.g, m_s, l, F_st, N)
+        δ_end = vbkskls.δ_end(δ_1, self.inputs.t_k, T_res)
+        χ = vbkskls.χ(r, δ_end)
+        δ_max = vbkskls.δ_max(r, δ_end)
+        φ = vbkskls.φ_ohne_schlaufe(self.inputs.t_k, T_res, r, δ_end)
+        ψ = vbkskls.ψ_ohne_schlaufe(φ, ζ)
+        F_td = vbkskls.F_td_ohne_schlaufe_spannfeldmitte(F_st, φ, ψ)
+        ε_ela = vbkskls.ε_ela(N, F_td, F_st)
+        ε_th = vbkskls.ε_th(self.inputs.c_th, self.inputs.standardkurzschlussstroeme, self.inputs.n,
+                            self.inputs.A_s, self.inputs.t_k, T_res)
+        C_D = vbkskls.C_D(l, f_es, ε_ela, ε_th)
+        f_ed = vbkskls.f_ed(C_D, prepared.C_F, f_es)
+        F_fd = vbkskls.F_fd(F_st, ζ, δ_max)
+        b_h = vbkskls.b_h_ohne_schlaufe_spannfeldmitte_abgespannt(f_ed, δ_max, δ_1)
+        a_min = vbkskls.a_min(self.inputs.a, b_h)
+
+        # Schritt 25: Bündel-Seilzugkraft F_pi_d
+        F_pi_d, j = self._sweep_F_pi_d(F_st, F_td, N, prepared)
+
+        indikatoren = self._sweep_indikatoren(F_st, T_res, δ_end, χ, δ_max - δ_1, j)
+        return {"F_td": F_td, "F_fd": F_fd, "F_pi_d": F_pi_d, "b_h": b_h, "a_min": a_min, "indikatoren": indikatoren}
+
+    def run_sweep_3_1(self, F_st: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Fall 3.1 vektorisiert: Aufgelegte Leiterseile ohne Schlaufe
+
+        Berechnet die variable Stufe von run_calculation_3_1 für alle Werte von F_st in einem Durchlauf auf Basis
+        der vorbereiteten Berechnung. Die Fallunterscheidungen erfolgen elementweise.
+
+        Args:
+            F_st: Statische Seilzugkräfte in N als NumPy-Array
+
+        Returns:
+            Dictionary mit den Arrays F_td, F_fd und F_pi_d in N, b_h und a_min in m sowie den Indikatoren der
+            Fallunterscheidungen (siehe _sweep_indikatoren)
+
+        Norm: SN EN 60865-1:2012 Kapitel 6.2.3
+        """
+        F_st = np.asarray(F_st, dtype=float)
+
+        # Schritte 1 - 4, 19 und 24: Invariante Stufe
+        prepared = self.prepare_calculation()
+        l, m_s, r, δ_1 = prepared.l_seil, self.inputs.m_s + prepared.m_c, prepared.r, prepared.δ_1
+
+        # Schritte 5 - 23: Von F_st abhängige Grössen
+        f_es = vbkskls.f_es(self.inputs.n, m_s, self.g, l, F_st)
+        T = vbkskls.T(f_es, self.g)
+        T_res = vbkskls.T_res(T, r, δ_1)
+        E_eff = vbkskls.E_eff(self.inputs.E, F_st, self.inputs.n, self.inputs.A_s, self.σ_fin)
+        N = vbkskls.N(self.inputs.S, l, self.inputs.n, E_eff, self.inputs.A_s)
+        ζ = vbkskls.ζ(self.inputs.n, self.g, m_s, l, F_st, N)
+        δ_end = vbkskls.δ_end(δ_1, self.inputs.t_k, T_res)
+        χ = vbkskls.χ(r, δ_end)
+        δ_max = vbkskls.δ_max(r, δ_end)
+        φ = vbkskls.φ_ohne_schlaufe(self.inputs.t_k, T_res, r, δ_end)
+        ψ = vbkskls.ψ_ohne_schlaufe(φ, ζ)
+        F_td = vbkskls.F_td_ohne_schlaufe_spannfeldmitte(F_st, φ, ψ)
+        ε_ela = vbkskls.ε_ela(N, F_td, F_st)
+        ε_th = vbkskls.ε_th(self.inputs.c_th, self.inputs.standardkurzschlussstroeme, self.inputs.n,
+                            self.inputs.A_s, self.inputs.t_k, T_res)
+        C_D = vbkskls.C_D(l, f_es, ε_ela, ε_th)
+        f_ed = vbkskls.f_ed(C_D, prepared.C_F, f_es)
+        F_fd = vbkskls.F_fd(F_st, ζ, δ_max)
+        b_h = vbkskls.b_h_ohne_schlaufe_spannfeldmitte_aufgelegt(f_ed, δ_max)
+        a_min = vbkskls.a_min(self.inputs.a, b_h)
+
+        # Schritt 25: Bündel-Seilzugkraft F_pi_d
+        F_pi_d, j = self._sweep_F_pi_d(F_st, F_td, N, prepared)
+
+        indikatoren = self._sweep_indikatoren(F_st, T_res, δ_end, χ, δ_max - 90, j)
+        return {"F_td": F_td, "F_fd": F_fd, "F_pi_d": F_pi_d, "b_h": b_h, "a_min": a_min, "indikatoren": indikatoren}
+
+    def _sweep_F_pi_d(self, F_st: np.ndarray, F_td: np.ndarray, N: np.ndarray,
+                      prepared: KurschlusskräfteLeiterseilePreparedCalculation) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Vektorisierte Bündel-Seilzugkraft F_pi_d (Schritt 25 der Fälle 1.1 und 3.1).
+        Die Auswahl zwischen F_pi_d_ohne_j und F_pi_d_mit_j ist Teil der vorbereiteten Berechnung. Elemente ohne
+        Bündel-Seilzugkraft werden als NaN zurückgegeben.
+
+        Returns:
+            Tuple aus F_pi_d in N und j (NaN, wenn F_pi_d nicht über j berechnet wird)
+        """
+        if prepared.F_pi_d_methode == "ohne_j":
+            return 1.1 * F_td, np.full(F_st.shape, np.nan)
+        if prepared.F_pi_d_methode != "mit_j":
+            return np.full(F_st.shape, np.nan), np.full(F_st.shape, np.nan)
+
+        a_s, d, n, l_bündel = self.inputs.a_s, self.inputs.d, self.inputs.n, prepared.l_bündel
+
+        # Von F_st abhängige Grössen
+        ε_st = vbkskls.ε_st(F_st, l_bündel, N, a_s, n, d)
+        ε_pi = vbkskls.ε_pi(prepared.F_v, l_bündel, N, a_s, n, d)
+        j = vbkskls.j(ε_st, ε_pi)
+        ξ = vbkskls.ξ(j, ε_st)
+        η = vbkskls.η(ε_st, j, prepared.ν_3, n, a_s, d)
+        ν_4 = vbkskls.ν_4(j, a_s, d, η)
+        ν_e = vbkskls.ν_e(self.mu0, j, self.inputs.standardkurzschlussstroeme, a_s, N, n, l_bündel, d, prepared.ν_2,
+                          ν_4, ξ, η)
+        return vbkskls.F_pi_d_mit_j(F_st, j, ν_e, ε_st, ξ, η), j
+
+    def _sweep_indikatoren(self, F_st: np.ndarray, T_res: np.ndarray, δ_end: np.ndarray, χ: np.ndarray,
+                           b_h_abstand: np.ndarray, j: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Indikatoren der von F_st abhängigen Fallunterscheidungen als vorzeichenbehaftete Abstände zur jeweiligen
+        Grenze. Ein Vorzeichenwechsel zwischen zwei F_st-Werten zeigt einen Zweigwechsel an.
+        Hinweis: Die Fallunterscheidung von C_F hängt nur von r ab und ändert sich mit F_st nicht.
+        """
+        t_k = self.inputs.t_k
+        return {
+            "E_eff": (F_st / (self.inputs.n * self.inputs.A_s)) - self.σ_fin,  # Gleichung (26): σ > σ_fin → E
+            "δ_end": (t_k / T_res) - 0.5,  # Gleichung (29): T_k1 / T_res > 0.5 → 2 * δ_1
+            "φ": t_k - (T_res / 4),  # Gleichung (32): T_k1 >= T_res / 4 → φ oben
+            "χ_δ_end": δ_end - 90,  # Gleichung (31): δ_end > 90° → χ = 1 - r
+            "χ_0.766": χ - 0.766,  # Gleichung (30): χ > 0.766 → 1.25 * arccos(χ)
+            "χ_-0.985": χ + 0.985,  # Gleichung (30): χ < -0.985 → 180°
+            "b_h": b_h_abstand,  # Gleichung (44, 45): δ_max gegenüber δ_1 (abgespannt) bzw. 90° (aufgelegt)
+            "j": j - 1,  # Gleichung (59 - 64): j >= 1 → ξ, sonst η
+        }
+
+    @staticmethod
+    def _sweep_zweige(indikatoren: dict[str, np.ndarray]) -> np.ndarray:
+        """Kodiert die Zweige aller Fallunterscheidungen pro F_st-Wert als Bitmaske"""
+        zweige = np.zeros(next(iter(indikatoren.values())).shape, dtype=np.int64)
+        for bit, indikator in enumerate(indikatoren.values()):
+            zweige |= (np.asarray(indikator) > 0).astype(np.int64) << bit
+        return zweige
 
+# Abbruch-Event der Worker-Prozesse der parallelen Parameterstudie (wird pro Worker-Prozess gesetzt)
+_sweep_abbruch = None
 
-def calculate_kurschlusskräfte_leiterseile(inputs: KurschlusskräfteLeiterseileInput) -> dict[str, KurschlusskräfteLeiterseileResult]:
+def _init_sweep_worker(abbruch):
+    global _sweep_abbruch
+    _sweep_abbruch = abbruch
+
+def _sweep_block(inputs: KurschlusskräfteLeiterseileInput, f_st_values: np.ndarray,
+                 vektorisiert: bool) -> dict[str, Optional[np.ndarray]]:
+    # Berechnet einen Block der parallelen Parameterstudie im Worker-Prozess
+    mediator = KurschlusskräfteLeiterseileMediator(inputs)
+    cancel_check = _sweep_abbruch.is_set if _sweep_abbruch is not None else None
+    return mediator._sweep_arrays(f_st_values, cancel_check=cancel_check, vektorisiert=vektorisiert)
+
+def _cache_schlüssel(mediator: KurschlusskräfteLeiterseileMediator, art: str, ohne: tuple[str, ...] = (),
+                     **parameter) -> str:
+    # Kanonischer Schlüssel aus normalisierter Eingabe (nach __post_init__), Fall-Key, App-Version und Parametern.
+    # Eingabewerte in ohne haben keinen Einfluss auf das Ergebnis und werden nicht berücksichtigt.
+    cache = ergebnis_cache.get_ergebnis_cache()
+    inputs = {name: getattr(mediator.inputs, name) for name in mediator.inputs.__slots__ if name not in ohne} \
+        if ohne else mediator.inputs
+    return ergebnis_cache.canonical_hash("kurzschlusskraefte_leiterseile", art, cache.version,
+                                         mediator._calculation_key(), inputs, parameter)
+
+def geänderte_eingaben(inputs: KurschlusskräfteLeiterseileInput,
+                       vorherige_inputs: Optional[KurschlusskräfteLeiterseileInput]) -> set[str]:
+    """Gibt die Namen der Eingabewerte zurück, die sich gegenüber vorherige_inputs geändert haben (None: alle)"""
+    if vorherige_inputs is None:
+        return set(inputs.__slots__)
+    return {name for name in inputs.__slots__ if getattr(inputs, name) != getattr(vorherige_inputs, name)}
+
+def calculate_kurschlusskräfte_leiterseile(inputs: KurschlusskräfteLeiterseileInput,
+                                           cache: bool = True) -> dict[str, KurschlusskräfteLeiterseileResult]:
     """
     Hauptfunktion zur Berechnung der Kurzschlusskräfte.
     Wählt automatisch die passende Berechnungsmethode basierend auf den Eingabeparametern.
+    Mit cache=True wird das Ergebnis im Ergebnis-Cache gesucht bzw. abgelegt (Rückgabe als Kopie).
     """
     mediator = KurschlusskräfteLeiterseileMediator(inputs)
-    return mediator.select_and_run_calculation()
+    if not cache or ergebnis_cache.get_ergebnis_cache() is None:
+        return mediator.select_and_run_calculation()
+
+    schlüssel = _cache_schlüssel(mediator, "berechnung")
+    ergebnis = ergebnis_cache.get_ergebnis_cache().get(schlüssel)
+    if ergebnis is None:
+        ergebnis = mediator.select_and_run_calculation()
+        ergebnis_cache.get_ergebnis_cache().set(schlüssel, copy.deepcopy(ergebnis))
+        return ergebnis
+    return copy.deepcopy(ergebnis)
+
+def recalculate_kurschlusskräfte_leiterseile(inputs: KurschlusskräfteLeiterseileInput,
+                                             vorherige_inputs: Optional[KurschlusskräfteLeiterseileInput] = None,
+                                             vorheriges_ergebnis: Optional[dict[str, KurschlusskräfteLeiterseileResult]] = None,
+                                             cache: bool = True
+                                             ) -> tuple[dict[str, KurschlusskräfteLeiterseileResult], dict[str, set[str]]]:
+    """
+    Inkrementelle Neuberechnung nach einer Änderung der Eingabewerte.
+    Lastfälle ohne betroffene Ergebnisgrössen (siehe ERGEBNIS_ABHÄNGIGKEITEN) werden aus vorheriges_ergebnis
+    übernommen, z.B. der Lastfall F_st_20, wenn nur F_st_80 geändert wurde. Betroffene Lastfälle werden über die
+    variable Stufe (evaluate) neu berechnet, die unveränderten Schritte der invarianten Stufe stammen dabei aus der
+    Memoisierung der Berechnungsfunktionen. Ohne vorheriges Ergebnis oder für Fälle ohne Einzelberechnung eines
+    Lastfalls wird vollständig berechnet.
+
+    Returns:
+        (Ergebnis wie calculate_kurschlusskräfte_leiterseile, neu berechnete Ergebnisgrössen pro Lastfall)
+    """
+    mediator = KurschlusskräfteLeiterseileMediator(inputs)
+    geändert = geänderte_eingaben(inputs, vorherige_inputs)
+    invalidiert = {lastfall: mediator.invalidierte_ergebnisse(geändert, lastfall)
+                   for lastfall in mediator.LASTFÄLLE}
+
+    vollständig = vorheriges_ergebnis is None or vorherige_inputs is None or \
+        mediator._calculation_key() not in mediator._evaluation_matrix or \
+        mediator._calculation_key() != KurschlusskräfteLeiterseileMediator(vorherige_inputs)._calculation_key() or \
+        any(lastfall not in vorheriges_ergebnis for lastfall in mediator.LASTFÄLLE)
+    if vollständig:
+        alle = set(mediator.ergebnis_abhängigkeiten())
+        return calculate_kurschlusskräfte_leiterseile(inputs, cache=cache), \
+            {lastfall: alle for lastfall in mediator.LASTFÄLLE}
+
+    ergebnis = {}
+    for lastfall in mediator.LASTFÄLLE:
+        if invalidiert[lastfall]:
+            ergebnis[lastfall] = mediator.evaluate(getattr(inputs, lastfall))
+        else:
+            ergebnis[lastfall] = copy.deepcopy(vorheriges_ergebnis[lastfall])
+    return ergebnis, invalidiert
 
 def calculate_kurschlusskräfte_leiterseile_sweep_df(inputs, f_st_min: float = 0.1, f_st_max: float = 35.0,
-                                                    f_st_step: float = 0.01, cancel_check: Optional[Callable[[], bool]] = None):
+                                                    f_st_step: float = 0.01, cancel_check: Optional[Callable[[], bool]] = None,
+                                                    adaptiv: bool = False, workers: int = 1, cache: bool = True,
+                                                    mit_regime: bool = False):
     """
     Berechnet Kurzschlusskräfte für eine Reihe von F_st-Werten (kN) und gibt eine Pandas-DataFrame zurück.
+    Mit adaptiv=True wird das Raster adaptiv verfeinert, f_st_step ist dann die kleinste Intervallbreite.
+    Mit workers > 1 wird das gleichmässige Raster in Worker-Prozessen berechnet.
+    Mit cache=True wird das DataFrame im Ergebnis-Cache gesucht bzw. abgelegt (Rückgabe als Kopie).
+    Mit mit_regime=True enthält attrs["regime"] beim gleichmässigen Raster die Umschaltpunkte der Regime-Karte
+    (beim adaptiven Raster immer).
+    """
+    mediator = KurschlusskräfteLeiterseileMediator(inputs)
+    schlüssel = None
+    if cache and ergebnis_cache.get_ergebnis_cache() is not None:
+        # F_st_20, F_st_80 und die Beschriftungen beeinflussen die Parameterstudie nicht
+        schlüssel = _cache_schlüssel(mediator, "sweep", ohne=mediator.LASTFÄLLE + mediator.EINGABEN_OHNE_EINFLUSS,
+                                     f_st_min=f_st_min, f_st_max=f_st_max, f_st_step=f_st_step, adaptiv=adaptiv,
+                                     mit_regime=mit_regime and not adaptiv)
+        sweep_df = ergebnis_cache.get_ergebnis_cache().get(schlüssel)
+        if sweep_df is not None:
+            return sweep_df.copy(deep=True)
+
+    if adaptiv:
+        sweep_df = mediator.calculate_sweep_f_st_adaptive(
+            f_st_min=f_st_min,
+            f_st_max=f_st_max,
+            f_st_step_min=f_st_step,
+            cancel_check=cancel_check,
+        )
+    else:
+        sweep_df = mediator.calculate_sweep_f_st_dataframe(
+            f_st_min=f_st_min,
+            f_st_max=f_st_max,
+            f_st_step=f_st_step,
+            cancel_check=cancel_check,
+            workers=workers,
+            mit_regime=mit_regime,
+        )
+
+    if schlüssel is not None:
+        ergebnis_cache.get_ergebnis_cache().set(schlüssel, sweep_df.copy(deep=True))
+    return sweep_df
+
+def calculate_kurschlusskräfte_leiterseile_grid(inputs, parameter: str, parameter_werte, f_st_min: float = 0.1,
+                                                f_st_max: float = 35.0, f_st_step: float = 0.01,
+                                                chunk_grösse: int = 2 ** 16,
+                                                cancel_check: Optional[Callable[[], bool]] = None):
+    """
+    Berechnet eine zweidimensionale Parameterstudie (I_k, l oder t_k × F_st) in Blöcken und gibt ein
+    KurschlusskräfteLeiterseileGrid zurück.
     """
     mediator = KurschlusskräfteLeiterseileMediator(inputs)
-    return mediator.calculate_sweep_f_st_dataframe(
+    return mediator.calculate_grid(
+        parameter=parameter,
+        parameter_werte=parameter_werte,
         f_st_min=f_st_min,
         f_st_max=f_st_max,
         f_st_step=f_st_step,
+        chunk_grösse=chunk_grösse,
         cancel_check=cancel_check,
     )
 
+def solve_kurschlusskräfte_leiterseile_inverse(inputs, variable: str, ziel: str, zielwert: float,
+                                               untere_grenze: float, obere_grenze: float, lastfall: str = "F_st_20",
+                                               xtol: float = 1e-9) -> pd.DataFrame:
+    """
+    Bestimmt F_st, a oder l_s, bei denen F_td, F_fd, F_pi_d, b_h oder a_min den Zielwert erreicht
+    (siehe KurschlusskräfteLeiterseileMediator.solve_inverse).
+    """
+    mediator = KurschlusskräfteLeiterseileMediator(inputs)
+    return mediator.solve_inverse(
+        variable=variable,
+        ziel=ziel,
+        zielwert=zielwert,
+        untere_grenze=untere_grenze,
+        obere_grenze=obere_grenze,
+        lastfall=lastfall,
+        xtol=xtol,
+    )
 
+def calculate_kurschlusskräfte_leiterseile_screening(inputs, leiterseilkatalog: Optional[Leiterseilkatalog] = None,
+                                                     teilleiter: Optional[tuple[int, ...]] = None,
+                                                     sortierung: str = "F_massg", a_min_grenze: float = 0.0,
+                                                     cancel_check: Optional[Callable[[], bool]] = None) -> pd.DataFrame:
+    """
+    Berechnet das Spannfeld für alle Leiterseile des Leiterseilkatalogs (optional × Anzahl Teilleiter) und gibt eine
+    nach sortierung geordnete Tabelle zurück.
+    """
+    mediator = KurschlusskräfteLeiterseileMediator(inputs)
+    return mediator.calculate_leiterseil_screening(
+        leiterseilkatalog=leiterseilkatalog,
+        teilleiter=teilleiter,
+        sortierung=sortierung,
+        a_min_grenze=a_min_grenze,
+        cancel_check=cancel_check,
+    )
 
-
-
+def optimize_kurschlusskräfte_leiterseile_abstandshalter(inputs, abstandshalter: Optional[tuple[int, ...]] = None,
+                                                          a_s_werte: Optional[tuple[float, ...]] = None,
+                                                          teilleiter: Optional[tuple[int, ...]] = None,
+                                                          l_s_min: float = 0.0, l_s_max: Optional[float] = None,
+                                                          cancel_check: Optional[Callable[[], bool]] = None) -> pd.DataFrame:
+    """
+    Berechnet F_pi_d für die Kombinationen aus Anzahl Abstandshalter, a_s und n und markiert die Pareto-Front
+    Anzahl Abstandshalter gegenüber F_pi_d.
+    """
+    mediator = KurschlusskräfteLeiterseileMediator(inputs)
+    return mediator.optimize_abstandshalter(
+        abstandshalter=abstandshalter,
+        a_s_werte=a_s_werte,
+        teilleiter=teilleiter,
+        l_s_min=l_s_min,
+        l_s_max=l_s_max,
+        cancel_check=cancel_check,
+    )
@@ -0,0 +1,331 @@
+"""
+Lokaler JSON-HTTP-Dienst (ohne Taipy) für die Berechnung der Kurzschlusskräfte von Leiterseilen.
+
+Die Eingaben werden wie in den Excel-Vorlagen mit den State-Variablennamen übergeben (siehe mapping.json,
+"Import Kurzschlusskraft Leiterseile"), die Seildaten werden über leiterseiltyp_selected aus den Leiterseildaten
+gelesen. Die Berechnungen laufen in einem begrenzten ProcessPoolExecutor. Ist die Warteschlange voll, antworten
+Einzelberechnung und Parameterstudie mit 503, die Stapelberechnung wartet auf freie Plätze.
+
+Endpunkte:
+    POST /berechnung   {"eingaben": {...}}
+    POST /sweep        {"eingaben": {...}, "f_st_min": 0.1, "f_st_max": 35.0, "f_st_step": 0.01, "adaptiv": false}
+    POST /batch        {"eingaben_liste": [{...}, ...]} -> NDJSON-Stream, eine Zeile pro Eingabe in Fertigstellungsreihenfolge
+    GET  /metriken     Warteschlangenlänge, Zähler und Latenzen pro Endpunkt
+    GET  /status       Version und Anzahl Worker
+
+Aufruf:
+    python -m src.engines.kurzschlusskraefte_leiterseile_service --port 8765 --workers 4
+"""
+import argparse
+import json
+import math
+import queue
+import statistics
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+
+from src.utils import dataloader, traceback_detail
+from src.utils.leiterseilkatalog import get_leiterseilkatalog
+from src.engines.kurzschlusskraefte_leiterseile_batch import (
+    create_kurzschlusskraefte_leiterseile_input,
+    init_worker,
+)
+from src.engines.kurzschlusskraefte_leiterseile_engine import (
+    calculate_kurschlusskräfte_leiterseile,
+    calculate_kurschlusskräfte_leiterseile_sweep_df,
+)
+
+
+def _json_wert(wert: Any) -> Any:
+    # NaN und Unendlich sind in JSON nicht zulässig
+    if isinstance(wert, float) and not math.isfinite(wert):
+        return None
+    return wert
+
+
+def _berechnung(eingaben: dict[str, Any]) -> dict[str, Any]:
+    # Einzelberechnung im Worker-Prozess
+    inputs = create_kurzschlusskraefte_leiterseile_input(eingaben, get_leiterseilkatalog())
+    calc_result = calculate_kurschlusskräfte_leiterseile(inputs)
+    return {lastfall: {name: _json_wert(wert) for name, wert in asdict(result).items()}
+            for lastfall, result in calc_result.items()}
+
+
+def _sweep(eingaben: dict[str, Any], f_st_min: float, f_st_max: float, f_st_step: float,
+           adaptiv: bool) -> dict[str, list]:
+    # Parameterstudie im Worker-Prozess
+    inputs = create_kurzschlusskraefte_leiterseile_input(eingaben, get_leiterseilkatalog())
+    sweep_df = calculate_kurschlusskräfte_leiterseile_sweep_df(inputs, f_st_min=f_st_min, f_st_max=f_st_max,
+                                                               f_st_step=f_st_step, adaptiv=adaptiv)
+    return {spalte: [_json_wert(float(wert)) for wert in sweep_df[spalte]] for spalte in sweep_df.columns}
+
+
+class Metriken:
+    """Zähler und Latenzen (letzte 1000 Anfragen) pro Endpunkt, threadsicher"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.warteschlange = 0
+        self.zähler = {"abgeschlossen": 0, "fehlgeschlagen": 0, "abgelehnt": 0}
+        self.latenzen: dict[str, deque] = {}
+
+    def eingereicht(self):
+        with self._lock:
+            self.warteschlange += 1
+
+    def erledigt(self, endpunkt: str, latenz: float, erfolgreich: bool):
+        with self._lock:
+            self.warteschlange -= 1
+            self.zähler["abgeschlossen" if erfolgreich else "fehlgeschlagen"] += 1
+            self.latenzen.setdefault(endpunkt, deque(maxlen=1000)).append(latenz)
+
+    def abgelehnt(self):
+        with self._lock:
+            self.zähler["abgelehnt"] += 1
+
+    def auswertung(self) -> dict[str, Any]:
+        with self._lock:
+            latenzen = {endpunkt: sorted(werte) for endpunkt, werte in self.latenzen.items()}
+            auswertung = {"warteschlange": self.warteschlange, **self.zähler}
+        auswertung["latenz_ms"] = {
+            endpunkt: {"anzahl": len(werte), "median": statistics.median(werte) * 1000,
+                       "p95": werte[min(len(werte) - 1, int(0.95 * len(werte)))] * 1000, "max": werte[-1] * 1000}
+            for endpunkt, werte in latenzen.items() if werte}
+        return auswertung
+
+
+class KurzschlusskräfteService:
+    """Begrenzter Worker-Pool mit Warteschlange und Metriken"""
+
+    def __init__(self, workers: Optional[int] = None, max_warteschlange: Optional[int] = None):
+        self.executor = ProcessPoolExecutor(max_workers=workers, initializer=init_worker)
+        self.workers = self.executor._max_workers
+        self.plätze = threading.BoundedSemaphore(max_warteschlange or self.workers * 8)
+        self.metriken = Metriken()
+        self._executor_lock = threading.Lock()
+
+    def _executor_ersetzen(self, executor: ProcessPoolExecutor):
+        # Ersetzt einen abgestürzten Pool, sofern nicht bereits ein anderer Auftrag dies getan hat
+        with self._executor_lock:
+            if self.executor is not executor:
+                return
+            self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=init_worker)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _submit(self, funktion, *args) -> tuple[ProcessPoolExecutor, Future]:
+        # Ein abgestürzter Pool (z.B. beendeter Worker-Prozess) wird ersetzt und die Übergabe einmal wiederholt
+        for versuch in range(2):
+            executor = self.executor
+            try:
+                return executor, executor.submit(funktion, *args)
+            except (BrokenProcessPool, RuntimeError):
+                self._executor_ersetzen(executor)
+                if versuch:
+                    raise
+
+    def einreichen(self, endpunkt: str, funktion, *args, blockieren: bool = False):
+        """
+        Reicht eine Berechnung ein. Gibt None zurück, wenn die Warteschlange voll ist (nur ohne blockieren).
+
+        Raises:
+            BrokenProcessPool, RuntimeError: Wenn die Berechnung auch an einen neuen Pool nicht übergeben werden kann
+        """
+        if not self.plätze.acquire(blocking=blockieren):
+            self.metriken.abgelehnt()
+            return None
+        self.metriken.eingereicht()
+        start = time.perf_counter()
+        try:
+            executor, future = self._submit(funktion, *args)
+        except Exception:
+            self.plätze.release()
+            self.metriken.erledigt(endpunkt, time.perf_counter() - start, False)
+            raise
+
+        def fertig(f):
+            self.plätze.release()
+            exception = None if f.cancelled() else f.exception()
+            self.metriken.erledigt(endpunkt, time.perf_counter() - start, not f.cancelled() and exception is None)
+            if isinstance(exception, BrokenProcessPool):
+                self._executor_ersetzen(executor)
+        future.add_done_callback(fertig)
+        return future
+
+    def shutdown(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+
+class KurzschlusskräfteRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    service: KurzschlusskräfteService = None
+
+    def log_message(self, format: str, *args):
+        # Zugriffsprotokoll unterdrücken, Fehler erscheinen in den Antworten und Metriken
+        pass
+
+    def _antwort(self, status: HTTPStatus, daten: Any):
+        body = json.dumps(daten, ensure_ascii=False, allow_nan=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _fehler(self, status: HTTPStatus, meldung: str):
+        self._antwort(status, {"Fehler": meldung})
+
+    def _anfrage_lesen(self) -> Optional[dict[str, Any]]:
+        try:
+            länge = int(self.headers.get("Content-Length", 0))
+            daten = json.loads(self.rfile.read(länge) or b"{}")
+            if not isinstance(daten, dict):
+                raise ValueError("Der Anfrageinhalt muss ein JSON-Objekt sein.")
+            return daten
+        except (ValueError, json.JSONDecodeError) as e:
+            self._fehler(HTTPStatus.BAD_REQUEST, f"Ungültige Anfrage: {e}")
+            return None
+
+    def do_GET(self):
+        if self.path == "/metriken":
+            self._antwort(HTTPStatus.OK, self.service.metriken.auswertung())
+        elif self.path == "/status":
+            self._antwort(HTTPStatus.OK, {"version": dataloader.get_app_version(), "workers": self.service.workers})
+        else:
+            self._fehler(HTTPStatus.NOT_FOUND, f"Unbekannter Endpunkt {self.path}")
+
+    def do_POST(self):
+        anfrage = self._anfrage_lesen()
+        if anfrage is None:
+            return
+        if self.path == "/berechnung":
+            eingaben = self._eingaben_lesen(anfrage)
+            if eingaben is not None:
+                self._einzeln("berechnung", _berechnung, eingaben)
+        elif self.path == "/sweep":
+            eingaben = self._eingaben_lesen(anfrage)
+            bereich = self._sweep_bereich_lesen(anfrage) if eingaben is not None else None
+            if bereich is not None:
+                self._einzeln("sweep", _sweep, eingaben, *bereich, bool(anfrage.get("adaptiv", False)))
+        elif self.path == "/batch":
+            self._batch(anfrage.get("eingaben_liste", []))
+        else:
+            self._fehler(HTTPStatus.NOT_FOUND, f"Unbekannter Endpunkt {self.path}")
+
+    def _eingaben_lesen(self, anfrage: dict[str, Any]) -> Optional[dict[str, Any]]:
+        eingaben = anfrage.get("eingaben", {})
+        if not isinstance(eingaben, dict):
+            self._fehler(HTTPStatus.BAD_REQUEST, "eingaben muss ein Objekt sein.")
+            return None
+        return eingaben
+
+    def _sweep_bereich_lesen(self, anfrage: dict[str, Any]) -> Optional[tuple[float, float, float]]:
+        try:
+            f_st_min, f_st_max, f_st_step = (float(anfrage.get(name, standard)) for name, standard in
+                                             (("f_st_min", 0.1), ("f_st_max", 35.0), ("f_st_step", 0.01)))
+            if not all(math.isfinite(wert) for wert in (f_st_min, f_st_max, f_st_step)):
+                raise ValueError("f_st_min, f_st_max und f_st_step müssen endlich sein.")
+            if f_st_step <= 0:
+                raise ValueError("f_st_step muss grösser als 0 sein.")
+            if f_st_min >= f_st_max:
+                raise ValueError("f_st_min muss kleiner als f_st_max sein.")
+        except (TypeError, ValueError) as e:
+            self._fehler(HTTPStatus.BAD_REQUEST, f"Ungültige Anfrage: {e}")
+            return None
+        return f_st_min, f_st_max, f_st_step
+
+    def _einzeln(self, endpunkt: str, funktion, *args):
+        try:
+            future = self.service.einreichen(endpunkt, funktion, *args)
+        except Exception as e:
+            self._fehler(HTTPStatus.SERVICE_UNAVAILABLE,
+                         f"Berechnung konnte nicht gestartet werden: {traceback_detail.get_exception_message(e)}")
+            return
+        if future is None:
+            self._fehler(HTTPStatus.SERVICE_UNAVAILABLE, "Warteschlange voll, bitte später erneut versuchen.")
+            return
+        try:
+            self._antwort(HTTPStatus.OK, future.result())
+        except Exception as e:
+            self._fehler(HTTPStatus.UNPROCESSABLE_ENTITY, traceback_detail.get_exception_message(e))
+
+    def _batch(self, eingaben_liste: list):
+        if not isinstance(eingaben_liste, list):
+            self._fehler(HTTPStatus.BAD_REQUEST, "eingaben_liste muss eine Liste sein.")
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "application/x-ndjson; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        # Einreichen in einem eigenen Thread, damit fertige Ergebnisse bereits gestreamt werden, während weitere
+        # Eingaben auf freie Plätze in der Warteschlange warten
+        fertige: queue.Queue = queue.Queue()
+
+        def einreichen():
+            for index, eingaben in enumerate(eingaben_liste):
+                try:
+                    future = self.service.einreichen("batch", _berechnung, eingaben, blockieren=True)
+                except Exception as e:
+                    # Nicht übergebene Eingaben erscheinen als Fehlerzeile, statt den Stream blockieren zu lassen
+                    fertige.put((index, e))
+                    continue
+                future.add_done_callback(lambda f, index=index: fertige.put((index, f)))
+        threading.Thread(target=einreichen, daemon=True).start()
+
+        for _ in range(len(eingaben_liste)):
+            index, future = fertige.get()
+            try:
+                if isinstance(future, Exception):
+                    raise future
+                zeile = {"index": index, "ergebnis": future.result()}
+            except Exception as e:
+                zeile = {"index": index, "Fehler": traceback_detail.get_exception_message(e)}
+            self._chunk((json.dumps(zeile, ensure_ascii=False, allow_nan=False) + "\n").encode("utf-8"))
+        self._chunk(b"")
+
+    def _chunk(self, daten: bytes):
+        self.wfile.write(f"{len(daten):X}\r\n".encode("ascii") + daten + b"\r\n")
+        self.wfile.flush()
+
+
+def create_server(host: str = "127.0.0.1", port: int = 8765, workers: Optional[int] = None,
+                  max_warteschlange: Optional[int] = None) -> tuple[ThreadingHTTPServer, KurzschlusskräfteService]:
+    """Erstellt den HTTP-Server und den Worker-Pool (Start mit server.serve_forever())"""
+    service = KurzschlusskräfteService(workers=workers, max_warteschlange=max_warteschlange)
+    handler = type("Handler", (KurzschlusskräfteRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server, service
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="JSON-HTTP-Dienst Kurzschlusskräfte Leiterseile")
+    parser.add_argument("--host", default="127.0.0.1", help="Adresse (Standard: nur lokal)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Anzahl Worker-Prozesse")
+    parser.add_argument("--max-warteschlange", type=int, default=None, help="Maximale Anzahl offener Berechnungen")
+    args = parser.parse_args(argv)
+
+    server, service = create_server(args.host, args.port, args.workers, args.max_warteschlange)
+    print(f"Dienst läuft auf http://{args.host}:{server.server_port} mit {service.workers} Workern")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
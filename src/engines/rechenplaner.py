@@ -0,0 +1,282 @@
+"""
+Prozessweiter Rechenplaner für Mehrbenutzer-Betrieb der GUI.
+
+Alle Sitzungen teilen sich einen begrenzten ProcessPoolExecutor. Aufträge werden pro Sitzung in eigenen
+Warteschlangen gehalten und reihum (Round-Robin) an den Pool übergeben, sodass eine Sitzung mit vielen Aufträgen
+andere Sitzungen nicht verdrängt. Pro Sitzung laufen höchstens max_pro_sitzung Aufträge gleichzeitig. Der Pool
+erhält nie mehr Aufträge als Worker vorhanden sind, die Reihenfolge bestimmt damit allein der Rechenplaner und
+die Wartezeit eines Auftrags bleibt auch unter Last vorhersehbar.
+
+Laufende Aufträge lassen sich abbrechen: Jeder Worker-Platz hat ein prozessübergreifendes Abbruch-Event, das dem
+laufenden Auftrag zugeordnet ist. Mit abbrechbar=True erhält die Funktion im Worker-Prozess das
+Schlüsselwortargument cancel_check, das nach Auftrag.abbrechen() True zurückgibt.
+
+Beispiel:
+    auftrag = get_rechenplaner().einreichen(state_id, calculate_kurschlusskräfte_leiterseile_sweep_df, inputs,
+                                            abbrechbar=True)
+    auftrag.position()    # 1, 2, ... in der Warteschlange, 0 sobald der Auftrag läuft oder abgeschlossen ist
+    auftrag.result()      # Ergebnis oder Exception des Auftrags
+"""
+import atexit
+import multiprocessing
+import os
+import statistics
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from src.engines.kurzschlusskraefte_leiterseile_batch import init_worker
+
+# Umgebungsvariable für die Anzahl Worker-Prozesse (Standard: Anzahl CPU-Kerne)
+ENV_WORKERS = "KURZSCHLUSSFESTIGKEIT_WORKERS"
+
+
+class WarteschlangeVoll(Exception):
+    pass
+
+
+# Abbruch-Events der Worker-Plätze (wird pro Worker-Prozess gesetzt)
+_abbruch_events: tuple = ()
+
+
+def _init_rechenplaner_worker(abbruch_events: tuple):
+    global _abbruch_events
+    _abbruch_events = abbruch_events
+    init_worker()
+
+
+def _auftrag_ausführen(platz: int, abbrechbar: bool, funktion: Callable, *args) -> Any:
+    # Führt den Auftrag im Worker-Prozess aus, cancel_check prüft das Abbruch-Event des Worker-Platzes
+    if abbrechbar:
+        return funktion(*args, cancel_check=_abbruch_events[platz].is_set)
+    return funktion(*args)
+
+
+class Auftrag:
+    """Eingereichter Auftrag einer Sitzung"""
+
+    def __init__(self, planer: "Rechenplaner", sitzung: str, funktion: Callable, args: tuple, abbrechbar: bool):
+        self._planer = planer
+        self.sitzung = sitzung
+        self.funktion = funktion
+        self.args = args
+        self.abbrechbar = abbrechbar
+        # Worker-Platz (Index des Abbruch-Events), solange der Auftrag läuft
+        self.platz: Optional[int] = None
+        self.future: Future = Future()
+        self.eingereicht = time.perf_counter()
+        self.gestartet: Optional[float] = None
+
+    def position(self) -> int:
+        """Position in der Warteschlange (1 = nächster Auftrag), 0 wenn der Auftrag läuft oder abgeschlossen ist"""
+        return self._planer.position(self)
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Wartet auf das Ergebnis (TimeoutError nach timeout Sekunden, CancelledError nach einem Abbruch)"""
+        return self.future.result(timeout)
+
+    def abbrechen(self) -> bool:
+        """
+        Entfernt den Auftrag aus der Warteschlange. Bei einem bereits laufenden Auftrag wird das Abbruch-Event
+        gesetzt (abbrechbar=True: cancel_check gibt True zurück, sonst wird zu Ende gerechnet) und das Ergebnis
+        verworfen. Gibt True zurück, wenn der Auftrag noch nicht gestartet war.
+        """
+        return self._planer.abbrechen(self)
+
+
+class Rechenplaner:
+    """
+    Begrenzter, gemeinsamer Worker-Pool mit fairer Warteschlange pro Sitzung.
+
+    Args:
+        workers: Anzahl Worker-Prozesse (Standard: KURZSCHLUSSFESTIGKEIT_WORKERS oder Anzahl CPU-Kerne)
+        max_pro_sitzung: Maximale Anzahl gleichzeitig laufender Aufträge einer Sitzung
+        max_warteschlange: Maximale Anzahl wartender Aufträge aller Sitzungen (danach WarteschlangeVoll)
+    """
+
+    def __init__(self, workers: Optional[int] = None, max_pro_sitzung: int = 1, max_warteschlange: int = 256):
+        self.workers = max(1, workers or int(os.environ.get(ENV_WORKERS, 0)) or os.cpu_count() or 1)
+        self.max_pro_sitzung = max(1, max_pro_sitzung)
+        self.max_warteschlange = max_warteschlange
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # Ein Abbruch-Event pro Worker-Platz, da höchstens workers Aufträge gleichzeitig laufen. Die Events werden
+        # den Worker-Prozessen beim Start übergeben (nicht picklebar als Argument eines Auftrags).
+        self._abbruch_events = tuple(multiprocessing.get_context().Event() for _ in range(self.workers))
+        self._freie_plätze = list(range(self.workers))
+        # Reihenfolge der Sitzungen = Round-Robin-Reihenfolge, bediente Sitzungen werden ans Ende verschoben
+        self._warteschlangen: OrderedDict[str, deque[Auftrag]] = OrderedDict()
+        self._laufend: dict[str, int] = {}
+        self._anzahl_laufend = 0
+        # RLock, da done-Callbacks bereits abgeschlossener Futures direkt im einreichenden Thread laufen
+        self._lock = threading.RLock()
+        self._wartezeiten: deque[float] = deque(maxlen=1000)
+        self._laufzeiten: deque[float] = deque(maxlen=1000)
+        self._zähler = {"eingereicht": 0, "abgeschlossen": 0, "fehlgeschlagen": 0, "abgebrochen": 0, "abgelehnt": 0}
+
+    def _executor_holen(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_rechenplaner_worker,
+                                                 initargs=(self._abbruch_events,))
+        return self._executor
+
+    def einreichen(self, sitzung: str, funktion: Callable, *args, abbrechbar: bool = False) -> Auftrag:
+        """
+        Reiht einen Auftrag (Funktion auf Modulebene, Argumente picklebar) in die Warteschlange der Sitzung ein.
+        Mit abbrechbar=True wird funktion zusätzlich mit dem Schlüsselwortargument cancel_check aufgerufen.
+
+        Raises:
+            WarteschlangeVoll: Wenn bereits max_warteschlange Aufträge warten
+        """
+        auftrag = Auftrag(self, sitzung, funktion, args, abbrechbar)
+        with self._lock:
+            if sum(len(schlange) for schlange in self._warteschlangen.values()) >= self.max_warteschlange:
+                self._zähler["abgelehnt"] += 1
+                raise WarteschlangeVoll("Zu viele Berechnungen in der Warteschlange, bitte später erneut versuchen.")
+            self._warteschlangen.setdefault(sitzung, deque()).append(auftrag)
+            self._zähler["eingereicht"] += 1
+            self._verteilen()
+        return auftrag
+
+    def _verteilen(self):
+        # Übergibt wartende Aufträge reihum an freie Worker (nur mit gehaltenem Lock aufrufen)
+        while self._anzahl_laufend < self.workers:
+            auftrag = self._nächster_auftrag()
+            if auftrag is None:
+                return
+            self._starten(auftrag)
+
+    def _nächster_auftrag(self) -> Optional[Auftrag]:
+        for sitzung, schlange in self._warteschlangen.items():
+            if self._laufend.get(sitzung, 0) >= self.max_pro_sitzung:
+                continue
+            auftrag = schlange.popleft()
+            if schlange:
+                self._warteschlangen.move_to_end(sitzung)
+            else:
+                del self._warteschlangen[sitzung]
+            return auftrag
+        return None
+
+    def _starten(self, auftrag: Auftrag):
+        self._laufend[auftrag.sitzung] = self._laufend.get(auftrag.sitzung, 0) + 1
+        self._anzahl_laufend += 1
+        auftrag.gestartet = time.perf_counter()
+        self._wartezeiten.append(auftrag.gestartet - auftrag.eingereicht)
+        auftrag.platz = self._freie_plätze.pop()
+        self._abbruch_events[auftrag.platz].clear()
+        executor = self._executor_holen()
+        try:
+            future = executor.submit(_auftrag_ausführen, auftrag.platz, auftrag.abbrechbar, auftrag.funktion,
+                                     *auftrag.args)
+        except (BrokenProcessPool, RuntimeError) as e:
+            self._executor_verwerfen(executor)
+            future = Future()
+            future.set_exception(e)
+        future.add_done_callback(lambda f: self._fertig(auftrag, executor, f))
+
+    def _executor_verwerfen(self, executor: ProcessPoolExecutor):
+        # Verwirft einen abgestürzten Pool nur, wenn er noch der aktuelle ist. Fallen mehrere Aufträge desselben
+        # Pools aus, hat der erste Callback bereits einen neuen Pool gestartet, der erhalten bleiben muss.
+        if self._executor is executor:
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _fertig(self, auftrag: Auftrag, executor: ProcessPoolExecutor, future: Future):
+        with self._lock:
+            self._laufend[auftrag.sitzung] -= 1
+            if not self._laufend[auftrag.sitzung]:
+                del self._laufend[auftrag.sitzung]
+            self._anzahl_laufend -= 1
+            self._freie_plätze.append(auftrag.platz)
+            auftrag.platz = None
+            self._laufzeiten.append(time.perf_counter() - auftrag.gestartet)
+            exception = future.exception() if not future.cancelled() else CancelledError()
+            if not auftrag.future.cancelled():
+                # Abgebrochene Aufträge sind bereits unter "abgebrochen" gezählt
+                self._zähler["fehlgeschlagen" if exception is not None else "abgeschlossen"] += 1
+            if isinstance(exception, BrokenProcessPool):
+                # Abgestürzten Pool verwerfen, der nächste Auftrag startet einen neuen
+                self._executor_verwerfen(executor)
+            self._verteilen()
+
+        # Ein zwischenzeitlich abgebrochener Auftrag (abbrechen) erhält kein Ergebnis mehr
+        if not auftrag.future.set_running_or_notify_cancel():
+            return
+        if exception is not None:
+            auftrag.future.set_exception(exception)
+        else:
+            auftrag.future.set_result(future.result())
+
+    def position(self, auftrag: Auftrag) -> int:
+        """Position des Auftrags in der Round-Robin-Reihenfolge aller Warteschlangen (0: nicht wartend)"""
+        with self._lock:
+            schlange = self._warteschlangen.get(auftrag.sitzung)
+            if schlange is None or auftrag not in schlange:
+                return 0
+            runde = schlange.index(auftrag)
+            # Pro Runde wird ein Auftrag jeder Sitzung bedient: vor dem Auftrag liegen die früheren Runden aller
+            # Sitzungen und in der eigenen Runde die Sitzungen, die in der Reihenfolge vor der eigenen stehen
+            position, vorne = 0, True
+            for sitzung, andere in self._warteschlangen.items():
+                if sitzung == auftrag.sitzung:
+                    position += runde
+                    vorne = False
+                else:
+                    position += min(len(andere), runde + 1 if vorne else runde)
+            return position + 1
+
+    def abbrechen(self, auftrag: Auftrag) -> bool:
+        with self._lock:
+            schlange = self._warteschlangen.get(auftrag.sitzung)
+            wartend = schlange is not None and auftrag in schlange
+            if wartend:
+                schlange.remove(auftrag)
+                if not schlange:
+                    del self._warteschlangen[auftrag.sitzung]
+            # Gezählt wird nur ein noch nicht abgeschlossener Auftrag. Das Event wird mit gehaltenem Lock gesetzt,
+            # damit der Worker-Platz nicht bereits einem nachfolgenden Auftrag gehört.
+            if auftrag.future.cancel():
+                self._zähler["abgebrochen"] += 1
+                if auftrag.platz is not None:
+                    self._abbruch_events[auftrag.platz].set()
+        return wartend
+
+    def statistik(self) -> dict[str, Any]:
+        """Warteschlangenlänge, laufende Aufträge, Zähler sowie Median und P95 der Warte- und Laufzeiten in ms"""
+        with self._lock:
+            auswertung = {"workers": self.workers, "laufend": self._anzahl_laufend,
+                          "wartend": sum(len(schlange) for schlange in self._warteschlangen.values()),
+                          "sitzungen": len(set(self._warteschlangen) | set(self._laufend)), **self._zähler}
+            zeiten = {"wartezeit_ms": sorted(self._wartezeiten), "laufzeit_ms": sorted(self._laufzeiten)}
+        for name, werte in zeiten.items():
+            if werte:
+                auswertung[name] = {"median": statistics.median(werte) * 1000,
+                                    "p95": werte[min(len(werte) - 1, int(0.95 * len(werte)))] * 1000}
+        return auswertung
+
+    def shutdown(self):
+        with self._lock:
+            wartend = [auftrag for schlange in self._warteschlangen.values() for auftrag in schlange]
+            self._warteschlangen.clear()
+            executor, self._executor = self._executor, None
+        for auftrag in wartend:
+            auftrag.future.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_rechenplaner: Optional[Rechenplaner] = None
+_rechenplaner_lock = threading.Lock()
+
+
+def get_rechenplaner() -> Rechenplaner:
+    """Gibt den prozessweiten Rechenplaner zurück (Worker-Prozesse werden beim ersten Auftrag gestartet)"""
+    global _rechenplaner
+    with _rechenplaner_lock:
+        if _rechenplaner is None:
+            _rechenplaner = Rechenplaner()
+            atexit.register(_rechenplaner.shutdown)
+        return _rechenplaner
@@ -1,4 +1,4 @@
-from .kurzschlusskraefte_leiterseile_calc import kurzschlusskraefte_leiterseile_calc_page, content_vorlage
+from .kurzschlusskraefte_leiterseile_calc import kurzschlusskraefte_leiterseile_calc_page, content_vorlage, on_change_eingabe
 from .kurzschlusskraefte_leiterseile_docu import kurzschlusskraefte_leiterseile_docu_page
 
-__all__ = ["kurzschlusskraefte_leiterseile_calc_page", "kurzschlusskraefte_leiterseile_docu_page", "content_vorlage"]
+__all__ = ["kurzschlusskraefte_leiterseile_calc_page", "kurzschlusskraefte_leiterseile_docu_page", "content_vorlage", "on_change_eingabe"]
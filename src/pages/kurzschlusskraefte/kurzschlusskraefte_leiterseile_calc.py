@@ -2,22 +2,31 @@ import sys
 from pathlib import Path
 from datetime import datetime
 import threading
+import itertools
+import time
+import functools
 import tempfile
 import traceback
+from concurrent.futures import CancelledError
 
 from pandas import DataFrame
 from sympy.core.numbers import NaN
-from taipy.gui import notify, download
+from taipy.gui import notify, download, get_state_id, invoke_callback, invoke_long_callback
 import taipy.gui.builder as tgb
 import pandas as pd
 
 from .root import build_navbar
-from src.utils import dataloader, traceback_detail, mappings
+from src.utils import dataloader, traceback_detail, mappings, diagramm
+from src.utils.leiterseilkatalog import get_leiterseilkatalog
+from src.engines.rechenplaner import get_rechenplaner, WarteschlangeVoll
+from src.engines.kurzschlusskraefte_leiterseile_batch import EINGABE_VARIABLEN, create_kurzschlusskraefte_leiterseile_input
 from src.engines.kurzschlusskraefte_leiterseile_engine import calculate_kurschlusskräfte_leiterseile_sweep_df
 from src.engines.kurzschlusskraefte_leiterseile_engine import (
     KurschlusskräfteLeiterseileInput,
     KurschlusskräfteLeiterseileResult,
-    calculate_kurschlusskräfte_leiterseile,
+    KurschlusskräfteLeiterseileMediator,
+    recalculate_kurschlusskräfte_leiterseile,
+    geänderte_eingaben,
     CalculationCancelled,
 )
 
@@ -60,10 +69,14 @@ Auswahl der Leiterseiltypen:
 2. Selektierung der ersten Spalte mit "Bezeichnung" als List of values für das Dropdown, 
 3. Parameter für das initiale Laden und die spätere Auswahl
 """
-leiterseiltyp: pd.DataFrame = dataloader.load_csv_to_df("Leiterseildaten.csv")
-leiterseiltyp_lov: list[str] = list(leiterseiltyp["Bezeichnung"])
+leiterseiltyp_lov: list[str] = get_leiterseilkatalog().bezeichnungen
 leiterseiltyp_selected: None|str = None
 
+def leiterseiltyp_tabelle(bezeichnung: None|str) -> DataFrame:
+    # Tabelle Leiterseiltypen aus dem gemeinsamen Katalog: Ausgewähltes Leiterseil oder ohne Auswahl alle. Der
+    # State der Sitzung enthält nur die Bezeichnung (leiterseiltyp_selected).
+    return get_leiterseilkatalog().tabelle(bezeichnung)
+
 name_der_verbindung: None|str = ""
 kappa: None|float = None
 t_k: None|float = None
@@ -126,109 +139,182 @@ a_min_min: None|float|str = ""
 calc_result: None | KurschlusskräfteLeiterseileResult = None
 calc_result_formatted: None|DataFrame = None
 sweep_calc_df: None|DataFrame = None
+sweep_chart_df: None|DataFrame = None
 sweep_vline_shapes: list = []
 
-_calc_run_lock = threading.Lock()
-_calc_run_id = 0
 """
-Die folgenden zwei internen Funktionen sind dafür die Schleife zu der For-Loop zur Erstellung des Diagramms
-zu unterbrechen falls wieder auf Berechnung gedrückt wurde. Damit soll sichergestellt werden, das nicht mehrere 
-Schleifen parallel laufen und sich folgend gegenseitig überschreiben. 
-Bei jedem klick zählt die Funktion _next_calc_run_id() eine neue ID aus und gibt diese zurück. 
-Die Funktion _is_run_cancelled() überprüft ob die aktuelle ID noch gültig ist bzw. übereinstimmen. 
-Wenn nicht wird die Berechnung der For-Loop zur Erstellung des Diagramms abgebrochen und die neue kann ihren job machen.
+Die folgenden internen Funktionen unterbrechen die Hintergrundberechnung des Diagramms (Parameterstudie über F_st),
+falls in derselben Sitzung wieder auf Berechnen oder Zurücksetzen gedrückt wurde. Damit wird sichergestellt, dass
+nicht mehrere Berechnungen einer Sitzung parallel laufen und sich gegenseitig überschreiben.
+Die Lauf-IDs werden pro Sitzung (get_state_id) geführt, eine neue Berechnung bricht deshalb nur die Berechnungen
+derselben Sitzung ab und nicht diejenigen anderer Benutzer.
+Bei jedem Klick vergibt die Funktion _next_calc_run_id() der Sitzung eine neue, prozessweit eindeutige ID und gibt
+diese zurück.
+Die Funktion _is_run_cancelled() überprüft, ob die ID noch die aktuelle der Sitzung ist. Wenn nicht, wird die
+Berechnung des Diagramms abgebrochen und die neue kann ihren Job machen.
 """
-def _next_calc_run_id():
-    global _calc_run_id
+_calc_run_lock = threading.Lock()
+_calc_run_ids: dict[str, int] = {}
+_calc_run_zähler = itertools.count(1)
+
+# Letzte Aktivität pro Sitzung (time.monotonic). Taipy meldet das Ende einer Sitzung nicht, die Einträge einer
+# Sitzung werden deshalb beim Zurücksetzen und nach SITZUNG_INAKTIV s ohne Berechnung entfernt.
+_sitzung_aktivität: dict[str, float] = {}
+SITZUNG_INAKTIV = 3600
+
+# Laufende Diagrammberechnung pro Sitzung: Lauf-ID, Auftrag des Rechenplaners und Fehler
+_sweep_jobs: dict[str, dict] = {}
+
+# Intervall in ms, in dem der Stand der Diagrammberechnung (Position in der Warteschlange) an das GUI übertragen wird
+SWEEP_STATUS_PERIODE = 500
+
+# Letzte Berechnung pro Sitzung für die inkrementelle Neuberechnung: Eingaben, Ergebnis und Eingaben des Diagramms
+_letzte_berechnung: dict[str, dict] = {}
+
+# Live-Berechnung: Verzögerung in s nach der letzten Änderung (Entprellung) und Timer pro Sitzung
+live_berechnung: bool = False
+LIVE_VERZÖGERUNG = 0.4
+_live_timer: dict[str, threading.Timer] = {}
+
+# State-Variablen der Eingaben, deren Änderung die Live-Berechnung auslöst
+LIVE_EINGABEN: set[str] = set(EINGABE_VARIABLEN)
+
+# Richtwert für die Anzahl Punkte aller Kurven im Diagramm (sweep_chart_df), sweep_calc_df bleibt vollständig
+SWEEP_CHART_MAX_PUNKTE = 1200
+
+def _next_calc_run_id(state_id: str) -> int:
     with _calc_run_lock:
-        _calc_run_id += 1
-        return _calc_run_id
-
-def _is_run_cancelled(run_id):
-    return run_id != _calc_run_id
-
-# Funktion zur Berechnung des höchsten Punktes im Chart bei gegebenem x-Wert
-def _build_vline_shapes(sweep_df, f_st_values) -> dict:
-    if sweep_df is None or sweep_df.empty:
-        return []
-    if "F_st" not in sweep_df.columns:
-        return []
-
-    sweep_sorted = sweep_df.sort_values("F_st").reset_index(drop=True)
-    f_st_series = sweep_sorted["F_st"]
-    f_st_min = f_st_series.min()
-    f_st_max = f_st_series.max()
-    shapes = []
-
-    for x_value in f_st_values:
-        if x_value in (None, "", NaN):
-            continue
-        try:
-            x_float = float(x_value)
-        except (TypeError, ValueError):
-            continue
-        if x_float < f_st_min or x_float > f_st_max:
-            continue
-
-        if x_float == f_st_series.iloc[0]:
-            row_low = row_high = sweep_sorted.iloc[0]
-            x_low = x_high = f_st_series.iloc[0]
-        elif x_float == f_st_series.iloc[-1]:
-            row_low = row_high = sweep_sorted.iloc[-1]
-            x_low = x_high = f_st_series.iloc[-1]
-        else:
-            idx_upper = f_st_series.searchsorted(x_float, side="left")
-            if idx_upper <= 0 or idx_upper >= len(f_st_series):
-                continue
-            x_low = f_st_series.iloc[idx_upper - 1]
-            x_high = f_st_series.iloc[idx_upper]
-            row_low = sweep_sorted.iloc[idx_upper - 1]
-            row_high = sweep_sorted.iloc[idx_upper]
-
-        y_values = []
-        for col in ["F_td", "F_fd", "F_pi_d"]:
-            if x_low == x_high:
-                y_val = row_low.get(col)
-            else:
-                y_low = row_low.get(col)
-                y_high = row_high.get(col)
-                if y_low in (None, "", NaN) or y_high in (None, "", NaN):
-                    continue
-                if pd.isna(y_low) or pd.isna(y_high):
-                    continue
-                y_val = y_low + (y_high - y_low) * ((x_float - x_low) / (x_high - x_low))
-            if y_val in (None, "", NaN) or pd.isna(y_val):
-                continue
-            y_values.append(y_val)
-
-        if not y_values:
-            continue
-
-        y_top = max(y_values)
-        shapes.append({
-            "type": "line",
-            "xref": "x",
-            "yref": "y",
-            "x0": x_float,
-            "x1": x_float,
-            "y0": 0,
-            "y1": y_top,
-            "line": {"color": "#444444", "width": 1, "dash": "dot"},
-        })
-        shapes.append({
-            "type": "line",
-            "xref": "x",
-            "yref": "y",
-            "x0": 0,
-            "x1": x_float,
-            "y0": y_top,
-            "y1": y_top,
-            "line": {"color": "#444444", "width": 1, "dash": "dot"},
-        })
-
-    return shapes
-
-def _build_sweep_chart_layout(shapes) -> dict:
+        _inaktive_sitzungen_entfernen()
+        # Prozessweit eindeutige IDs: Auch nach dem Entfernen einer Sitzung wird keine frühere ID erneut vergeben
+        _calc_run_ids[state_id] = next(_calc_run_zähler)
+        _sitzung_aktivität[state_id] = time.monotonic()
+        _sweep_jobs.pop(state_id, None)
+        return _calc_run_ids[state_id]
+
+def _sitzung_entfernen(state_id: str):
+    # Entfernt alle Einträge der Sitzung (nur mit gehaltenem _calc_run_lock aufrufen). Laufende Diagrammberechnungen
+    # der Sitzung gelten damit als abgebrochen.
+    for einträge in (_calc_run_ids, _sitzung_aktivität, _sweep_jobs, _letzte_berechnung):
+        einträge.pop(state_id, None)
+    timer = _live_timer.pop(state_id, None)
+    if timer is not None:
+        timer.cancel()
+
+def _inaktive_sitzungen_entfernen():
+    # Entfernt die Einträge beendeter bzw. seit SITZUNG_INAKTIV s inaktiver Sitzungen (nur mit gehaltenem Lock)
+    grenze = time.monotonic() - SITZUNG_INAKTIV
+    for state_id in [state_id for state_id, aktivität in _sitzung_aktivität.items() if aktivität < grenze]:
+        _sitzung_entfernen(state_id)
+
+def _is_run_cancelled(state_id: str, run_id: int) -> bool:
+    return run_id != _calc_run_ids.get(state_id)
+
+def _sweep_job(state_id: str, run_id: int, inputs: KurschlusskräfteLeiterseileInput) -> None|DataFrame:
+    """
+    Reicht das Diagramm beim prozessweiten Rechenplaner ein und wartet auf das Ergebnis (Thread von
+    invoke_long_callback, ohne Zugriff auf den State). Der Auftrag und allfällige Fehler werden in _sweep_jobs
+    abgelegt, _sweep_status meldet daraus die Position in der Warteschlange an das GUI.
+    Gibt None zurück, wenn die Berechnung abgebrochen wurde oder fehlgeschlagen ist.
+    """
+    def fehler_ablegen(fehler: Exception):
+        with _calc_run_lock:
+            if not _is_run_cancelled(state_id, run_id):
+                _sweep_jobs[state_id] = {"run_id": run_id, "auftrag": None, "fehler": fehler}
+
+    try:
+        # Die Regime-Karte wird für die Reduktion der Diagrammdaten benötigt (Umschaltpunkte bleiben erhalten)
+        auftrag = get_rechenplaner().einreichen(state_id, functools.partial(
+            calculate_kurschlusskräfte_leiterseile_sweep_df, mit_regime=True), inputs, abbrechbar=True)
+    except WarteschlangeVoll as wv:
+        fehler_ablegen(wv)
+        return None
+    with _calc_run_lock:
+        if _is_run_cancelled(state_id, run_id):
+            auftrag.abbrechen()
+            return None
+        _sweep_jobs[state_id] = {"run_id": run_id, "auftrag": auftrag, "fehler": None}
+
+    try:
+        # Der Worker-Prozess kennt die Lauf-IDs nicht: Wartende Aufträge werden bei einem Abbruch aus der
+        # Warteschlange entfernt, bereits laufende Aufträge über das Abbruch-Event (cancel_check) beendet.
+        while True:
+            try:
+                return auftrag.result(timeout=SWEEP_STATUS_PERIODE / 1000)
+            except TimeoutError:
+                if _is_run_cancelled(state_id, run_id):
+                    auftrag.abbrechen()
+                    return None
+    except (CalculationCancelled, CancelledError):
+        return None
+    except Exception as sw:
+        error_msg = traceback_detail.get_exception_message(sw)
+        sys.stderr.write(f"{error_msg}\n")
+        traceback.print_exc(limit=10, file=sys.stderr, chain=True)
+        fehler_ablegen(sw)
+        return None
+
+def _sweep_status(state, status, state_id: str, run_id: int, inputs: KurschlusskräfteLeiterseileInput,
+                  sweep_df: None|DataFrame = None):
+    """
+    Statusfunktion von invoke_long_callback: Wird alle SWEEP_STATUS_PERIODE ms mit der Anzahl Perioden (int) und
+    am Ende mit dem Erfolg (bool) und dem Ergebnis aufgerufen. Meldet die Position in der Warteschlange und überträgt
+    das Ergebnis an den State.
+    """
+    if _is_run_cancelled(state_id, run_id):
+        return
+
+    if isinstance(status, bool):
+        with _calc_run_lock:
+            job = _sweep_jobs.pop(state_id, None)
+        if status and sweep_df is not None:
+            with _calc_run_lock:
+                if state_id in _letzte_berechnung:
+                    _letzte_berechnung[state_id]["sweep_inputs"] = inputs
+            _set_sweep_chart(state, sweep_df)
+            notify(state, notification_type="success", message=f"Diagramm mit {len(sweep_df)} Werten erstellt", duration=5000)
+        elif job is not None and job["fehler"] is not None:
+            _set_sweep_chart(state, None)
+            notify(state, notification_type="warning", message=f"Diagramm konnte nicht erstellt werden: {str(job['fehler'])}", duration=10000)
+        elif not status:
+            _set_sweep_chart(state, None)
+            notify(state, notification_type="warning", message="Diagramm konnte nicht erstellt werden", duration=10000)
+        return
+
+    with _calc_run_lock:
+        job = _sweep_jobs.get(state_id)
+        if job is None or job["auftrag"] is None:
+            return
+        position = job["auftrag"].position()
+        if job.get("angezeigt") == position:
+            return
+        job["angezeigt"] = position
+    if position > 0:
+        notify(state, notification_type="info", message=f"Berechnung in Warteschlange, Position {position}", duration=SWEEP_STATUS_PERIODE * 2)
+    else:
+        notify(state, notification_type="info", message="Diagramm wird berechnet", duration=SWEEP_STATUS_PERIODE * 2)
+
+def _set_sweep_chart(state, sweep_df: None|DataFrame):
+    # Überträgt das Ergebnis der Diagrammberechnung inklusive Hilfslinien an den State. Das Diagramm erhält
+    # die reduzierten Daten, Umschaltpunkte und die Werte bei F_st_20 und F_st_80 bleiben exakt erhalten.
+    state.sweep_calc_df = sweep_df
+    state.sweep_chart_df = diagramm.reduce_chart_df(sweep_df, "F_st", ["F_td", "F_fd", "F_pi_d"],
+                                                    max_punkte=SWEEP_CHART_MAX_PUNKTE,
+                                                    feste_x=[state.F_st_20, state.F_st_80])
+    state.sweep_vline_shapes, annotations = _build_sweep_annotations(state, sweep_df)
+    state.sweep_chart_layout = _build_sweep_chart_layout(state.sweep_vline_shapes, annotations)
+
+# Hilfslinien und Beschriftungen der Betriebspunkte (F_st bei tiefster und höchster Temperatur) im Diagramm. Die
+# Kurven werden in einem Durchlauf an allen Markierungen interpoliert, die Hilfslinien enden an der Umhüllenden.
+def _build_sweep_annotations(state, sweep_df) -> tuple[list, list]:
+    markierungen = {
+        f"{state.temperatur_niedrig_selected} °C": state.F_st_20,
+        f"{state.temperatur_hoch_selected} °C": state.F_st_80,
+    }
+    return diagramm.build_marker_annotations(sweep_df, "F_st", ["F_td", "F_fd", "F_pi_d"], markierungen,
+                                             namen={"F_td": "F<sub>td</sub>", "F_fd": "F<sub>fd</sub>",
+                                                    "F_pi_d": "F<sub>pi d</sub>"})
+
+def _build_sweep_chart_layout(shapes, annotations=None) -> dict:
     return {
         "paper_bgcolor": "white",
         "plot_bgcolor": "white",
@@ -254,6 +340,7 @@ def _build_sweep_chart_layout(shapes) -> dict:
             "zerolinecolor": "black",
         },
         "shapes": shapes,
+        "annotations": annotations or [],
         "legend": {"title": {"text": "Legende:"}, "orientation": "h", "y": -0.15, "x": 0, "bgcolor": "transparent"},
         "margin": {"l": 60, "r": 20, "t": 60, "b": 60},
     }
@@ -317,12 +404,13 @@ def display_results(state) -> None:
 
 def on_change_selectable_leiterseiltyp(state):
     #state.leiterseiltyp_lov = list(state.leiterseiltyp.keys())
-    state.leiterseiltyp = leiterseiltyp[leiterseiltyp["Bezeichnung"] == state.leiterseiltyp_selected]
-    notify(state, notification_type="info", message=f'Leiterseiltyp auf {state.leiterseiltyp["Bezeichnung"].values[0]} geändert')
+    if state.leiterseiltyp_selected not in get_leiterseilkatalog():
+        return
+    notify(state, notification_type="info", message=f'Leiterseiltyp auf {state.leiterseiltyp_selected} geändert')
+    on_change_eingabe(state, "leiterseiltyp_selected", state.leiterseiltyp_selected)
     #print(state.leiterseiltyp["Dauerstrombelastbarkeit"].values[0])
 
 def on_click_leiterseiltyp_zurücksetzen(state):
-    state.leiterseiltyp = dataloader.load_csv_to_df("Leiterseildaten.csv")
     state.leiterseiltyp_selected = None
     #state.leiterseiltyp_lov = list(state.leiterseiltyp.keys())
     notify(state, notification_type="info", message="Auswahl aufgehoben")
@@ -396,11 +484,107 @@ def on_click_zurücksetzen(state):
     state.calc_result = None
     state.calc_result_formatted = None
     state.sweep_calc_df = None
+    state.sweep_chart_df = None
     state.sweep_vline_shapes = []
     state.sweep_chart_layout = _build_sweep_chart_layout([])
 
+    # Laufende Diagrammberechnung der Sitzung abbrechen und alle Einträge der Sitzung (letzte Berechnung,
+    # Live-Timer) verwerfen
+    with _calc_run_lock:
+        _sitzung_entfernen(get_state_id(state))
+
+def _create_inputs(state) -> KurschlusskräfteLeiterseileInput:
+    # Erstellung des Input-Objekts für den Mediator aus den Eingaben des States (gleiche Umwandlung wie in der
+    # Stapelverarbeitung), die Seildaten stammen aus dem gemeinsamen Leiterseilkatalog
+    eingaben = {name: getattr(state, name) for name in EINGABE_VARIABLEN}
+    return create_kurzschlusskraefte_leiterseile_input(eingaben, get_leiterseilkatalog())
+
+def _berechnen(state, state_id: str, run_id: int, inputs: KurschlusskräfteLeiterseileInput) -> bool:
+    """
+    Berechnet die Ergebnisse inkrementell gegenüber der letzten Berechnung der Sitzung: Nicht betroffene Lastfälle
+    werden übernommen, das Diagramm wird nur neu berechnet, wenn sich ein Eingabewert ausser F_st_20, F_st_80 und
+    den Temperaturen geändert hat (sonst werden nur die Markierungen aktualisiert).
+    Gibt False zurück, wenn die Berechnung durch eine neuere Berechnung der Sitzung abgelöst wurde.
+    """
+    letzte = _letzte_berechnung.get(state_id, {})
+    calc_result, _ = recalculate_kurschlusskräfte_leiterseile(inputs, letzte.get("inputs"), letzte.get("ergebnis"))
+
+    # Überprüft, ob in der Zwischenzeit in derselben Sitzung erneut berechnet oder zurückgesetzt wurde
+    with _calc_run_lock:
+        if _is_run_cancelled(state_id, run_id):
+            return False
+        _letzte_berechnung[state_id] = {"inputs": inputs, "ergebnis": calc_result,
+                                        "sweep_inputs": letzte.get("sweep_inputs")}
+
+    # Übertragung der berechneten Werte an den state
+    state.calc_result = calc_result
+
+    # Darstellung und Auswertung der Ergebnisse
+    display_results(state)
+
+    sweep_inputs = letzte.get("sweep_inputs")
+    if sweep_inputs is not None and state.sweep_calc_df is not None and \
+            not KurschlusskräfteLeiterseileMediator.sweep_invalidiert(geänderte_eingaben(inputs, sweep_inputs)):
+        _set_sweep_chart(state, state.sweep_calc_df)
+        return True
+
+    # Diagramm als Hintergrundjob berechnen, damit das GUI der Sitzung während der Berechnung bedienbar bleibt.
+    # Das Diagramm wird im gemeinsamen Worker-Pool des Rechenplaners berechnet, das Ergebnis wird von _sweep_status
+    # an den State übertragen.
+    with _calc_run_lock:
+        if state_id in _letzte_berechnung:
+            _letzte_berechnung[state_id]["sweep_inputs"] = None
+    _set_sweep_chart(state, None)
+    invoke_long_callback(state, _sweep_job, [state_id, run_id, inputs],
+                         _sweep_status, [state_id, run_id, inputs], period=SWEEP_STATUS_PERIODE)
+    return True
+
+def on_change_eingabe(state, var_name, var_value):
+    """
+    Globale on_change-Funktion (in main.py registriert): Bei aktivierter Live-Berechnung wird nach einer Änderung
+    eines Eingabewerts und LIVE_VERZÖGERUNG Sekunden ohne weitere Änderung inkrementell neu berechnet. Voraussetzung
+    ist eine vorgängige Berechnung über Berechnen.
+    """
+    if var_name not in LIVE_EINGABEN or not state.live_berechnung:
+        return
+    state_id = get_state_id(state)
+    if state_id not in _letzte_berechnung:
+        return
+
+    timer = threading.Timer(LIVE_VERZÖGERUNG, invoke_callback,
+                            args=(state.get_gui(), state_id, _live_neuberechnung, []))
+    timer.daemon = True
+    with _calc_run_lock:
+        vorheriger_timer = _live_timer.pop(state_id, None)
+        _live_timer[state_id] = timer
+    if vorheriger_timer is not None:
+        vorheriger_timer.cancel()
+    timer.start()
+
+def _live_neuberechnung(state):
+    # Verzögerte Neuberechnung der Live-Berechnung (über invoke_callback mit dem State der Sitzung)
+    state_id = get_state_id(state)
+    with _calc_run_lock:
+        _live_timer.pop(state_id, None)
+    try:
+        inputs = _create_inputs(state)
+    except (TypeError, ValueError, IndexError, KeyError):
+        # Unvollständige Eingaben während der Eingabe, die Berechnung erfolgt nach der nächsten Änderung
+        return
+
+    run_id = _next_calc_run_id(state_id)
+    try:
+        _berechnen(state, state_id, run_id, inputs)
+    except NotImplementedError:
+        return
+    except Exception as e:
+        error_msg = traceback_detail.get_exception_message(e)
+        sys.stderr.write(f"{error_msg}\n")
+        notify(state, notification_type="warning", message=f"Live-Berechnung fehlgeschlagen: {error_msg}", duration=10000)
+
 def on_click_berechnen(state):
-    run_id = _next_calc_run_id()
+    state_id = get_state_id(state)
+    run_id = _next_calc_run_id(state_id)
 
     required_fields = [
         # Allgemeine Angaben
@@ -511,85 +695,11 @@ def on_click_berechnen(state):
 
     try:
         # Erstellung des Input-Objekts für den Mediator
-        inputs = KurschlusskräfteLeiterseileInput(
-            leiterseilbefestigung=str(state.leiterseilbefestigung_selected),
-            schlaufe_in_spannfeldmitte=str(state.schlaufe_in_spannfeldmitte_selected),
-            hoehenunterschied_befestigungspunkte=str(state.hoehenunterschied_befestigungspunkte_selected),
-            schlaufenebene_parallel_senkrecht=str(state.schlaufenebene_parallel_senkrecht_selected),
-            temperatur_niedrig=int(state.temperatur_niedrig_selected),
-            temperatur_hoch=int(state.temperatur_hoch_selected),
-            standardkurzschlussstroeme=float(state.standardkurzschlussstroeme_selected),
-            κ=float(state.kappa),
-            t_k=float(state.t_k),
-            f=float(state.frequenz_des_netzes_selected),
-            leiterseiltyp=str(state.leiterseiltyp_selected) if state.leiterseiltyp_selected else None,
-            d=float(state.leiterseiltyp["Aussendurchmesser"].values[0]),
-            A_s=float(state.leiterseiltyp["Querschnitt eines Teilleiters"].values[0]),
-            m_s=float(state.leiterseiltyp["Massenbelag eines Teilleiters"].values[0]),
-            E=float(state.leiterseiltyp["Elastizitätsmodul"].values[0]),
-            c_th=float(state.leiterseiltyp["Kurzzeitstromdichte"].values[0]),
-            n=int(state.teilleiter_selected),
-            m_c=float(state.m_c) if state.m_c not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l=float(state.l),
-            l_i=float(state.l_i) if state.l_i not in (None, 0.0, 0, '', '0.0', '0')  else None,
-            l_h_f= float(state.l_h_f) if state.l_h_f not in (None, 0.0, 0, '', '0.0', '0')  else None,
-            a=float(state.a),
-            a_s=float(state.a_s) if state.a_s not in (None, 0.0, 0, '', '0.0', '0') else None,
-            F_st_20=float(state.F_st_20),
-            F_st_80=float(state.F_st_80),
-            S=int(state.S),
-            l_s_1=float(state.l_s_1) if state.l_s_1 not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l_s_2=float(state.l_s_2) if state.l_s_2 not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l_s_3=float(state.l_s_3) if state.l_s_3 not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l_s_4=float(state.l_s_4) if state.l_s_4 not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l_s_5=float(state.l_s_5) if state.l_s_5 not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l_s_6=float(state.l_s_6) if state.l_s_6 not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l_s_7=float(state.l_s_7) if state.l_s_7 not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l_s_8=float(state.l_s_8) if state.l_s_8 not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l_s_9=float(state.l_s_9) if state.l_s_9 not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l_s_10=float(state.l_s_10) if state.l_s_10 not in (None, 0.0, 0, '', '0.0', '0') else None,
-            h=float(state.h) if state.h not in (None, 0.0, 0, '', '0.0', '0') else None,
-            w=float(state.w) if state.w not in (None, 0.0, 0, '', '0.0', '0') else None,
-            l_v=float(state.l_v) if state.l_v not in (None, 0.0, 0, '', '0.0', '0') else None
-        )
-
-        # Berechnung über den Mediator
-        #print(inputs)
-        calc_result = calculate_kurschlusskräfte_leiterseile(inputs)
-
-        # Überprüft, ob das Abbruchkriterium bei mehrfachem Klicken von Berechnen für die For-Loop des Diagramms zutrifft
-        if _is_run_cancelled(run_id):
-            return
-
-        # Übertragung der berechneten Werte an den state
-        state.calc_result = calc_result
-
-        # Darstellung und Auswertung der Ergebnisse
-        display_results(state)
+        inputs = _create_inputs(state)
 
-        notify(state, notification_type="success", message="Berechnung erfolgreich abgeschlossen", duration=5000)
-
-        # Überprüft, ob das Abbruchkriterium bei mehrfachem Klicken von Berechnen für die For-Loop des Diagramms zutrifft
-        if _is_run_cancelled(run_id):
-            return
-
-        try:
-            state.sweep_calc_df = calculate_kurschlusskräfte_leiterseile_sweep_df(inputs, cancel_check=lambda: _is_run_cancelled(run_id))
-            state.sweep_vline_shapes = _build_vline_shapes(state.sweep_calc_df, [state.F_st_20, state.F_st_80])
-            state.sweep_chart_layout = _build_sweep_chart_layout(state.sweep_vline_shapes)
-            # print("Sweep calc df preview:")
-            # print(state.sweep_calc_df.head(10).to_string(index=False))
-            notify(state, notification_type="success", message=f"Diagramm mit {len(state.sweep_calc_df)} Werten erstellt", duration=5000)
-        except CalculationCancelled:
-            return
-        except Exception as sw:
-            state.sweep_calc_df = None
-            state.sweep_vline_shapes = []
-            state.sweep_chart_layout = _build_sweep_chart_layout([])
-            error_msg = traceback_detail.get_exception_message(sw)
-            sys.stderr.write(f"{error_msg}\n")
-            notify(state, notification_type="warning", message=f"Diagramm konnte nicht erstellt werden: {str(sw)}", duration=10000)
-            traceback.print_exc(limit=10, file=sys.stderr, chain=True)
+        # Berechnung über den Mediator (nur die von den Änderungen betroffenen Lastfälle und das Diagramm)
+        if _berechnen(state, state_id, run_id, inputs):
+            notify(state, notification_type="success", message="Berechnung erfolgreich abgeschlossen", duration=5000)
 
     except ValueError as ve:
         error_msg = traceback_detail.get_exception_message(ve, show_chain=True)
@@ -803,6 +913,32 @@ def on_click_export_vorlage(state):
         notify(state, notification_type="error", message=f"Fehler beim Export{error_msg}", duration=15000)
         traceback.print_exc(limit=10, file=sys.stderr, chain=True)
 
+def on_click_export_diagramm(state):
+    """
+    Exportiert die vollständigen Diagrammdaten (ohne Reduktion für die Darstellung) als CSV-Datei.
+    """
+    try:
+        if state.sweep_calc_df is None or state.sweep_calc_df.empty:
+            notify(state, notification_type="warning", message="Keine Diagrammdaten vorhanden. Bitte zuerst berechnen.", duration=10000)
+            return
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        connection_name = state.name_der_verbindung if state.name_der_verbindung else "Unbenannt"
+        connection_name = "".join(c for c in connection_name if c.isalnum() or c in (' ', '_', '-')).strip()
+        if not connection_name:
+            connection_name = "Unbenannt"
+        filename = f"{connection_name}_Diagramm_{timestamp}.csv"
+
+        file_content = state.sweep_calc_df.to_csv(index=False, sep=";").encode("utf-8-sig")
+        download(state, content=file_content, name=filename)
+        notify(state, notification_type="success", message=f"Download gestartet: {filename}", duration=5000)
+
+    except Exception as e:
+        error_msg = traceback_detail.get_exception_message(e)
+        sys.stderr.write(f"{error_msg}\n")
+        notify(state, notification_type="error", message=f"Fehler beim Export{error_msg}", duration=15000)
+        traceback.print_exc(limit=10, file=sys.stderr, chain=True)
+
 with tgb.Page() as kurzschlusskraefte_leiterseile_calc_page:
     build_navbar()
     tgb.html("br")
@@ -961,6 +1097,8 @@ with tgb.Page() as kurzschlusskraefte_leiterseile_calc_page:
             tgb.html("br")
             with tgb.layout(columns="1 1 1", columns__mobile="1", class_name="p0"):
                 tgb.button(label="Berechnen", on_action=on_click_berechnen, class_name="fullwidth")
+                tgb.toggle(value="{live_berechnung}", label="Live-Berechnung",
+                           hover_text="Nach einer Berechnung werden Änderungen der Eingaben automatisch nachgerechnet.")
                 tgb.button(label="Alles zurücksetzen", on_action=on_click_zurücksetzen, class_name="fullwidth")
                 tgb.button(label="Leiterseiltyp aufheben", on_action=on_click_leiterseiltyp_zurücksetzen, class_name="fullwidth")
             tgb.html("br")
@@ -1029,15 +1167,16 @@ with tgb.Page() as kurzschlusskraefte_leiterseile_calc_page:
             with tgb.layout(columns="1", class_name="layout-fit", columns__mobile="1"):
                 with tgb.expandable(title="Diagramm", expanded=False, class_name="h6 expandable-fit"):
                     with tgb.part(class_name="expandable-scroll"):
-                        tgb.chart(data="{sweep_calc_df}", x="F_st",
+                        tgb.chart(data="{sweep_chart_df}", x="F_st",
                                   y=["F_td", "F_fd", "F_pi_d"], name=["F<sub>td</sub>", "F<sub>fd</sub>", "F<sub>pi d</sub>"],
                                   color=["red", "blue", "green"], mode="lines", rebuild=True, height="800px", width="100%",
                                   layout="{sweep_chart_layout}")
+                        tgb.button(label="Diagrammdaten herunterladen (CSV)", on_action=on_click_export_diagramm)
                         #tgb.table(examples="{calc_result_formatted}", rebuild=True, show_all=True, number_format="%.3e", size="small", width="35%")
                     #with tgb.expandable(title="Zusätzliche Berechnungsergebnisse", expanded=False, class_name="h6"):
                         #tgb.text(value="{calc_result_formatted}", mode="pre")
     with tgb.layout(columns="1", class_name="p1 layout-fit", columns__mobile="1"):
         with tgb.expandable(title="Tabelle Leiterseiltypen", expanded=False, class_name="expandable-fit"):
             with tgb.part(class_name="expandable-scroll"):
-                tgb.table("{leiterseiltyp}", width="100%")
+                tgb.table("{leiterseiltyp_tabelle(leiterseiltyp_selected)}", width="100%")
 
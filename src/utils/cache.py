@@ -0,0 +1,231 @@
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+from src.utils import dataloader, traceback_detail
+
+CACHE_DIRECTORY_NAME = ".cache"
+CACHE_FILE_NAME = "ergebnisse.sqlite"
+
+# Umgebungsvariablen zum Übersteuern des Cache-Verzeichnisses bzw. zum Abschalten des Caches ("0")
+ENV_CACHE_DIRECTORY = "KURZSCHLUSSFESTIGKEIT_CACHE_DIR"
+ENV_CACHE_AKTIV = "KURZSCHLUSSFESTIGKEIT_CACHE"
+
+# Quelltexte (relativ zum Projekt-Root), deren Inhalt in die Version der Cache-Einträge eingeht. Jede Änderung einer
+# Berechnungsfunktion oder der Engine verwirft damit die gespeicherten Ergebnisse, auch bei unveränderter App-Version.
+BERECHNUNGS_QUELLTEXTE = ("src/calculations/*.py", "src/engines/kurzschlusskraefte_leiterseile_engine.py")
+
+
+def _normalisieren(wert: Any) -> Any:
+    """Wandelt einen Wert in eine JSON-taugliche, eindeutige Darstellung um (Dataclasses, NumPy-Werte, Tuples)"""
+    if is_dataclass(wert) and not isinstance(wert, type):
+        return {feld.name: _normalisieren(getattr(wert, feld.name)) for feld in fields(wert)}
+    if isinstance(wert, dict):
+        return {str(schlüssel): _normalisieren(element) for schlüssel, element in wert.items()}
+    if isinstance(wert, (list, tuple)):
+        return [_normalisieren(element) for element in wert]
+    if hasattr(wert, "tolist"):
+        # NumPy-Skalare und -Arrays
+        return _normalisieren(wert.tolist())
+    if isinstance(wert, float):
+        # repr ist für floats eindeutig und umkehrbar, -0.0 wird zu 0.0 normalisiert
+        return repr(wert + 0.0)
+    return wert
+
+
+def berechnungs_version() -> str:
+    """Gibt die App-Version und einen Hash der Quelltexte in BERECHNUNGS_QUELLTEXTE zurück"""
+    quelltext_hash = hashlib.sha256()
+    for muster in BERECHNUNGS_QUELLTEXTE:
+        for datei in sorted(dataloader.get_project_root().glob(muster)):
+            quelltext_hash.update(datei.name.encode("utf-8"))
+            quelltext_hash.update(datei.read_bytes())
+    return f"{dataloader.get_app_version()}+{quelltext_hash.hexdigest()[:16]}"
+
+
+def canonical_hash(*teile: Any) -> str:
+    """
+    Erstellt einen kanonischen SHA-256-Hash aus den Teilen (z.B. Eingabe-Dataclass, Fall-Key, Version, Parameter).
+    Gleiche Werte ergeben unabhängig von Reihenfolge der Dictionary-Keys und Zahlentyp (float/NumPy) denselben Hash.
+    """
+    text = json.dumps(_normalisieren(list(teile)), sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ErgebnisCache:
+    """
+    Inhaltsadressierter Ergebnis-Cache mit zwei Stufen:
+    - Arbeitsspeicher: LRU mit max_einträge Einträgen
+    - Festplatte: SQLite-Datei mit Grössenbegrenzung max_bytes, die am längsten nicht verwendeten Einträge werden
+      zuerst entfernt. Einträge einer anderen Version (App-Version und Quelltext-Hash der Berechnungen, siehe
+      berechnungs_version) werden beim Öffnen gelöscht.
+
+    Die Werte werden mit pickle gespeichert, der Cache ist deshalb nur für lokale, vertrauenswürdige Verzeichnisse
+    vorgesehen. Fehler der Festplattenstufe werden gemeldet, die Berechnung läuft ohne diese Stufe weiter.
+    """
+
+    def __init__(self, verzeichnis: Optional[str | Path] = None, version: Optional[str] = None,
+                 max_einträge: int = 128, max_bytes: int = 256 * 1024 ** 2):
+        self.version = version if version is not None else berechnungs_version()
+        self.max_einträge = max_einträge
+        self.max_bytes = max_bytes
+        self._speicher: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.statistik = {"Treffer Speicher": 0, "Treffer Festplatte": 0, "Fehlschläge": 0}
+
+        self._datei: Optional[Path] = None
+        if verzeichnis is not None:
+            try:
+                Path(verzeichnis).mkdir(parents=True, exist_ok=True)
+                datei = Path(verzeichnis, CACHE_FILE_NAME)
+                with self._verbinden(datei) as verbindung:
+                    verbindung.execute(
+                        "CREATE TABLE IF NOT EXISTS eintraege (schluessel TEXT PRIMARY KEY, version TEXT NOT NULL, "
+                        "wert BLOB NOT NULL, groesse INTEGER NOT NULL, zugriff REAL NOT NULL)")
+                    verbindung.execute("DELETE FROM eintraege WHERE version != ?", (self.version,))
+                self._datei = datei
+            except (sqlite3.Error, OSError) as e:
+                self._festplatte_fehler(e)
+
+    @staticmethod
+    @contextmanager
+    def _verbinden(datei: Path) -> Iterator[sqlite3.Connection]:
+        # Transaktion (commit bzw. rollback) und anschliessendes Schliessen der Verbindung
+        with closing(sqlite3.connect(datei, timeout=5.0)) as verbindung, verbindung:
+            yield verbindung
+
+    def _festplatte_fehler(self, exception: BaseException):
+        # Festplattenstufe deaktivieren, der Cache arbeitet nur noch im Arbeitsspeicher
+        error_msg = traceback_detail.get_exception_message(exception)
+        sys.stderr.write(f"Warning: Ergebnis-Cache auf der Festplatte deaktiviert.\n{error_msg}\n")
+        traceback.print_exc(limit=10, file=sys.stderr, chain=True)
+        self._datei = None
+
+    def get(self, schlüssel: str) -> Optional[Any]:
+        """Gibt den Wert zum Schlüssel zurück oder None"""
+        with self._lock:
+            if schlüssel in self._speicher:
+                self._speicher.move_to_end(schlüssel)
+                self.statistik["Treffer Speicher"] += 1
+                return self._speicher[schlüssel]
+            datei = self._datei
+
+        # Zugriff auf die Festplatte ohne Lock, SQLite regelt gleichzeitige Zugriffe selbst
+        if datei is not None:
+            zeile = None
+            try:
+                with self._verbinden(datei) as verbindung:
+                    zeile = verbindung.execute("SELECT wert FROM eintraege WHERE schluessel = ? AND version = ?",
+                                               (schlüssel, self.version)).fetchone()
+                    if zeile is not None:
+                        verbindung.execute("UPDATE eintraege SET zugriff = ? WHERE schluessel = ?",
+                                           (time.time(), schlüssel))
+            except (sqlite3.Error, OSError) as e:
+                self._festplatte_fehler(e)
+
+            if zeile is not None:
+                try:
+                    wert = pickle.loads(zeile[0])
+                except Exception:
+                    # Nicht mehr lesbarer Eintrag (z.B. geänderte Dataclass bei unveränderter App-Version): Fehlschlag
+                    self._entfernen(datei, schlüssel)
+                else:
+                    with self._lock:
+                        self._speicher_setzen(schlüssel, wert)
+                        self.statistik["Treffer Festplatte"] += 1
+                    return wert
+
+        with self._lock:
+            self.statistik["Fehlschläge"] += 1
+        return None
+
+    def _entfernen(self, datei: Path, schlüssel: str):
+        try:
+            with self._verbinden(datei) as verbindung:
+                verbindung.execute("DELETE FROM eintraege WHERE schluessel = ?", (schlüssel,))
+        except (sqlite3.Error, OSError) as e:
+            self._festplatte_fehler(e)
+
+    def set(self, schlüssel: str, wert: Any):
+        """Speichert den Wert in beiden Stufen"""
+        with self._lock:
+            self._speicher_setzen(schlüssel, wert)
+            datei = self._datei
+        if datei is None:
+            return
+
+        try:
+            daten = pickle.dumps(wert, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Nicht serialisierbare Werte bleiben nur im Arbeitsspeicher
+            return
+        if len(daten) > self.max_bytes:
+            return
+        try:
+            with self._verbinden(datei) as verbindung:
+                verbindung.execute("INSERT OR REPLACE INTO eintraege VALUES (?, ?, ?, ?, ?)",
+                                   (schlüssel, self.version, daten, len(daten), time.time()))
+                self._verdrängen(verbindung)
+        except (sqlite3.Error, OSError) as e:
+            self._festplatte_fehler(e)
+
+    def _speicher_setzen(self, schlüssel: str, wert: Any):
+        self._speicher[schlüssel] = wert
+        self._speicher.move_to_end(schlüssel)
+        while len(self._speicher) > self.max_einträge:
+            self._speicher.popitem(last=False)
+
+    def _verdrängen(self, verbindung: sqlite3.Connection):
+        # Am längsten nicht verwendete Einträge entfernen, bis die Grössenbegrenzung eingehalten ist
+        gesamt = verbindung.execute("SELECT COALESCE(SUM(groesse), 0) FROM eintraege").fetchone()[0]
+        if gesamt <= self.max_bytes:
+            return
+        for schlüssel, grösse in verbindung.execute(
+                "SELECT schluessel, groesse FROM eintraege ORDER BY zugriff ASC").fetchall():
+            verbindung.execute("DELETE FROM eintraege WHERE schluessel = ?", (schlüssel,))
+            gesamt -= grösse
+            if gesamt <= self.max_bytes:
+                break
+
+    def clear(self):
+        """Leert beide Stufen"""
+        with self._lock:
+            self._speicher.clear()
+            datei = self._datei
+        if datei is not None:
+            try:
+                with self._verbinden(datei) as verbindung:
+                    verbindung.execute("DELETE FROM eintraege")
+            except (sqlite3.Error, OSError) as e:
+                self._festplatte_fehler(e)
+
+
+_ergebnis_cache: Optional[ErgebnisCache] = None
+_ergebnis_cache_lock = threading.Lock()
+
+
+def get_ergebnis_cache() -> Optional[ErgebnisCache]:
+    """
+    Gibt den prozessweiten Ergebnis-Cache zurück (None, wenn über KURZSCHLUSSFESTIGKEIT_CACHE=0 abgeschaltet).
+    Das Verzeichnis ist KURZSCHLUSSFESTIGKEIT_CACHE_DIR oder .cache im Projekt-Root.
+    """
+    global _ergebnis_cache
+    if os.environ.get(ENV_CACHE_AKTIV, "1") == "0":
+        return None
+    with _ergebnis_cache_lock:
+        if _ergebnis_cache is None:
+            verzeichnis = os.environ.get(ENV_CACHE_DIRECTORY) or Path(dataloader.get_project_root(),
+                                                                      CACHE_DIRECTORY_NAME)
+            _ergebnis_cache = ErgebnisCache(verzeichnis=verzeichnis)
+        return _ergebnis_cache
@@ -0,0 +1,277 @@
+"""
+Aufbereitung der Diagrammdaten zwischen den Berechnungsergebnissen und den Taipy-Charts.
+
+Die Parameterstudie über F_st liefert mehrere tausend Zeilen pro Kurve. Für die Darstellung genügen einige hundert
+Punkte pro Kurve, die Kurven werden deshalb serverseitig mit Largest-Triangle-Three-Buckets (LTTB) reduziert, bevor
+sie an den Browser gesendet werden. Feste Punkte (Umschaltpunkte der Berechnungszweige, Markierungen wie F_st bei
+tiefster und höchster Temperatur) bleiben exakt erhalten. Das vollständige DataFrame bleibt für den Export unverändert.
+"""
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+
+def _als_float(wert) -> float:
+    try:
+        return float(wert)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def lttb_indizes(x: np.ndarray, y: np.ndarray, anzahl: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets: Wählt anzahl Punkte aus, die den Kurvenverlauf visuell erhalten.
+    Erster und letzter Punkt werden immer übernommen, aus jedem Bucket dazwischen der Punkt mit der grössten
+    Dreiecksfläche zum zuletzt gewählten Punkt und zum Mittelwert des nächsten Buckets.
+
+    Args:
+        x: Aufsteigend sortierte x-Werte (ohne NaN)
+        y: y-Werte (ohne NaN)
+        anzahl: Anzahl auszuwählender Punkte
+
+    Returns:
+        Sortierte Indizes der ausgewählten Punkte
+    """
+    n = len(x)
+    if anzahl >= n or n <= 2:
+        return np.arange(n)
+    if anzahl < 3:
+        return np.array([0, n - 1])
+
+    # Bucketgrenzen für die Punkte zwischen dem ersten und dem letzten Punkt
+    grenzen = np.linspace(1, n - 1, anzahl - 1).astype(int)
+    indizes = np.empty(anzahl, dtype=int)
+    indizes[0] = 0
+    indizes[-1] = n - 1
+    a = 0
+    for i in range(anzahl - 2):
+        start, ende = grenzen[i], grenzen[i + 1]
+        if i + 2 < len(grenzen):
+            nächster_start, nächstes_ende = grenzen[i + 1], grenzen[i + 2]
+            x_mittel = x[nächster_start:nächstes_ende].mean()
+            y_mittel = y[nächster_start:nächstes_ende].mean()
+        else:
+            x_mittel, y_mittel = x[n - 1], y[n - 1]
+        fläche = np.abs((x[a] - x_mittel) * (y[start:ende] - y[a]) - (x[a] - x[start:ende]) * (y_mittel - y[a]))
+        a = start + int(np.argmax(fläche))
+        indizes[i + 1] = a
+    return indizes
+
+
+def _kurven_indizes(x: np.ndarray, y: np.ndarray, anzahl: int) -> np.ndarray:
+    # LTTB je zusammenhängendem Abschnitt ohne NaN. Die Abschnittsgrenzen und die angrenzenden NaN-Zeilen werden
+    # übernommen, damit Lücken im Diagramm erhalten bleiben und nicht überbrückt werden.
+    gültig = np.isfinite(y)
+    if not gültig.any():
+        return np.empty(0, dtype=int)
+    wechsel = np.flatnonzero(np.diff(gültig.astype(np.int8))) + 1
+    abschnitte = np.split(np.arange(len(y)), wechsel)
+    anzahl_gültig = int(gültig.sum())
+
+    teile = []
+    for abschnitt in abschnitte:
+        if not gültig[abschnitt[0]]:
+            teile.append(abschnitt[[0, -1]])
+            continue
+        anteil = max(3, int(round(anzahl * len(abschnitt) / anzahl_gültig)))
+        teile.append(abschnitt[lttb_indizes(x[abschnitt], y[abschnitt], anteil)])
+    return np.unique(np.concatenate(teile))
+
+
+def reduce_chart_df(df: Optional[pd.DataFrame], x: str, y_spalten: Iterable[str], max_punkte: int = 1200,
+                    feste_x: Iterable[float] = ()) -> Optional[pd.DataFrame]:
+    """
+    Reduziert ein nach x sortiertes DataFrame für die Darstellung im Diagramm.
+
+    Jede Kurve erhält max_punkte / Anzahl Kurven Punkte (LTTB), das Ergebnis ist die Vereinigung der ausgewählten
+    Zeilen. Zusätzlich bleiben erhalten:
+    - die Rasterpunkte links und rechts der Umschaltpunkte aus df.attrs["regime"] (Datensätze mit F_st_links und
+      F_st_rechts, siehe calculate_sweep_f_st_dataframe mit mit_regime=True)
+    - die Werte an feste_x (z.B. F_st_20, F_st_80): Punkte auf dem Raster (bis auf Rundungsfehler) als Rasterzeile,
+      die übrigen als exakt interpolierte Zeilen
+
+    Args:
+        df: DataFrame mit der Spalte x und den Kurven y_spalten (None oder leer wird unverändert zurückgegeben)
+        x: Name der x-Spalte
+        y_spalten: Namen der Kurvenspalten
+        max_punkte: Richtwert für die Gesamtzahl Punkte (ohne feste Punkte)
+        feste_x: x-Werte, die exakt im Diagramm enthalten sein müssen (ungültige Werte werden ignoriert)
+
+    Returns:
+        Reduziertes DataFrame mit denselben Spalten, das Original bleibt unverändert
+    """
+    if df is None or df.empty or x not in df.columns:
+        return df
+    y_spalten = [spalte for spalte in y_spalten if spalte in df.columns]
+    x_werte = df[x].to_numpy(dtype=float)
+    n = len(x_werte)
+
+    feste = np.asarray([_als_float(wert) for wert in feste_x], dtype=float)
+    feste = feste[np.isfinite(feste) & (feste >= x_werte[0]) & (feste <= x_werte[-1])]
+    if n <= max_punkte and feste.size == 0:
+        return df
+
+    if n > max_punkte and y_spalten:
+        anzahl = max(3, max_punkte // len(y_spalten))
+        indizes = [np.array([0, n - 1])]
+        for spalte in y_spalten:
+            indizes.append(_kurven_indizes(x_werte, df[spalte].to_numpy(dtype=float), anzahl))
+    else:
+        indizes = [np.arange(n)]
+
+    # Rasterpunkte beidseits der Umschaltpunkte der Berechnungszweige
+    regime = df.attrs.get("regime") or ()
+    for spalte in ("F_st_links", "F_st_rechts"):
+        umschaltpunkte = np.asarray([datensatz[spalte] for datensatz in regime if spalte in datensatz], dtype=float)
+        if umschaltpunkte.size:
+            position = np.searchsorted(x_werte, umschaltpunkte)
+            indizes.append(np.clip(np.concatenate([position - 1, position]), 0, n - 1))
+
+    # Markierungspunkte auf dem Raster übernehmen die Rasterzeile. Die Toleranz (1e-9 der mittleren Schrittweite)
+    # erfasst Werte, die nur um Rundungsfehler vom Rasterwert abweichen (z.B. F_st_20 = 0.1 + k * 0.01).
+    if feste.size:
+        position = np.searchsorted(x_werte, feste)
+        links, rechts = np.clip(position - 1, 0, n - 1), np.clip(position, 0, n - 1)
+        nächste = np.where(np.abs(x_werte[links] - feste) <= np.abs(x_werte[rechts] - feste), links, rechts)
+        toleranz = 1e-9 * (x_werte[-1] - x_werte[0]) / max(n - 1, 1)
+        auf_raster = np.abs(x_werte[nächste] - feste) <= toleranz
+        indizes.append(nächste[auf_raster])
+        feste = feste[~auf_raster]
+
+    reduziert = df.iloc[np.unique(np.concatenate(indizes))]
+
+    # Übrige Markierungspunkte exakt interpoliert einfügen
+    if feste.size:
+        zusätzlich = interpolate_markers(df, x, [spalte for spalte in df.columns if spalte != x], feste)
+        reduziert = pd.concat([reduziert, zusätzlich[list(df.columns)]], ignore_index=True)
+        reduziert = reduziert.sort_values(x, kind="stable")
+
+    reduziert = reduziert.reset_index(drop=True)
+    reduziert.attrs = dict(df.attrs)
+    return reduziert
+
+
+def interpolate_markers(df: Optional[pd.DataFrame], x: str, y_spalten: Iterable[str],
+                        punkte: Iterable[float]) -> pd.DataFrame:
+    """
+    Interpoliert alle Kurven linear an beliebig vielen Betriebspunkten in einem Durchlauf.
+
+    Punkte ausserhalb des Wertebereichs oder ungültige Werte ergeben NaN. Liegt ein Punkt zwischen einem gültigen
+    Wert und NaN, ist der interpolierte Wert ebenfalls NaN. Punkte auf dem Raster ergeben exakt die Rasterwerte.
+
+    Args:
+        df: DataFrame mit der Spalte x und den Kurven y_spalten
+        x: Name der x-Spalte
+        y_spalten: Namen der Kurvenspalten
+        punkte: x-Werte der Betriebspunkte
+
+    Returns:
+        DataFrame mit einer Zeile pro Punkt: x, die interpolierten Kurvenwerte, "Maximum" (Umhüllende über alle
+        Kurven) und "Massgebend" (Name der Kurve mit dem Maximum oder None)
+    """
+    y_spalten = [spalte for spalte in y_spalten if df is not None and spalte in df.columns]
+    p = np.asarray([_als_float(wert) for wert in punkte], dtype=float)
+    werte = np.full((p.size, len(y_spalten)), np.nan)
+
+    if df is not None and not df.empty and x in df.columns and len(df) > 1 and y_spalten:
+        x_werte = df[x].to_numpy(dtype=float)
+        y_werte = df[y_spalten].to_numpy(dtype=float)
+        if np.any(np.diff(x_werte) < 0):
+            reihenfolge = np.argsort(x_werte, kind="stable")
+            x_werte, y_werte = x_werte[reihenfolge], y_werte[reihenfolge]
+
+        n = x_werte.size
+        im_bereich = np.isfinite(p) & (p >= x_werte[0]) & (p <= x_werte[-1])
+        rechts = np.clip(np.searchsorted(x_werte, np.where(im_bereich, p, x_werte[0]), side="right"), 1, n - 1)
+        links = rechts - 1
+        x_links, x_rechts = x_werte[links], x_werte[rechts]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            gewicht = np.where(x_rechts > x_links, (p - x_links) / (x_rechts - x_links), 0.0)[:, None]
+            interpoliert = y_werte[links] + gewicht * (y_werte[rechts] - y_werte[links])
+        # Exakte Rasterwerte am linken bzw. rechten Stützpunkt
+        interpoliert = np.where(gewicht == 0.0, y_werte[links], interpoliert)
+        interpoliert = np.where(gewicht == 1.0, y_werte[rechts], interpoliert)
+        werte[im_bereich] = interpoliert[im_bereich]
+
+    ergebnis = pd.DataFrame(werte, columns=y_spalten)
+    ergebnis.insert(0, x, p)
+    gültig = np.isfinite(werte).any(axis=1) if y_spalten else np.zeros(p.size, dtype=bool)
+    maximum = np.full(p.size, np.nan)
+    massgebend = np.full(p.size, None, dtype=object)
+    if gültig.any():
+        index = np.nanargmax(np.where(np.isfinite(werte[gültig]), werte[gültig], -np.inf), axis=1)
+        maximum[gültig] = werte[gültig][np.arange(index.size), index]
+        massgebend[gültig] = np.asarray(y_spalten, dtype=object)[index]
+    ergebnis["Maximum"] = maximum
+    ergebnis["Massgebend"] = massgebend
+    return ergebnis
+
+
+def build_marker_annotations(df: Optional[pd.DataFrame], x: str, y_spalten: Iterable[str],
+                             markierungen: dict[str, float | tuple[float, float]],
+                             namen: Optional[dict[str, str]] = None, einheit: str = "kN",
+                             farbe: str = "#444444") -> tuple[list[dict], list[dict]]:
+    """
+    Erstellt Plotly-Shapes und -Annotationen für Betriebspunkte und Toleranzbänder.
+
+    Betriebspunkte (Wert): senkrechte Hilfslinie bis zur Umhüllenden der Kurven und waagrechte Hilfslinie zur
+    y-Achse, die Annotation zeigt die Bezeichnung und beim Überfahren alle Kurvenwerte.
+    Toleranzbänder (Tupel x0, x1): hinterlegter Bereich bis zum Maximum der Umhüllenden innerhalb des Bandes.
+
+    Args:
+        df: DataFrame mit der Spalte x und den Kurven y_spalten
+        x: Name der x-Spalte
+        y_spalten: Namen der Kurvenspalten
+        markierungen: Bezeichnung -> x-Wert oder (x0, x1)
+        namen: Anzeigenamen der Kurven für die Hover-Texte (Standard: Spaltennamen)
+        einheit: Einheit der Kurvenwerte für die Hover-Texte
+        farbe: Linienfarbe der Hilfslinien
+
+    Returns:
+        (shapes, annotations) für das Plotly-Layout
+    """
+    y_spalten = [spalte for spalte in y_spalten if df is not None and spalte in df.columns]
+    namen = namen or {}
+    punkte = {bezeichnung: wert for bezeichnung, wert in markierungen.items() if not isinstance(wert, tuple)}
+    bänder = {bezeichnung: wert for bezeichnung, wert in markierungen.items() if isinstance(wert, tuple)}
+    shapes, annotations = [], []
+    linie = {"color": farbe, "width": 1, "dash": "dot"}
+
+    betriebspunkte = interpolate_markers(df, x, y_spalten, punkte.values())
+    x_punkte = betriebspunkte[x].to_numpy()
+    maxima = betriebspunkte["Maximum"].to_numpy()
+    kurvenwerte = betriebspunkte[y_spalten].to_numpy()
+    for bezeichnung, x_wert, y_top, werte in zip(punkte, x_punkte, maxima, kurvenwerte):
+        if not np.isfinite(y_top):
+            continue
+        shapes.append({"type": "line", "xref": "x", "yref": "y", "x0": x_wert, "x1": x_wert, "y0": 0, "y1": y_top,
+                       "line": linie})
+        shapes.append({"type": "line", "xref": "x", "yref": "y", "x0": 0, "x1": x_wert, "y0": y_top, "y1": y_top,
+                       "line": linie})
+        hover = [f"{bezeichnung}: {x} = {x_wert:.2f} {einheit}"]
+        hover += [f"{namen.get(spalte, spalte)} = {wert:.2f} {einheit}" for spalte, wert in zip(y_spalten, werte)
+                  if np.isfinite(wert)]
+        annotations.append({"x": x_wert, "y": y_top, "xref": "x", "yref": "y", "text": bezeichnung,
+                            "showarrow": True, "arrowhead": 0, "ax": 0, "ay": -25, "font": {"size": 12},
+                            "hovertext": "<br>".join(hover)})
+
+    if bänder and df is not None and not df.empty and x in df.columns:
+        x_werte = df[x].to_numpy(dtype=float)
+        umhüllende = df[y_spalten].to_numpy(dtype=float)
+        umhüllende = np.max(np.where(np.isfinite(umhüllende), umhüllende, -np.inf), axis=1, initial=-np.inf)
+        grenzen = interpolate_markers(df, x, y_spalten, [wert for band in bänder.values() for wert in band])
+        for i, (bezeichnung, (x0, x1)) in enumerate(bänder.items()):
+            x0, x1 = sorted((_als_float(x0), _als_float(x1)))
+            innen = umhüllende[(x_werte >= x0) & (x_werte <= x1)]
+            y_top = np.nanmax(np.concatenate([innen[np.isfinite(innen)],
+                                              grenzen["Maximum"].to_numpy()[2 * i:2 * i + 2], [np.nan]]))
+            if not np.isfinite(y_top):
+                continue
+            shapes.append({"type": "rect", "xref": "x", "yref": "y", "x0": x0, "x1": x1, "y0": 0, "y1": y_top,
+                           "fillcolor": farbe, "opacity": 0.1, "line": {"width": 0}, "layer": "below"})
+            annotations.append({"x": (x0 + x1) / 2, "y": y_top, "xref": "x", "yref": "y", "text": bezeichnung,
+                                "showarrow": False, "yshift": 10, "font": {"size": 12},
+                                "hovertext": f"{bezeichnung}: {x} = {x0:.2f} … {x1:.2f} {einheit}<br>"
+                                             f"Maximum = {y_top:.2f} {einheit}"})
+    return shapes, annotations
@@ -0,0 +1,115 @@
+"""
+Gemeinsamer, schreibgeschützter Leiterseilkatalog (Leiterseildaten.csv).
+
+Der Katalog wird einmal pro Prozess geladen und von allen Sitzungen, der Stapelverarbeitung und dem HTTP-Dienst
+gemeinsam verwendet. Die Sitzungen halten nur die Bezeichnung des ausgewählten Leiterseils, die Seildaten werden
+über einen Index nach Bezeichnung in O(1) nachgeschlagen.
+"""
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from src.utils import dataloader
+
+# Seildaten: Eingabefeld -> (Spalte der Leiterseildaten.csv, Faktor Katalogeinheit -> SI). Die Faktoren entsprechen
+# der Umrechnung in KurschlusskräfteLeiterseileInput.__post_init__.
+SEILDATEN_SPALTEN: dict[str, tuple[str, float]] = {
+    "d": ("Aussendurchmesser", 10 ** -3),
+    "A_s": ("Querschnitt eines Teilleiters", 10 ** -6),
+    "m_s": ("Massenbelag eines Teilleiters", 1.0),
+    "E": ("Elastizitätsmodul", 10 ** 6),
+    "c_th": ("Kurzzeitstromdichte", 1.0),
+}
+
+
+class Leiterseilkatalog:
+    """
+    Schreibgeschützter Leiterseilkatalog mit Index nach Bezeichnung.
+    Die zurückgegebenen DataFrames werden gemeinsam verwendet und dürfen nicht verändert werden.
+    """
+
+    def __init__(self, daten: pd.DataFrame):
+        self._daten = daten.reset_index(drop=True)
+        self._index: dict[str, int] = {}
+        for position, bezeichnung in enumerate(self._daten["Bezeichnung"]):
+            # Bei doppelten Bezeichnungen gilt wie bisher die erste Zeile
+            self._index.setdefault(str(bezeichnung), position)
+        self._bezeichnungen = tuple(self._index)
+        self._seildaten: dict[str, Mapping[str, float]] = {}
+        self._zeilen: dict[str, pd.DataFrame] = {}
+        self._vollständig: Optional[tuple[str, ...]] = None
+
+    def __contains__(self, bezeichnung: object) -> bool:
+        return bezeichnung in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def daten(self) -> pd.DataFrame:
+        """Gesamter Katalog (gemeinsam verwendet, nicht verändern)"""
+        return self._daten
+
+    @property
+    def bezeichnungen(self) -> list[str]:
+        """Bezeichnungen in der Reihenfolge der Leiterseildaten.csv (neue Liste, z.B. für Auswahllisten)"""
+        return list(self._bezeichnungen)
+
+    @property
+    def bezeichnungen_vollständig(self) -> tuple[str, ...]:
+        """Bezeichnungen der Leiterseile mit vollständigen, numerischen Seildaten (Reihenfolge der Leiterseildaten.csv)"""
+        if self._vollständig is None:
+            werte = [pd.to_numeric(self._daten[spalte], errors="coerce").to_numpy(dtype=float)
+                     for spalte, _ in SEILDATEN_SPALTEN.values()]
+            vollständig = ~np.any(np.isnan(werte), axis=0)
+            self._vollständig = tuple(bezeichnung for bezeichnung, position in self._index.items()
+                                      if vollständig[position])
+        return self._vollständig
+
+    def _position(self, bezeichnung: Optional[str]) -> int:
+        try:
+            return self._index[bezeichnung]
+        except KeyError:
+            raise ValueError(f"Leiterseiltyp '{bezeichnung}' ist in den Leiterseildaten nicht vorhanden.") from None
+
+    def seildaten(self, bezeichnung: Optional[str]) -> Mapping[str, float]:
+        """
+        Gibt die Seildaten d, A_s, m_s, E und c_th (Einheiten wie im Katalog) des Leiterseils zurück.
+
+        Raises:
+            ValueError: Wenn die Bezeichnung nicht im Katalog vorhanden ist
+        """
+        seildaten = self._seildaten.get(bezeichnung)
+        if seildaten is None:
+            position = self._position(bezeichnung)
+            seildaten = MappingProxyType({feld: float(self._daten.at[position, spalte])
+                                          for feld, (spalte, _) in SEILDATEN_SPALTEN.items()})
+            self._seildaten[bezeichnung] = seildaten
+        return seildaten
+
+    def seildaten_si(self, bezeichnung: Optional[str]) -> dict[str, float]:
+        """Gibt die Seildaten d, A_s, m_s, E und c_th des Leiterseils in SI-Einheiten zurück (siehe seildaten)"""
+        seildaten = self.seildaten(bezeichnung)
+        return {feld: seildaten[feld] * faktor for feld, (_, faktor) in SEILDATEN_SPALTEN.items()}
+
+    def zeile(self, bezeichnung: Optional[str]) -> pd.DataFrame:
+        """Gibt die Katalogzeile des Leiterseils als DataFrame mit einer Zeile zurück (gemeinsam verwendet)"""
+        zeile = self._zeilen.get(bezeichnung)
+        if zeile is None:
+            position = self._position(bezeichnung)
+            zeile = self._daten.iloc[position:position + 1]
+            self._zeilen[bezeichnung] = zeile
+        return zeile
+
+    def tabelle(self, bezeichnung: Optional[str] = None) -> pd.DataFrame:
+        """Gibt die Zeile des ausgewählten Leiterseils oder ohne (gültige) Auswahl den gesamten Katalog zurück"""
+        return self.zeile(bezeichnung) if bezeichnung in self._index else self._daten
+
+
+@lru_cache(maxsize=1)
+def get_leiterseilkatalog() -> Leiterseilkatalog:
+    """Gibt den prozessweiten Leiterseilkatalog zurück (einmal pro Prozess geladen)"""
+    return Leiterseilkatalog(dataloader.load_csv_to_df(dataloader.FILE_NAME_LEITERSEILDATEN))
@@ -3,7 +3,7 @@ from collections.abc import Sequence
 
 # Dateiliste für Error-Handling
 RELEVANT_FILES = ["kurzschlusskraefte_leiterseile_berechnungen.py", "kurzschlusskraefte_leiterseile_engine.py",
-                  "kurzschlussgroessen_berechnungen.py", "betriebsmittel.py",]
+                  "kurzschlusskraefte_leiterseile_berechnungen_vektorisiert.py", "kurzschlussgroessen_berechnungen.py", "betriebsmittel.py",]
 
 # Sonderformat für einzelne Dateien
 SPECIAL_FORMAT_FILES = {"kurzschlusskraefte_leiterseile_engine.py"}
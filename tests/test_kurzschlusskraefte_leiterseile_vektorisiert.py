@@ -0,0 +1,96 @@
+"""
+Vergleich des vektorisierten F_st-Sweeps (Fälle 1.1 und 3.1) mit der skalaren Berechnung select_and_run_calculation
+an den Beispielvorlagen in examples.
+"""
+import copy
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.utils import dataloader
+from src.engines.kurzschlusskraefte_leiterseile_batch import load_input_from_excel
+from src.engines.kurzschlusskraefte_leiterseile_engine import (
+    KurschlusskräfteLeiterseileInput,
+    KurschlusskräfteLeiterseileMediator,
+)
+
+BEISPIELE = sorted(Path(dataloader.get_project_root(), "examples").glob("*.xlsx"))
+
+# F_st-Werte in kN und zulässige relative Abweichung zwischen vektorisiertem und skalarem Pfad
+F_ST_WERTE = np.linspace(0.1, 35.0, 25)
+RTOL = 1e-9
+
+KRÄFTE = ("F_td", "F_fd", "F_pi_d")
+
+
+def _mit(inputs: KurschlusskräfteLeiterseileInput, **werte) -> KurschlusskräfteLeiterseileInput:
+    # Kopie mit geänderten Werten in SI-Einheiten (__post_init__ wird nicht erneut durchlaufen)
+    inputs = copy.copy(inputs)
+    for name, wert in werte.items():
+        setattr(inputs, name, wert)
+    return inputs
+
+
+def _skalar(inputs: KurschlusskräfteLeiterseileInput, f_st: float):
+    # Skalare Berechnung des Lastfalls F_st_20 mit F_st in kN
+    mediator = KurschlusskräfteLeiterseileMediator(_mit(inputs, F_st_20=f_st * 10 ** 3))
+    return mediator.select_and_run_calculation()["F_st_20"]
+
+
+def _vergleichen(inputs: KurschlusskräfteLeiterseileInput, f_st_werte: np.ndarray):
+    mediator = KurschlusskräfteLeiterseileMediator(inputs)
+    assert mediator._calculation_key() in mediator._sweep_matrix
+    vektorisiert = mediator._sweep_arrays(f_st_werte)
+
+    skalar = {spalte: np.full(f_st_werte.shape, np.nan) for spalte in KRÄFTE}
+    j_werte = []
+    for i, f_st in enumerate(f_st_werte):
+        ergebnis = _skalar(inputs, float(f_st))
+        j_werte.append(getattr(ergebnis, "j", None))
+        for spalte in KRÄFTE:
+            wert = getattr(ergebnis, spalte)
+            assert not isinstance(wert, complex), f"{spalte} bei F_st = {f_st} kN ist komplex"
+            if wert is not None:
+                skalar[spalte][i] = wert
+
+    for spalte in KRÄFTE:
+        np.testing.assert_allclose(vektorisiert[spalte], skalar[spalte], rtol=RTOL, equal_nan=True,
+                                   err_msg=spalte)
+    return j_werte
+
+
+@pytest.mark.parametrize("vorlage", BEISPIELE, ids=lambda vorlage: vorlage.stem)
+def test_sweep_entspricht_skalarer_berechnung(vorlage: Path):
+    _vergleichen(load_input_from_excel(vorlage), F_ST_WERTE)
+
+
+@pytest.mark.parametrize("I_k, a_s", [(2.0, 0.1), (5.0, 0.4)])
+def test_sweep_entspricht_skalarer_berechnung_beidseits_j_1(I_k: float, a_s: float):
+    # Bündelleiter mit j >= 1 (ξ, Gleichung A.9) und j < 1 (η, Gleichung A.10) im selben F_st-Bereich
+    inputs = _mit(load_input_from_excel(Path(dataloader.get_project_root(), "examples", "Riet.xlsx")),
+                  standardkurzschlussstroeme=I_k * 10 ** 3, a_s=a_s)
+    j_werte = _vergleichen(inputs, F_ST_WERTE)
+    assert min(j_werte) < 1 <= max(j_werte)
+
+
+def test_sweep_komplexes_F_pi_d_ergibt_nan():
+    # Ist der Radikand von ν_e (Gleichung 60, 63) negativ, liefert die skalare Berechnung ein komplexes F_pi_d.
+    # Der vektorisierte Pfad gibt dafür bewusst NaN zurück, F_td und F_fd bleiben unverändert.
+    inputs = _mit(load_input_from_excel(Path(dataloader.get_project_root(), "examples", "Riet.xlsx")),
+                  standardkurzschlussstroeme=63.0 * 10 ** 3, a_s=1.5)
+    f_st_werte = np.array([0.5, 1.0, 5.0])
+    vektorisiert = KurschlusskräfteLeiterseileMediator(inputs)._sweep_arrays(f_st_werte)
+
+    for i, f_st in enumerate(f_st_werte):
+        ergebnis = _skalar(inputs, float(f_st))
+        for spalte in ("F_td", "F_fd"):
+            assert vektorisiert[spalte][i] == pytest.approx(getattr(ergebnis, spalte), rel=RTOL)
+        if isinstance(ergebnis.F_pi_d, complex):
+            assert ergebnis.F_pi_d.imag != 0
+            assert np.isnan(vektorisiert["F_pi_d"][i])
+        else:
+            assert vektorisiert["F_pi_d"][i] == pytest.approx(ergebnis.F_pi_d, rel=RTOL)
+
+    # F_st = 0.5 und 1 kN ergeben ein komplexes, F_st = 5 kN ein reelles F_pi_d
+    assert np.isnan(vektorisiert["F_pi_d"][:2]).all() and np.isfinite(vektorisiert["F_pi_d"][2])